@@ -37,7 +37,6 @@ import dtale.global_state as global_state
 import dtale.config as dtale_config
 from dtale import dtale
 from dtale.cli.clickutils import retrieve_version, setup_logging
-from dtale.dash_application import views as dash_views
 from dtale.utils import (
     DuplicateDataError,
     build_shutdown_url,
@@ -531,6 +530,9 @@ def build_app(
 
     auth.setup_auth(app)
 
+    # dash (& plotly) are only loaded once an app is actually being built
+    from dtale.dash_application import views as dash_views
+
     with app.app_context():
         app = dash_views.add_dash(app)
         return app
@@ -735,6 +737,9 @@ def show(data=None, data_loader=None, name=None, context_vars=None, **options):
     :type enable_custom_filters: bool, optional
     :param enable_web_uploads: If true, this will enable users to upload files using URLs from the UI
     :type enable_web_uploads: bool, optional
+    :param profile_workers: number of threads to use when calculating the statistics for each column on startup. If
+                            not specified then columns will be profiled one at a time
+    :type profile_workers: int, optional
 
     :Example:
 
@@ -838,6 +843,7 @@ def show(data=None, data_loader=None, name=None, context_vars=None, **options):
             enable_web_uploads=final_options.get("enable_web_uploads"),
             main_title=final_options.get("main_title"),
             main_title_font=final_options.get("main_title_font"),
+            profile_workers=final_options.get("profile_workers"),
         )
         instance.started_with_open_browser = final_options["open_browser"]
         is_active = not running_with_flask_debug() and is_up(app_url)
@@ -17,6 +17,7 @@ from dtale.utils import (
     find_dtype_formatter,
     flatten_lists,
     get_dtypes,
+    json_date,
     json_int,
     make_list,
     triple_quote,
@@ -28,6 +29,8 @@ NON_EXT_AGGREGATION = ZAXIS_CHARTS + ["treemap", "maps"]
 ANIMATION_CHARTS = ["line"]
 ANIMATE_BY_CHARTS = ["bar", "3d_scatter", "heatmap", "maps", "histogram"]
 MAX_GROUPS = 30
+DENSITY_BINS = 200
+MAX_DENSITY_BINS = 1000
 MAPBOX_TOKEN = None
 AGGS = dict(
     raw="No Aggregation",
@@ -428,6 +431,216 @@ def check_exceptions(
         raise ChartBuildingError(limit_msg.format(data_limit))
 
 
+def _numeric_values(s):
+    classifier = classify_type(find_dtype(s))
+    if classifier == "D":
+        return (
+            pd.to_datetime(s)
+            .values.astype("datetime64[ns]")
+            .view("int64")
+            .astype("float64")
+        )
+    if classifier in ["I", "F"]:
+        return s.values.astype("float64")
+    return None
+
+
+def lttb_positions(x, y, threshold):
+    """
+    Largest-Triangle-Three-Buckets downsampling.  Splits the points (which must be sorted by x) into `threshold - 2`
+    buckets and from each bucket picks the point forming the largest triangle with the point picked from the
+    previous bucket and the average of the next bucket.  This preserves the visual shape of a line far better than
+    taking every nth point.
+
+    :param x: x-axis values sorted in ascending order
+    :type x: :class:`numpy:numpy.ndarray`
+    :param y: y-axis values
+    :type y: :class:`numpy:numpy.ndarray`
+    :param threshold: number of points to keep
+    :type threshold: int
+    :return: positions of the points to keep
+    :rtype: :class:`numpy:numpy.ndarray`
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    every = (n - 2) / float(threshold - 2)
+    selected = np.empty(threshold, dtype="int64")
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end = int(i * every) + 1, int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x, avg_y = x[end:next_end].mean(), y[end:next_end].mean()
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def minmax_positions(x, y, buckets):
+    """
+    Min/max decimation.  Splits the x-axis into equal width buckets (EX: one per pixel) and keeps the points with
+    the minimum & maximum y-value within each bucket so the outline of a dense scatter is preserved.
+
+    :param x: x-axis values
+    :type x: :class:`numpy:numpy.ndarray`
+    :param y: y-axis values
+    :type y: :class:`numpy:numpy.ndarray`
+    :param buckets: number of buckets to split the x-axis into
+    :type buckets: int
+    :return: sorted positions of the points to keep
+    :rtype: :class:`numpy:numpy.ndarray`
+    """
+    if not len(x):
+        return np.arange(0)
+    x_min, x_max = x.min(), x.max()
+    if x_max > x_min:
+        bins = ((x - x_min) / (x_max - x_min) * buckets).astype("int64")
+        bins = np.minimum(bins, buckets - 1)
+    else:
+        bins = np.zeros(len(x), dtype="int64")
+    order = np.lexsort((y, bins))
+    boundaries = np.flatnonzero(np.diff(bins[order])) + 1
+    firsts = np.concatenate([[0], boundaries])
+    lasts = np.concatenate([boundaries - 1, [len(order) - 1]])
+    return np.unique(np.concatenate([order[firsts], order[lasts]]))
+
+
+def downsample(df, x, y, width, method="lttb"):
+    """
+    Reduces the number of points in a chart's data to what can be displayed within `width` pixels.  Line charts use
+    :meth:`dtale.charts.utils.lttb_positions` and scatter charts use :meth:`dtale.charts.utils.minmax_positions`.
+    When there are multiple y-axis columns the points picked for each of them are combined.  Data with a
+    non-numeric x-axis is left untouched as are scatters which don't exceed the "scatter_points" chart setting.
+
+    :param df: chart data (sorted by x when using "lttb")
+    :type df: :class:`pandas:pandas.DataFrame`
+    :param x: column used for the x-axis
+    :type x: str
+    :param y: columns used for the y-axis
+    :type y: list of str
+    :param width: pixel width of the chart
+    :type width: int
+    :param method: "lttb" or "minmax"
+    :type method: str, optional
+    :return: downsampled dataframe
+    :rtype: :class:`pandas:pandas.DataFrame`
+    """
+    if not width:
+        return df
+    max_points = width
+    if method != "lttb":
+        max_points = max(width * 2, global_state.get_chart_settings()["scatter_points"])
+    if len(df) <= max_points:
+        return df
+    x_vals = _numeric_values(df[x])
+    if x_vals is None:
+        return df
+    positions = []
+    for col in make_list(y):
+        y_vals = _numeric_values(df[col])
+        if y_vals is None:
+            continue
+        if method == "lttb":
+            positions.append(lttb_positions(x_vals, y_vals, width))
+        else:
+            positions.append(minmax_positions(x_vals, y_vals, width))
+    if not len(positions):
+        return df
+    return df.iloc[np.unique(np.concatenate(positions))]
+
+
+def _density_range(s, vals, rng):
+    if rng is None or rng[0] is None or rng[1] is None:
+        return float(np.nanmin(vals)), float(np.nanmax(vals))
+    if classify_type(find_dtype(s)) == "D":
+        return tuple(float(pd.Timestamp(v).value) for v in rng)
+    return tuple(float(v) for v in rng)
+
+
+def build_density_data(df, x, y, z=None, bins=DENSITY_BINS, x_range=None, y_range=None):
+    """
+    Rasterizes the points of a scatter into a `bins` x `bins` grid so that the density of any number of points can be
+    rendered as a heatmap.  Each point is assigned to a cell and the cells are tallied using
+    :func:`numpy:numpy.bincount`.  If a z-axis column is specified (3D scatters) each cell holds the mean of the
+    z-values of its points rather than the number of points.  Specifying ranges allows for the visible portion of a
+    zoomed chart to be re-binned at full resolution.
+
+    :param df: dataframe
+    :type df: :class:`pandas:pandas.DataFrame`
+    :param x: column to use for the x-axis
+    :type x: str
+    :param y: column to use for the y-axis
+    :type y: str
+    :param z: column to use for the z-axis
+    :type z: str, optional
+    :param bins: number of bins along each axis, clamped to between 1 and `MAX_DENSITY_BINS`
+    :type bins: int, optional
+    :param x_range: [min, max] of the x-axis to rasterize, defaults to the full range of the data
+    :type x_range: list, optional
+    :param y_range: [min, max] of the y-axis to rasterize, defaults to the full range of the data
+    :type y_range: list, optional
+    :return: dict of bin centers for x & y, grid of values for z (one row per y-bin) and the ranges used
+    :rtype: dict
+    """
+    bins = min(max(int(bins or DENSITY_BINS), 1), MAX_DENSITY_BINS)
+    cols = [c for c in [x, y, z] if c is not None]
+    data = df[cols].dropna()
+    x_vals, y_vals = _numeric_values(data[x]), _numeric_values(data[y])
+    if x_vals is None or y_vals is None:
+        raise ChartBuildingError(
+            "Density charts can only be built from numeric or date columns"
+        )
+    if not len(data):
+        raise ChartBuildingError("No data returned for this computation!")
+    (x0, x1), (y0, y1) = (
+        _density_range(data[x], x_vals, x_range),
+        _density_range(data[y], y_vals, y_range),
+    )
+
+    def _bin(vals, lower, upper):
+        width = (upper - lower) or 1.0
+        idx = np.floor((vals - lower) / width * bins).astype("int64")
+        # values equal to the upper bound fall into the last bin like they would using numpy.histogram2d
+        idx[vals == upper] = bins - 1
+        return idx
+
+    x_idx, y_idx = _bin(x_vals, x0, x1), _bin(y_vals, y0, y1)
+    visible = (x_idx >= 0) & (x_idx < bins) & (y_idx >= 0) & (y_idx < bins)
+    cells = y_idx[visible] * bins + x_idx[visible]
+    counts = np.bincount(cells, minlength=bins * bins).reshape(bins, bins)
+    if z is not None:
+        sums = np.bincount(
+            cells, weights=_numeric_values(data[z])[visible], minlength=bins * bins
+        ).reshape(bins, bins)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            grid = np.where(counts > 0, sums / counts, np.nan)
+    else:
+        grid = counts.astype("float64")
+        grid[counts == 0] = np.nan  # empty cells are left transparent
+
+    def _centers(s, lower, upper):
+        step = (upper - lower) / float(bins)
+        centers = lower + step * (np.arange(bins) + 0.5)
+        if classify_type(find_dtype(s)) == "D":
+            return [json_date(pd.Timestamp(int(c))) for c in centers]
+        return centers.tolist()
+
+    return dict(
+        x=_centers(data[x], x0, x1),
+        y=_centers(data[y], y0, y1),
+        z=[[None if np.isnan(v) else v for v in row] for row in grid.tolist()],
+        x_range=[x0, x1],
+        y_range=[y0, y1],
+        bins=bins,
+        points=int(visible.sum()),
+    )
+
+
 def build_aggs(y, z=None, agg=None, extended_aggregation=[]):
     z_exists = len(make_list(z))
     agg_cols = make_list(y)
@@ -710,6 +923,8 @@ def build_base_chart(
     animate_by=None,
     cleaners=[],
     dropna=True,
+    downsample_width=None,
+    downsample_method="lttb",
     **kwargs
 ):
     """
@@ -736,6 +951,10 @@ def build_base_chart(
     :type agg: list, optional
     :param allow_duplicates: flag to allow duplicates to be ignored (usually for scatter plots)
     :type allow_duplicates: bool, optional
+    :param downsample_width: if specified, the pixel width the data of each series will be downsampled to
+    :type downsample_width: int, optional
+    :param downsample_method: method of downsampling, "lttb" (line charts) or "minmax" (scatter charts)
+    :type downsample_method: str, optional
     :return: dict
     """
     group_fmt_overrides = {
@@ -930,6 +1149,10 @@ def build_base_chart(
                     final_group_label.append(gl)
                 group_filter = " and ".join(final_group_filter)
                 group_label = "({})".format(", ".join(final_group_label))
+                if animate_by is None and not is_z:
+                    grp = downsample(
+                        grp, x_col, final_cols, downsample_width, downsample_method
+                    )
                 data = data_f.format_lists(grp)
                 data["_filter_"] = group_filter
                 yield group_label, data
@@ -994,6 +1217,16 @@ def build_base_chart(
         return data.rename(columns={x_col: x})
     code.append("chart_data = chart_data.dropna()")
 
+    if animate_by is None and not is_z:
+        total = len(data)
+        data = downsample(data, x_col, final_cols, downsample_width, downsample_method)
+        if len(data) < total:
+            code.append(
+                "# {:,} of {:,} points were displayed after downsampling ({})".format(
+                    len(data), total, downsample_method
+                )
+            )
+
     dupe_cols = main_group + y_group_cols
     data_limit = global_state.get_chart_settings()[
         "3d_points" if is_z or animate_by is not None else "scatter_points"
@@ -1064,4 +1297,4 @@ def find_group_vals(df, group_cols):
     group_vals, _ = retrieve_chart_data(df, group_cols)
     group_vals = group_vals.drop_duplicates().sort_values(group_cols)
     group_f, _ = build_formatters(group_vals, nan_display="NaN")
-    return group_f.format_dicts(group_vals.itertuples())
+    return group_f.format_dicts(group_vals)
@@ -1,7 +1,6 @@
-import pandas as pd
-
 from dtale.app import show
 from dtale.cli.clickutils import get_loader_options, handle_path, loader_prop_keys
+from dtale.ingestion import read_csv
 
 """
   IMPORTANT!!! These global variables are required for building any customized CLI loader.
@@ -17,6 +16,12 @@ LOADER_PROPS = [
     ),
     dict(name="index_col", help="Column(s) to use as the row labels or the Datafame"),
     dict(name="delimiter", help="Delimiter to use (comma, tab, etc...)"),
+    dict(name="chunksize", help="Number of rows to parse at a time"),
+    dict(
+        name="downcast",
+        help="Downcast numeric columns to the smallest dtypes which can hold their values",
+        is_flag=True,
+    ),
 ]
 
 
@@ -27,7 +32,7 @@ def show_loader(**kwargs):
 
 def loader_func(**kwargs):
     path = handle_path(kwargs.pop("path"), kwargs)
-    return pd.read_csv(
+    return read_csv(
         path, **{k: v for k, v in kwargs.items() if k in loader_prop_keys(LOADER_PROPS)}
     )
 
@@ -46,7 +51,8 @@ def find_loader(kwargs):
 
         def _csv_loader():
             csv_arg_parsers = {  # TODO: add additional arg parsers
-                "parse_dates": lambda v: v.split(",") if v else None
+                "parse_dates": lambda v: v.split(",") if v else None,
+                "chunksize": lambda v: int(v) if v else None,
             }
             kwargs = {
                 k: csv_arg_parsers.get(k, lambda v: v)(v) for k, v in csv_opts.items()
@@ -1,7 +1,6 @@
-import pandas as pd
-
 from dtale.app import show
 from dtale.cli.clickutils import get_loader_options, loader_prop_keys
+from dtale.ingestion import read_parquet
 
 """
   IMPORTANT!!! These global variables are required for building any customized CLI loader.
@@ -11,6 +10,11 @@ LOADER_KEY = "parquet"
 LOADER_PROPS = [
     dict(name="path", help="path to parquet file or URL to parquet endpoint"),
     dict(name="engine", help="parquet library to use"),
+    dict(
+        name="downcast",
+        help="Downcast numeric columns to the smallest dtypes which can hold their values",
+        is_flag=True,
+    ),
 ]
 
 
@@ -31,7 +35,7 @@ def loader_func(**kwargs):
             )
 
     path = kwargs.pop("path")
-    return pd.read_parquet(
+    return read_parquet(
         path, **{k: v for k, v in kwargs.items() if k in loader_prop_keys(LOADER_PROPS)}
     )
 
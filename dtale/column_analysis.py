@@ -1,16 +1,14 @@
 import numpy as np
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objs as go
 import pprint
-import scipy.stats as sts
 import time
 
 import dtale.global_state as global_state
 import dtale.pandas_util as pandas_util
 
 from dtale.code_export import build_code_export, build_final_chart_code
-from dtale.column_builders import clean, clean_code
+from dtale.column_builders import clean_all, clean_code
 from dtale.describe import load_describe
 from dtale.query import build_query, load_filterable_data
 from dtale.utils import (
@@ -27,6 +25,7 @@ from dtale.utils import (
     json_float,
     json_timestamp,
     make_list,
+    transform_unique,
 )
 
 LINE_CFG = "line={'shape': 'spline', 'smoothing': 0.3}, mode='lines'"
@@ -57,13 +56,17 @@ def pctsum_updates(df, group, ret_col):
 def handle_cleaners(s, cleaners):
     cleaner_code = []
     if cleaners:
-        for cleaner in cleaners.split(","):
-            s = clean(s, cleaner, {})
+        cleaners = cleaners.split(",")
+        # cleaners map each value independently so they only need to be run over the distinct values
+        s = transform_unique(s, lambda u: clean_all(u, cleaners, {}))
+        for cleaner in cleaners:
             cleaner_code += clean_code(cleaner, {})
     return s, cleaner_code
 
 
 def build_kde(s, hist_labels, selected_col):
+    import scipy.stats as sts
+
     try:
         kde = sts.gaussian_kde(s)
         kde_data = kde.pdf(hist_labels)
@@ -627,6 +630,9 @@ class GeolocationAnalysis(object):
 
 class QQAnalysis(object):
     def build(self, parent):
+        import plotly.express as px
+        import scipy.stats as sts
+
         s = parent.data[parent.selected_col]
         if parent.classifier == "D":
             s = apply(s, json_timestamp)
@@ -8,18 +8,112 @@ import unicodedata
 
 import numpy as np
 import pandas as pd
-from scipy.stats import mstats
 from strsimpy.jaro_winkler import JaroWinkler
 
 import dtale.global_state as global_state
+import dtale.jobs as jobs
 import dtale.pandas_util as pandas_util
+from dtale.query import load_sort_positions
 from dtale.translations import text
-from dtale.utils import classify_type, apply, find_dtype_formatter
+from dtale.utils import (
+    apply,
+    apply_unique,
+    build_process_pool,
+    classify_type,
+    find_dtype_formatter,
+    get_pool_workers,
+    transform_unique,
+)
+
+PARALLEL_MIN_ROWS = 100000  # builders only spread their work over processes once it covers this many rows
+PARALLEL_CHUNKS_PER_WORKER = 4
+NLTK_RESOURCES_LOADED = False
+
+
+def load_nltk_resources():
+    "Downloads the resources used by the 'nltk_stopwords' cleaner, this only happens once per process"
+    global NLTK_RESOURCES_LOADED
+
+    if not NLTK_RESOURCES_LOADED:
+        import nltk
+
+        nltk.download("stopwords")
+        nltk.download("punkt")
+        NLTK_RESOURCES_LOADED = True
+
+
+def _init_builder_worker(nltk_resources_loaded):
+    """
+    Reseeds the random number generators of a worker process so each one doesn't repeat the values of its parent and
+    lets it know whether its parent has already downloaded the nltk resources so it doesn't download them again.
+    """
+    global NLTK_RESOURCES_LOADED
+
+    random.seed()
+    np.random.seed()
+    NLTK_RESOURCES_LOADED = nltk_resources_loaded
+
+
+def _build_chunk(args):
+    "Builds the column for a chunk of rows within a worker process"
+    builder, chunk = args
+    return builder.build_column(chunk)
+
+
+def build_in_processes(builder, data, workers):
+    """
+    Splits the rows of a dataframe into chunks, builds the column for each of them in a pool of processes and
+    concatenates the outputs back together in the order of the rows.  The progress of the build is reported (see
+    :meth:`dtale.jobs.update_progress`) as each chunk completes.  This is only correct for builders which calculate
+    the value of each row from that row alone.
+
+    :param builder: builder which will be pickled & sent along with each chunk to the worker processes
+    :param data: dataframe
+    :type data: :class:`pandas:pandas.DataFrame`
+    :param workers: number of processes
+    :type workers: int
+    :rtype: :class:`pandas:pandas.Series`
+    """
+    chunk_size = int(np.ceil(len(data) / float(workers * PARALLEL_CHUNKS_PER_WORKER)))
+    chunks = [
+        data.iloc[start : start + chunk_size]
+        for start in range(0, len(data), max(chunk_size, 1))
+    ]
+    pool = build_process_pool(
+        workers, initializer=_init_builder_worker, initargs=(NLTK_RESOURCES_LOADED,)
+    )
+    try:
+        outputs = []
+        for output in pool.imap(_build_chunk, ((builder, chunk) for chunk in chunks)):
+            outputs.append(output)
+            jobs.update_progress(
+                len(outputs) / float(len(chunks)),
+                "Built {} of {} chunks".format(len(outputs), len(chunks)),
+            )
+        return pd.concat(outputs)
+    finally:
+        pool.terminate()
+        pool.join()
 
 
 class ColumnBuilder(object):
-    def __init__(self, data_id, column_type, name, cfg):
+    """
+    Builds a new column for the data associated with `data_id`.  Expensive builders which calculate each row from
+    that row alone (string similarities, NLTK stop word cleaning & random strings) expose the columns they read from
+    using a `parallel_columns` method.  When parallel builds have been enabled (using the "column_builder_workers" app
+    setting) and they have at least `PARALLEL_MIN_ROWS` distinct rows to process their work is spread over a pool of
+    processes using :meth:`dtale.column_builders.build_in_processes`.
+
+    :param workers: number of processes to use for parallel builds, defaults to the "column_builder_workers" app
+                    setting and is capped at the number of CPUs
+    :type workers: int, optional
+    """
+
+    def __init__(self, data_id, column_type, name, cfg, workers=None):
         self.data_id = data_id
+        if workers is None:
+            workers = global_state.get_app_settings().get("column_builder_workers")
+        self.workers = get_pool_workers(workers)
         if column_type == "numeric":
             self.builder = NumericColumnBuilder(name, cfg)
         elif column_type == "string":
@@ -75,7 +169,37 @@ class ColumnBuilder(object):
 
     def build_column(self):
         data = global_state.get_data(self.data_id)
-        return self.builder.build_column(data)
+        if getattr(self.builder, "sequential", False):
+            # builders whose values depend on the rows before them follow the sort applied from the grid, their output
+            # is then put back in the order of the stored data
+            sort_positions = load_sort_positions(
+                self.data_id,
+                (global_state.get_settings(self.data_id) or {}).get("sortInfo"),
+            )
+            if sort_positions is not None:
+                output = self.builder.build_column(data.iloc[sort_positions])
+                return output.iloc[np.argsort(sort_positions)]
+        parallel_columns = getattr(self.builder, "parallel_columns", lambda: None)()
+        if (
+            parallel_columns is None
+            or self.workers is None
+            or len(data) < PARALLEL_MIN_ROWS
+        ):
+            return self.builder.build_column(data)
+        # anything the workers share is loaded once up front rather than within each of them
+        getattr(self.builder, "load_resources", lambda: None)()
+        if (
+            not parallel_columns
+        ):  # the builder only needs the number of rows & the index
+            return build_in_processes(self.builder, data[[]], self.workers)
+
+        def _build(uniques):
+            if len(uniques) < PARALLEL_MIN_ROWS:
+                return self.builder.build_column(uniques)
+            return build_in_processes(self.builder, uniques, self.workers)
+
+        # rows are deduplicated before being split up so each distinct row is only built once
+        return transform_unique(data[sorted(set(parallel_columns))], _build)
 
     def build_code(self):
         return self.builder.build_code()
@@ -349,6 +473,10 @@ class RandomColumnBuilder(object):
         self.name = name
         self.cfg = cfg
 
+    def parallel_columns(self):
+        # random strings are generated one row at a time, every other type is vectorized by numpy
+        return [] if self.cfg["type"] == "string" else None
+
     def build_column(self, data):
         rand_type = self.cfg["type"]
         if "string" == rand_type:
@@ -826,6 +954,8 @@ class WinsorizeColumnBuilder(object):
         self.cfg = cfg
 
     def build_column(self, data):
+        from scipy.stats import mstats
+
         group, col, limits, inclusive = (
             self.cfg.get(p) for p in ["group", "col", "limits", "inclusive"]
         )
@@ -930,6 +1060,9 @@ class SimilarityColumnBuilder(object):
         self.name = name
         self.cfg = cfg
 
+    def parallel_columns(self):
+        return [self.cfg.get("left"), self.cfg.get("right")]
+
     def build_column(self, data):
         left_col, right_col, algo = (self.cfg.get(p) for p in ["left", "right", "algo"])
         normalized = self.cfg.get("normalized", False)
@@ -948,10 +1081,9 @@ class SimilarityColumnBuilder(object):
             similarity = strsimpy.jaccard.Jaccard(int(self.cfg.get("k", 3)))
             if normalized:
                 similarity = SimilarityNormalizeWrapper(similarity)
-        distances = apply(
-            data[[left_col, right_col]].fillna(""),
-            lambda rec: similarity.distance(*rec),
-            axis=1,
+        # the distance is only computed once for each distinct pair of strings
+        distances = apply_unique(
+            data[[left_col, right_col]].fillna(""), similarity.distance
         )
         return pd.Series(distances, index=data.index, name=self.name)
 
@@ -1193,6 +1325,12 @@ def get_cleaner_configs():
     ]
 
 
+def clean_all(s, cleaners, cfg):
+    for cleaner in cleaners:
+        s = clean(s, cleaner, cfg)
+    return s
+
+
 def clean(s, cleaner, cfg):
     replace_kwargs = {}
     if pandas_util.is_pandas2():
@@ -1218,8 +1356,7 @@ def clean(s, cleaner, cfg):
         try:
             import nltk
 
-            nltk.download("stopwords")
-            nltk.download("punkt")
+            load_nltk_resources()
 
             nltk_stopwords_set = set(nltk.corpus.stopwords.words(language))
 
@@ -1398,12 +1535,22 @@ class CleaningColumnBuilder(object):
         self.name = name
         self.cfg = cfg
 
+    def parallel_columns(self):
+        # the other cleaners are vectorized or cheap enough that they aren't worth the overhead of processes
+        if "nltk_stopwords" in (self.cfg.get("cleaners") or []):
+            return [self.cfg.get("col")]
+        return None
+
+    def load_resources(self):
+        if "nltk_stopwords" in (self.cfg.get("cleaners") or []):
+            try:
+                load_nltk_resources()
+            except ImportError:
+                pass  # the cleaner itself will raise a more helpful error
+
     def build_column(self, data):
         col, cleaners = (self.cfg.get(p) for p in ["col", "cleaners"])
-        s = data[col]
-        for cleaner in cleaners:
-            s = clean(s, cleaner, self.cfg)
-        return s
+        return transform_unique(data[col], lambda s: clean_all(s, cleaners, self.cfg))
 
     def build_code(self):
         col, cleaners = (self.cfg.get(p) for p in ["col", "cleaners"])
@@ -1419,6 +1566,8 @@ class CleaningColumnBuilder(object):
 
 
 class DiffColumnBuilder(object):
+    sequential = True
+
     def __init__(self, name, cfg):
         self.name = name
         self.cfg = cfg
@@ -1435,6 +1584,8 @@ class DiffColumnBuilder(object):
 
 
 class TimeseriesDataSlopeBuilder(object):
+    sequential = True
+
     def __init__(self, name, cfg):
         self.name = name
         self.cfg = cfg
@@ -1459,6 +1610,8 @@ class TimeseriesDataSlopeBuilder(object):
 
 
 class RollingBuilder(object):
+    sequential = True
+
     def __init__(self, name, cfg):
         self.name = name
         self.cfg = cfg
@@ -1531,6 +1684,8 @@ class RollingBuilder(object):
 
 
 class ExponentialSmoothingBuilder(object):
+    sequential = True
+
     def __init__(self, name, cfg):
         self.name = name
         self.cfg = cfg
@@ -1560,6 +1715,8 @@ class ExponentialSmoothingBuilder(object):
 
 
 class CumsumColumnBuilder(object):
+    sequential = True
+
     def __init__(self, name, cfg):
         self.name = name
         self.cfg = cfg
@@ -1595,6 +1752,8 @@ class CumsumColumnBuilder(object):
 
 
 class ShiftBuilder(object):
+    sequential = True
+
     def __init__(self, name, cfg):
         self.name = name
         self.cfg = cfg
@@ -1629,6 +1788,8 @@ class ShiftBuilder(object):
 
 
 class ExpandingBuilder(object):
+    sequential = True
+
     def __init__(self, name, cfg):
         self.name = name
         self.cfg = cfg
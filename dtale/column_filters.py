@@ -611,3 +611,126 @@ class DateFilter(MissingOrPopulatedFilter):
         return super(DateFilter, self).update_missing_or_populated_query_builder(
             query_builder, fltr.get("query")
         )
+
+
+def _parse_number(val):
+    if isinstance(val, string_types):
+        val = val.strip()
+        try:
+            return int(val)
+        except ValueError:
+            return float(val)
+    return val
+
+
+def _compile_string_filter(s, fltr):
+    if fltr.get("meta", {}).get("classification") != "S":
+        return None
+    action = fltr.get("action", "equals")
+    operand = fltr.get("operand", "=")
+    case_sensitive = fltr.get("caseSensitive", False)
+    raw = fltr.get("raw")
+    if action == "equals":
+        mask = s.isin(fltr.get("value") or [])
+    elif action in ["startswith", "endswith"]:
+        if not case_sensitive:
+            s, raw = s.str.lower(), raw.lower()
+        mask = getattr(s.str, action)(raw, na=False)
+    elif action in ["contains", "regex"]:
+        mask = s.str.contains(
+            raw, na=False, case=case_sensitive, regex=action == "regex"
+        )
+    elif action == "length":
+        lengths = s.str.len()
+        if "," in raw:
+            start, end = (_parse_number(v) for v in raw.split(","))
+            mask = (lengths >= start) & (lengths <= end)
+        else:
+            mask = lengths == _parse_number(raw)
+    else:
+        return None
+    return ~mask if operand != "=" else mask
+
+
+def _compile_numeric_filter(s, fltr):
+    operand = fltr.get("operand")
+    if operand in ["=", "ne"]:
+        mask = s.isin([_parse_number(v) for v in make_list(fltr.get("value"))])
+        return ~mask if operand == "ne" else mask
+    if operand in ["<", ">", "<=", ">="]:
+        val = _parse_number(fltr["value"])
+        if operand == "<":
+            return s < val
+        if operand == ">":
+            return s > val
+        if operand == "<=":
+            return s <= val
+        return s >= val
+    if operand in ["[]", "()"]:
+        cfg_min, cfg_max = (fltr.get(p) for p in ["min", "max"])
+        if cfg_min is not None and cfg_max is not None and cfg_min == cfg_max:
+            return s == _parse_number(cfg_min)
+        mask = pd.Series(True, index=s.index)
+        if cfg_min is not None:
+            cfg_min = _parse_number(cfg_min)
+            mask &= s >= cfg_min if operand == "[]" else s > cfg_min
+        if cfg_max is not None:
+            cfg_max = _parse_number(cfg_max)
+            mask &= s <= cfg_max if operand == "[]" else s < cfg_max
+        return mask
+    return None
+
+
+def _compile_date_filter(s, fltr):
+    # timezone-aware comparisons against strings are left to pandas
+    if not pd.api.types.is_datetime64_dtype(s):
+        return None
+    start, end = (fltr.get(p) for p in ["start", "end"])
+    if start and end and start == end:
+        return s == pd.Timestamp(start)
+    mask = pd.Series(True, index=s.index)
+    if start:
+        mask &= s >= pd.Timestamp(start)
+    if end:
+        mask &= s <= pd.Timestamp(end)
+    return mask
+
+
+def build_filter_mask(df, fltr, engine="python"):
+    """
+    Compiles a filter saved to the "columnFilters" or "outlierFilters" settings of a piece of data into a boolean
+    array of the rows of df which satisfy it.  This gives the same result as evaluating the query string saved with
+    the filter, but string, numeric & date filters are evaluated directly against the column rather than parsing &
+    evaluating the query.  Filters which can't be compiled (EX: outlier filters) have their query string evaluated.
+
+    :param df: dataframe
+    :type df: :class:`pandas:pandas.DataFrame`
+    :param fltr: saved filter configuration
+    :type fltr: dict
+    :param engine: engine to use when evaluating query strings
+    :type engine: str, optional
+    :return: :class:`numpy:numpy.ndarray` of booleans
+    """
+    column, filter_type = (fltr.get("meta", {}).get(p) for p in ["column", "type"])
+    mask = None
+    if column is not None and column in df.columns:
+        s = df[column]
+        if fltr.get("missing"):
+            mask = s.isnull()
+        elif fltr.get("populated"):
+            mask = ~s.isnull()
+        elif filter_type == "string":
+            mask = _compile_string_filter(s, fltr)
+        elif filter_type in ["int", "float"]:
+            mask = _compile_numeric_filter(s, fltr)
+        elif filter_type == "date":
+            mask = _compile_date_filter(s, fltr)
+    if mask is None:
+        from dtale.query import validate_query_safety
+
+        validate_query_safety(fltr["query"])
+        mask = df.eval(fltr["query"], engine=engine)
+    if isinstance(mask, pd.Series):
+        # comparisons against nullable extension types can return missing values
+        mask = mask.fillna(False)
+    return np.asarray(mask, dtype=bool)
@@ -139,6 +139,19 @@ def load_app_settings(config):
     hide_drop_rows = get_config_val(
         config, curr_app_settings, "hide_drop_rows", section="app", getter="getboolean"
     )
+    sketch_stats = get_config_val(
+        config, curr_app_settings, "sketch_stats", section="app", getter="getboolean"
+    )
+    pps_workers = get_config_val(
+        config, curr_app_settings, "pps_workers", section="app", getter="getint"
+    )
+    column_builder_workers = get_config_val(
+        config,
+        curr_app_settings,
+        "column_builder_workers",
+        section="app",
+        getter="getint",
+    )
 
     global_state.set_app_settings(
         dict(
@@ -163,6 +176,9 @@ def load_app_settings(config):
             hide_row_expanders=hide_row_expanders,
             enable_custom_filters=enable_custom_filters,
             enable_web_uploads=enable_web_uploads,
+            sketch_stats=sketch_stats,
+            pps_workers=pps_workers,
+            column_builder_workers=column_builder_workers,
         )
     )
 
@@ -178,8 +194,19 @@ def load_chart_settings(config):
     three_dimensional_points = get_config_val(
         config, curr_chart_settings, "3d_points", section="charts", getter="getint"
     )
+    downsample_width = get_config_val(
+        config,
+        curr_chart_settings,
+        "downsample_width",
+        section="charts",
+        getter="getint",
+    )
     global_state.set_chart_settings(
-        {"scatter_points": scatter_points, "3d_points": three_dimensional_points}
+        {
+            "scatter_points": scatter_points,
+            "3d_points": three_dimensional_points,
+            "downsample_width": downsample_width,
+        }
     )
 
 
@@ -238,6 +265,7 @@ def build_show_options(options=None):
         enable_web_uploads=None,
         main_title=None,
         main_title_font=None,
+        profile_workers=None,
     )
     config_options = {}
     config = get_config()
@@ -340,6 +368,9 @@ def build_show_options(options=None):
         config_options["highlight_filter"] = get_config_val(
             config, defaults, "highlight_filter", "getboolean"
         )
+        config_options["profile_workers"] = get_config_val(
+            config, defaults, "profile_workers", "getint"
+        )
 
     return dict_merge(defaults, config_options, options)
 
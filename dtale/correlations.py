@@ -1,3 +1,5 @@
+import json
+
 import numpy as np
 import pandas as pd
 
@@ -5,6 +7,40 @@ import dtale.global_state as global_state
 from dtale.code_export import build_code_export
 from dtale.utils import classify_type, dict_merge
 
+CORR_BLOCK_SIZE = 1000
+CORR_VAR_TOLERANCE = 1e-6
+
+
+def build_cache_key(data_id, query=None, encode_strings=False, is_pps=False):
+    """
+    Builds the key correlation results for the data associated with data_id are cached under.  Any change to the data
+    or context variables replaces its token (see :attr:`dtale.global_state.DtaleInstance.data_token`) so results are only ever re-used if they were built from the same data,
+    query, predefined filters and string encoding.
+
+    :param data_id: integer string identifier for a D-Tale process's data
+    :type data_id: str
+    :param query: query string applied to the data, None if the results are for the unfiltered data
+    :type query: str, optional
+    :param encode_strings: whether string columns were one-hot encoded
+    :type encode_strings: bool, optional
+    :param is_pps: whether the results are predictive power scores rather than correlations
+    :type is_pps: bool, optional
+    :return: tuple
+    """
+    predefined = ""
+    if query is not None:
+        curr_settings = global_state.get_settings(data_id) or {}
+        predefined = json.dumps(
+            curr_settings.get("predefinedFilters") or {}, sort_keys=True, default=str
+        )
+    return (
+        global_state.get_data_token(data_id),
+        query,
+        predefined,
+        encode_strings,
+        is_pps,
+    )
+
 
 def get_col_groups(data_id, data):
     valid_corr_cols = []
@@ -28,9 +64,90 @@ def get_col_groups(data_id, data):
     return valid_corr_cols, valid_str_corr_cols, valid_date_cols
 
 
+def nan_corr(values, method="pearson", block_size=CORR_BLOCK_SIZE):
+    """
+    Builds a correlation matrix from a 2D array (one column per variable) containing :attr:`numpy:numpy.nan` values
+    using only the rows where both values of each pair are non-null, much like :meth:`pandas:pandas.DataFrame.corr`.
+    Rather than looping over each pair of columns the sums required are built from matrix products of the
+    zero-filled data & its non-null indicator matrix so all the heavy lifting is done by BLAS.  The rows of the matrix
+    are computed in blocks of columns so memory stays bounded on very wide data.
+
+    For Spearman correlations each column is ranked over all of its non-null values rather than over the rows it
+    shares with each of the other columns, so it will only match pandas exactly when there are no nulls.
+
+    :param values: 2D array of floats
+    :type values: :class:`numpy:numpy.ndarray`
+    :param method: "pearson" or "spearman"
+    :type method: str, optional
+    :param block_size: maximum number of columns to build matrix rows for at once
+    :type block_size: int, optional
+    :return: :class:`numpy:numpy.ndarray` of shape (columns, columns)
+    """
+    values = np.asarray(values, dtype="float64")
+    if method == "spearman":
+        values = pd.DataFrame(values).rank().values
+    elif method != "pearson":
+        raise ValueError("unsupported correlation method: {}".format(method))
+
+    col_ct = values.shape[1]
+    if not len(values):
+        return np.full((col_ct, col_ct), np.nan)
+
+    mask = ~np.isnan(values)
+    counts = mask.sum(axis=0)
+    filled = np.where(mask, values, 0.0)
+    means = filled.sum(axis=0) / np.maximum(counts, 1)
+    # centering each column doesn't change its correlations but keeps the sums below small which avoids
+    # catastrophic cancellation, constant columns are zeroed out entirely so their variance is exactly zero
+    constant = np.where(mask, values, -np.inf).max(axis=0) == np.where(
+        mask, values, np.inf
+    ).min(axis=0)
+    x = np.where(mask & ~constant, values - means, 0.0)
+    m = mask.astype("float64")
+    x2 = x * x
+
+    block_size = max(block_size or col_ct, 1)
+    corr = np.empty((col_ct, col_ct))
+    for start in range(0, col_ct, block_size):
+        end = min(start + block_size, col_ct)
+        xb, mb = x[:, start:end], m[:, start:end]
+        n = mb.T.dot(m)
+        sx = xb.T.dot(m)
+        sy = mb.T.dot(x)
+        sum_x2, sum_y2 = x2[:, start:end].T.dot(m), mb.T.dot(x2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cov = xb.T.dot(x) - sx * sy / n
+            var_x = sum_x2 - sx * sx / n
+            var_y = sum_y2 - sy * sy / n
+            divisor = np.sqrt(var_x * var_y)
+            block = cov / divisor
+        block[~(divisor > 0)] = np.nan
+        # when the mean of the rows shared by a pair is far from the mean of each column the subtractions above
+        # cancel catastrophically (EX: a column which is constant only over the rows it shares with another), so
+        # those pairs are recomputed exactly from their shared rows
+        ill_conditioned = (var_x <= CORR_VAR_TOLERANCE * sum_x2) | (
+            var_y <= CORR_VAR_TOLERANCE * sum_y2
+        )
+        ill_conditioned &= ~(constant[start:end, None] | constant[None, :])
+        for i, j in zip(*np.nonzero(ill_conditioned)):
+            block[i, j] = _pair_corr(values, mask, start + i, j)
+        corr[start:end] = block
+    return np.clip(corr, -1.0, 1.0)
+
+
+def _pair_corr(values, mask, i, j):
+    rows = mask[:, i] & mask[:, j]
+    x, y = values[rows, i], values[rows, j]
+    if not len(x) or x.min() == x.max() or y.min() == y.max():
+        return np.nan
+    x, y = x - x.mean(), y - y.mean()
+    return x.dot(y) / np.sqrt(x.dot(x) * y.dot(y))
+
+
 def build_matrix(data_id, data, cols, code_formatting_vars=None):
     if data[cols].isnull().values.any():
-        data = data.corr(method="pearson")
+        data = nan_corr(data[cols].astype("float").values)
+        data = pd.DataFrame(data, columns=cols, index=cols)
         code = build_code_export(data_id)
         code.append(
             (
@@ -75,6 +192,11 @@ def build_matrix(data_id, data, cols, code_formatting_vars=None):
 
 
 def get_analysis(data_id):
+    cache_key = ("analysis",) + build_cache_key(data_id)
+    cached = global_state.get_correlations_cache(data_id, cache_key)
+    if cached is not None:
+        return cached
+
     df = global_state.get_data(data_id)
     valid_corr_cols, _, _ = get_col_groups(data_id, df)
     corr_matrix, _ = build_matrix(
@@ -103,4 +225,6 @@ def get_analysis(data_id):
     analysis.index.name = "column"
     analysis = analysis.fillna("N/A").reset_index().to_dict(orient="records")
 
-    return column_name, max_score, upper, analysis
+    output = column_name, max_score, upper, analysis
+    global_state.set_correlations_cache(data_id, cache_key, output)
+    return output
@@ -1,4 +1,5 @@
 from collections import namedtuple
+import copy
 
 import json
 import math
@@ -26,11 +27,13 @@ import dtale.global_state as global_state
 import dtale.pandas_util as pandas_util
 from dtale.charts.utils import (
     AGGS,
+    DENSITY_BINS,
     DUPES_MSG,
     YAXIS_CHARTS,
     ZAXIS_CHARTS,
     build_agg_data,
     build_base_chart,
+    build_density_data,
     build_final_cols,
     build_group_inputs_filter,
     check_all_nan,
@@ -63,6 +66,7 @@ from dtale.utils import (
     classify_type,
     dict_merge,
     divide_chunks,
+    estimate_size,
     export_to_csv_buffer,
     find_dtype,
     find_dtype_formatter,
@@ -118,6 +122,7 @@ BOOL_PROPS = [
     "funnel_dropna",
     "clustergram_dropna",
     "pareto_dropna",
+    "density",
 ]
 
 
@@ -149,6 +154,7 @@ def chart_url_params(search):
         "extended_aggregation",
         "cleaners",
         "clustergram_value",
+        "density_range",
     ]:
         if gp in params:
             params[gp] = json.loads(params[gp])
@@ -164,7 +170,7 @@ def chart_url_params(search):
     params["cpy"] = "true" == params.get("cpy")
     if params.get("chart_type") in ANIMATION_CHARTS:
         params["animate"] = "true" == params.get("animate")
-    for int_prop in ["window", "load", "top_bars"]:
+    for int_prop in ["window", "load", "top_bars", "density_bins"]:
         if int_prop in params:
             params[int_prop] = int(params[int_prop])
     if "group_filter" in params:
@@ -275,7 +281,9 @@ def chart_url_querystring(params, data=None, group_filter=None):
             "histogram_group",
         ]
     elif chart_type == "scatter":
-        base_props += ["trendline"]
+        base_props += ["trendline", "density", "density_bins"]
+    elif chart_type == "3d_scatter":
+        base_props += ["density", "density_bins"]
 
     final_params = {k: params[k] for k in base_props if params.get(k) is not None}
     for prop in BOOL_PROPS:
@@ -301,6 +309,8 @@ def chart_url_querystring(params, data=None, group_filter=None):
         list_props += ["colorscale"]
     if chart_type == "clustergram":
         list_props += ["clustergram_value"]
+    if chart_type in ["scatter", "3d_scatter"]:
+        list_props += ["density_range"]
     for gp in list_props:
         list_param = [val for val in params.get(gp) or [] if val is not None]
         if len(list_param):
@@ -1877,6 +1887,162 @@ def pie_builder(data, x, y, wrapper, export=False, **inputs):
     return pies, pie_code
 
 
+def update_density_range(relayout_data, density_range=None):
+    """
+    Applies the axis ranges from the relayoutData of a zoomed (or reset) density chart to the ranges it was built
+    from so the visible area can be re-binned.  Axes which were reset (double-clicked) go back to their full range.
+
+    :param relayout_data: relayoutData property of a :dash:`dash_core_components.Graph <dash-core-components/graph>`
+    :type relayout_data: dict
+    :param density_range: [x-range, y-range] the chart was built from, either range may be None
+    :type density_range: list, optional
+    :return: updated [x-range, y-range] or None if relayout_data contains no changes to either axis
+    :rtype: list
+    """
+    ranges = list(density_range or [None, None])
+    updated = False
+    for i, axis in enumerate(["xaxis", "yaxis"]):
+        if (relayout_data or {}).get("{}.autorange".format(axis)):
+            ranges[i], updated = None, True
+        elif "{}.range[0]".format(axis) in (relayout_data or {}):
+            ranges[i] = [
+                relayout_data["{}.range[0]".format(axis)],
+                relayout_data["{}.range[1]".format(axis)],
+            ]
+            updated = True
+        elif "{}.range".format(axis) in (relayout_data or {}):
+            ranges[i], updated = list(relayout_data["{}.range".format(axis)]), True
+    return ranges if updated else None
+
+
+def load_density_data(data_id, **inputs):
+    return run_query(
+        handle_predefined(data_id),
+        inputs.get("query"),
+        global_state.get_context_variables(data_id),
+        pct=inputs.get("load"),
+        pct_type=inputs.get("load_type"),
+    )
+
+
+def exceeds_3d_points(data_id, **inputs):
+    """
+    Checks whether a 3D scatter contains more points than the "3d_points" chart setting, in which case it's
+    rasterized by :meth:`dtale.dash_application.charts.density_builder` rather than sending every point to the
+    browser.  Aggregated & animated 3D scatters are always rendered as points.
+
+    :param data_id: integer string identifier for a D-Tale process's data
+    :type data_id: str
+    :return: tuple of (flag, data loaded for the check so it isn't queried again)
+    :rtype: tuple of (bool, :class:`pandas:pandas.DataFrame`)
+    """
+    if (inputs.get("agg") or "raw") != "raw" or inputs.get("animate_by") is not None:
+        return False, None
+    if not valid_chart(**inputs):
+        return False, None
+    raw_data = load_density_data(data_id, **inputs)
+    cols = [inputs.get("x"), make_list(inputs.get("y"))[0], inputs.get("z")]
+    total = len(raw_data[cols].dropna())
+    return total > global_state.get_chart_settings()["3d_points"], raw_data
+
+
+def density_builder(data_id, raw_data=None, **inputs):
+    """
+    Builder function for rasterized scatter charts.  Rather than plotting every point (which becomes unusable in the
+    millions) the points are binned into a grid using :meth:`dtale.charts.utils.build_density_data` and rendered as
+    a :plotly:`plotly.graph_objs.Heatmap <plotly.graph_objs.Heatmap>` of the number of points in each cell.  For 3D
+    scatters the cells contain the mean of the z-axis.
+
+    :param data_id: integer string identifier for a D-Tale process's data
+    :type data_id: str
+    :param raw_data: data with the query of the chart already applied, loaded if not specified
+    :type raw_data: :class:`pandas:pandas.DataFrame`, optional
+    :param inputs: Optional keyword arguments containing the following information:
+        - x: column to be used as x-axis of chart
+        - y: column to be used as y-axis of chart
+        - z: column to use for the z-Axis (3D scatters)
+        - density_bins: number of bins along each axis
+        - density_range: [[x-min, x-max], [y-min, y-max]] of the visible area of a zoomed chart
+        - density_cols: [x, y] the density_range was zoomed on, ranges from other columns are ignored
+    :type inputs: dict
+    :return: heatmap
+    :rtype: :plotly:`plotly.graph_objs.Heatmap <plotly.graph_objs.Heatmap>`
+    """
+    code = None
+    try:
+        if not valid_chart(**inputs):
+            return None, None
+        query = inputs.get("query")
+        if raw_data is None:
+            raw_data = load_density_data(data_id, **inputs)
+        code = build_code_export(data_id, query=query)
+        x, y = inputs.get("x"), make_list(inputs.get("y"))[0]
+        z = inputs.get("z") if inputs.get("chart_type") == "3d_scatter" else None
+        bins = inputs.get("density_bins") or DENSITY_BINS
+        density_range = inputs.get("density_range")
+        if inputs.get("density_cols") not in [None, [x, y]]:
+            density_range = None
+        x_range, y_range = density_range or [None, None]
+        density = build_density_data(
+            raw_data, x, y, z=z, bins=bins, x_range=x_range, y_range=y_range
+        )
+        z_title = "Count" if z is None else "{} (Mean)".format(z)
+        hm_kwargs = dict(
+            x=density["x"],
+            y=density["y"],
+            z=density["z"],
+            colorscale=build_colorscale(inputs.get("colorscale") or "Viridis"),
+            colorbar={"title": z_title},
+            showscale=True,
+        )
+        layout_cfg = build_layout(
+            dict_merge(
+                dict(xaxis_zeroline=False, yaxis_zeroline=False),
+                build_title(x, y, z=z),
+            )
+        )
+        hist_code = (
+            "z, x_edges, y_edges = np.histogram2d(\n"
+            "\tchart_data['{x}'], chart_data['{y}'], bins={bins}\n"
+            ")"
+        )
+        if z is not None:
+            hist_code = (
+                "counts, x_edges, y_edges = np.histogram2d(\n"
+                "\tchart_data['{x}'], chart_data['{y}'], bins={bins}\n"
+                ")\n"
+                "sums, _, _ = np.histogram2d(\n"
+                "\tchart_data['{x}'], chart_data['{y}'], bins={bins}, weights=chart_data['{z}']\n"
+                ")\n"
+                "z = sums / counts"
+            )
+        code.append(
+            (
+                "\nimport numpy as np\n"
+                "import plotly.graph_objs as go\n\n"
+                "chart_data = df[['{cols}']].dropna()\n" + hist_code + "\n"
+                "chart = go.Heatmap(\n"
+                "\tx=(x_edges[:-1] + x_edges[1:]) / 2, y=(y_edges[:-1] + y_edges[1:]) / 2, z=z.T\n"
+                ")\n"
+                "figure = go.Figure(data=[chart])"
+            ).format(
+                cols="', '".join([c for c in [x, y, z] if c is not None]),
+                x=x,
+                y=y,
+                z=z,
+                bins=bins,
+            )
+        )
+        wrapper = chart_wrapper(data_id, raw_data, inputs)
+        figure_cfg = {"data": [go.Heatmap(**hm_kwargs)], "layout": layout_cfg}
+        return (
+            wrapper(graph_wrapper(figure=figure_cfg, modal=inputs.get("modal", False))),
+            code,
+        )
+    except BaseException as e:
+        return build_error(e, traceback.format_exc()), code
+
+
 def heatmap_builder(data_id, export=False, **inputs):
     """
     Builder function for :plotly:`plotly.graph_objs.Heatmap <plotly.graph_objs.Heatmap>`
@@ -3520,6 +3686,66 @@ def build_choropleth(inputs, raw_data, layout):
     return chart, code
 
 
+CHART_DATA_PROPS = ["load", "load_type", "stratified_group", "width"]
+CHART_DATA_PREFIXES = (
+    "treemap_",
+    "funnel_",
+    "clustergram_",
+    "pareto_",
+    "histogram_",
+    "density",
+)
+
+
+def build_chart_data_key(data_id, inputs):
+    """
+    Builds the key used to cache the output of :meth:`dtale.dash_application.charts.build_figure_data`.  Only the
+    inputs which affect the data of a chart are included (inputs which only affect its presentation, such as
+    colorscales or axis types, are dropped) so that changing them will re-use the data already built.
+
+    :param data_id: integer string identifier for a D-Tale process's data
+    :type data_id: str
+    :param inputs: chart inputs
+    :type inputs: dict
+    :return: tuple of (data token, predefined filters, JSON of the normalized inputs)
+    :rtype: tuple
+    """
+    from dtale.query import build_predefined_key
+
+    chart_type = inputs.get("chart_type")
+    data_inputs = {
+        k: v
+        for k, v in inputs.items()
+        if v is not None
+        and (k in CHART_DATA_PROPS or k.startswith(CHART_DATA_PREFIXES))
+    }
+    for prop in [
+        "chart_type",
+        "x",
+        "group_type",
+        "group_val",
+        "bins_val",
+        "bin_type",
+        "agg",
+        "window",
+        "rolling_comp",
+    ]:
+        data_inputs[prop] = inputs.get(prop)
+    for prop in ["y", "group", "extended_aggregation", "cleaners"]:
+        data_inputs[prop] = make_list(inputs.get(prop))
+    data_inputs["query"] = inputs.get("query") or None
+    data_inputs["dropna"] = inputs.get("dropna", True)
+    data_inputs["z"] = inputs.get("z") if chart_type in ZAXIS_CHARTS else None
+    data_inputs["animate_by"] = (
+        inputs.get("animate_by") if chart_type in ANIMATE_BY_CHARTS else None
+    )
+    return (
+        global_state.get_data_token(data_id),
+        build_predefined_key(data_id),
+        json.dumps(data_inputs, sort_keys=True, default=str),
+    )
+
+
 def build_figure_data(
     data_id,
     chart_type=None,
@@ -3596,6 +3822,43 @@ def build_figure_data(
     ):
         return None, None
 
+    cache_key = None
+    if data is None:
+        cache_key = build_chart_data_key(
+            data_id,
+            dict_merge(
+                dict(
+                    chart_type=chart_type,
+                    query=query,
+                    x=x,
+                    y=y,
+                    z=z,
+                    group=group,
+                    group_type=group_type,
+                    group_val=group_val,
+                    bins_val=bins_val,
+                    bin_type=bin_type,
+                    agg=agg,
+                    window=window,
+                    rolling_comp=rolling_comp,
+                    animate_by=animate_by,
+                    extended_aggregation=extended_aggregation,
+                    cleaners=cleaners,
+                    dropna=dropna,
+                ),
+                kwargs,
+            ),
+        )
+        cached = global_state.get_chart_cache(data_id, cache_key)
+        if cached is not None:
+            data, chart_code = cached
+            if data is None:
+                return None, None
+            return (
+                copy.deepcopy(data),
+                build_code_export(data_id, query=query) + chart_code,
+            )
+
     data = run_query(
         data if data is not None else handle_predefined(data_id),
         query,
@@ -3605,6 +3868,8 @@ def build_figure_data(
         stratified_group=kwargs.get("stratified_group"),
     )
     if data is None or not len(data):
+        if cache_key is not None:
+            global_state.set_chart_cache(data_id, cache_key, (None, []))
         return None, None
 
     if chart_type in ["treemap", "funnel", "clustergram"]:
@@ -3649,12 +3914,22 @@ def build_figure_data(
         chart_kwargs["animate_by"] = animate_by
     if chart_type in ZAXIS_CHARTS:
         chart_kwargs["z"] = z
+    if chart_type in ["line", "scatter"]:
+        chart_kwargs["downsample_width"] = (
+            kwargs.get("width") or global_state.get_chart_settings()["downsample_width"]
+        )
+        chart_kwargs["downsample_method"] = "lttb" if chart_type == "line" else "minmax"
     if (
         not y and chart_type != "histogram"
     ):  # this is to handle when a user wants to see the count of just the x-axis
         data.loc[:, "count"] = 1
         y = "count"
     data, chart_code = build_base_chart(data, x, y, unlimited_data=True, **chart_kwargs)
+    if cache_key is not None:
+        global_state.set_chart_cache(
+            data_id, cache_key, (data, chart_code), size=estimate_size(data)
+        )
+        data = copy.deepcopy(data)
     return data, code + chart_code
 
 
@@ -3824,6 +4099,14 @@ def build_chart(data_id=None, data=None, **inputs):
             chart, code = histogram_builder(data_id, **inputs)
             return chart, None, code, export_all_charts_href
 
+        if chart_type in ["scatter", "3d_scatter"]:
+            density, raw_data = inputs.get("density"), None
+            if not density and chart_type == "3d_scatter" and data is None:
+                density, raw_data = exceeds_3d_points(data_id, **inputs)
+            if density:
+                chart, code = density_builder(data_id, raw_data=raw_data, **inputs)
+                return chart, None, code, export_all_charts_href
+
         data, code = build_figure_data(data_id, data=data, **inputs)
         if data is None:
             return None, None, None, ""
@@ -17,6 +17,8 @@ from dtale.charts.utils import (
     AGGS,
     ANIMATION_CHARTS,
     ANIMATE_BY_CHARTS,
+    DENSITY_BINS,
+    MAX_DENSITY_BINS,
     YAXIS_CHARTS,
     ZAXIS_CHARTS,
     NON_EXT_AGGREGATION,
@@ -1479,6 +1481,7 @@ def charts_layout(df, settings, **inputs):
     show_cpy = show_chart_per_y(**inputs)
     show_yaxis = show_yaxis_ranges(**inputs)
     scatter_input = dict(display="block" if chart_type == "scatter" else "none")
+    density_input = show_style(chart_type in ["scatter", "3d_scatter"])
     bar_style, barsort_input_style = bar_input_style(**inputs)
     animate_style, animate_by_style, animate_opts = animate_styles(df, **inputs)
     custom_filtering = global_state.load_flag(
@@ -1647,6 +1650,17 @@ def charts_layout(df, settings, **inputs):
             },
         ),
         dcc.Store(id="range-data"),
+        dcc.Store(
+            id="density-range-data",
+            data=(
+                dict(
+                    density_range=inputs.get("density_range"),
+                    density_cols=[x, next(iter(make_list(y)), None)],
+                )
+                if inputs.get("density_range")
+                else None
+            ),
+        ),
         dcc.Store(id="yaxis-data", data=inputs.get("yaxis")),
         dcc.Store(id="last-chart-input-data", data=inputs),
         dcc.Store(id="load-clicks", data=0),
@@ -2525,6 +2539,28 @@ def charts_layout(df, settings, **inputs):
                     style=scatter_input,
                     id="trendline-input",
                 ),
+                build_input(
+                    text("Density"),
+                    [
+                        html.Div(
+                            build_boolean_switch(
+                                "density-toggle", inputs.get("density") or False
+                            ),
+                            className="toggle-wrapper",
+                        ),
+                        html.Span(text("Bins"), className="input-group-addon"),
+                        dbc.Input(
+                            id="density-bins",
+                            type="number",
+                            min=1,
+                            max=MAX_DENSITY_BINS,
+                            value=inputs.get("density_bins") or DENSITY_BINS,
+                        ),
+                    ],
+                    className="col-auto",
+                    style=density_input,
+                    id="density-input",
+                ),
                 build_input(
                     text("Barmode"),
                     dcc.Dropdown(
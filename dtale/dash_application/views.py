@@ -20,7 +20,12 @@ from dtale.charts.utils import (
     build_final_cols,
 )
 from dtale.code_export import build_final_chart_code
-from dtale.dash_application.charts import build_chart, chart_url_params, valid_chart
+from dtale.dash_application.charts import (
+    build_chart,
+    chart_url_params,
+    update_density_range,
+    valid_chart,
+)
 from dtale.dash_application.layout.layout import (
     animate_styles,
     bar_input_style,
@@ -822,6 +827,7 @@ def init_callbacks(dash_app):
             Output("animate-by-input", "style"),
             Output("animate-by-dropdown", "options"),
             Output("trendline-input", "style"),
+            Output("density-input", "style"),
             Output("dropna-input", "style"),
         ],
         [Input("input-data", "modified_timestamp")],
@@ -850,6 +856,7 @@ def init_callbacks(dash_app):
         df = global_state.get_data(data_id)
         animate_style, animate_by_style, animate_opts = animate_styles(df, **inputs)
         trendline_style = dict(display="block" if chart_type == "scatter" else "none")
+        density_style = show_style(chart_type in ["scatter", "3d_scatter"])
         return (
             y_multi_style,
             y_single_style,
@@ -866,6 +873,7 @@ def init_callbacks(dash_app):
             animate_by_style,
             animate_opts,
             trendline_style,
+            density_style,
             dropna_style,
         )
 
@@ -882,6 +890,9 @@ def init_callbacks(dash_app):
             Input("animate-by-dropdown", "value"),
             Input("trendline-dropdown", "value"),
             Input("yaxis-scale", "value"),
+            Input("density-toggle", boolean_switch_prop()),
+            Input("density-bins", "value"),
+            Input("density-range-data", "data"),
         ],
     )
     def chart_input_data(
@@ -895,13 +906,18 @@ def init_callbacks(dash_app):
         animate_by,
         trendline,
         scale,
+        density,
+        density_bins,
+        density_range_data,
     ):
         """
         dash callback for maintaining selections in chart-formatting inputs
             - chart per group flag
             - bar chart mode
             - bar chart sorting
+            - density (rasterized scatters) flag, bins & zoomed range
         """
+        density_range_data = density_range_data or {}
         return dict(
             cpg=cpg,
             cpy=cpy,
@@ -913,8 +929,41 @@ def init_callbacks(dash_app):
             animate_by=animate_by,
             trendline=trendline,
             scale=scale,
+            density=density,
+            density_bins=density_bins,
+            density_range=density_range_data.get("density_range"),
+            density_cols=density_range_data.get("density_cols"),
         )
 
+    @dash_app.callback(
+        Output("density-range-data", "data"),
+        [Input("chart-1", "relayoutData")],
+        [
+            State("chart-1", "figure"),
+            State("input-data", "data"),
+            State("density-range-data", "data"),
+        ],
+    )
+    def density_zoom(relayout_data, figure, inputs, density_range_data):
+        """
+        dash callback which stores the visible area of a zoomed density chart so its points can be re-binned at full
+        resolution, the range is stored along with the columns it applies to.
+        """
+        if (inputs or {}).get("chart_type") not in ["scatter", "3d_scatter"]:
+            raise DtalePreventUpdate
+        traces = (figure or {}).get("data") or [{}]
+        if traces[0].get("type") != "heatmap":
+            raise DtalePreventUpdate
+        density_cols = [inputs.get("x"), next(iter(make_list(inputs.get("y"))), None)]
+        density_range_data = density_range_data or {}
+        density_range = None
+        if density_range_data.get("density_cols") == density_cols:
+            density_range = density_range_data.get("density_range")
+        density_range = update_density_range(relayout_data, density_range)
+        if density_range is None:
+            raise DtalePreventUpdate
+        return dict(density_range=density_range, density_cols=density_cols)
+
     @dash_app.callback(
         Output("load-btn", "style"), [Input("auto-load-toggle", boolean_switch_prop())]
     )
@@ -1,7 +1,5 @@
 import pandas as pd
 
-from scipy import stats
-
 import dtale.global_state as global_state
 import dtale.pandas_util as pandas_util
 from dtale.query import run_query
@@ -105,7 +103,9 @@ def str_joiner(vals, join_char="|"):
 
 def custom_agg_handler(agg):
     if agg == "gmean":
-        return stats.gmean
+        from scipy.stats import gmean
+
+        return gmean
     if agg == "str_joiner":
         return str_joiner
     return agg
@@ -135,6 +135,8 @@ class AggregateBuilder(object):
         self.cfg = cfg
 
     def reshape(self, data):
+        from scipy.stats import gmean
+
         index, agg, dropna = (self.cfg.get(p) for p in ["index", "agg", "dropna"])
         agg_type, func, cols = (agg.get(p) for p in ["type", "func", "cols"])
 
@@ -159,7 +161,7 @@ class AggregateBuilder(object):
                     agg_data = agg_data[non_str_cols]
 
                 return (
-                    agg_data.agg(stats.gmean)
+                    agg_data.agg(gmean)
                     if func == "gmean"
                     else getattr(agg_data, func)()
                 )
@@ -170,9 +172,7 @@ class AggregateBuilder(object):
         agg_data = data[cols] if cols else data
         if agg_type == "func":
             agg_data = (
-                agg_data.apply(stats.gmean)
-                if func == "gmean"
-                else getattr(agg_data, func)()
+                agg_data.apply(gmean) if func == "gmean" else getattr(agg_data, func)()
             )
             return agg_data.to_frame().T
 
@@ -1,17 +1,125 @@
+import re
+
 import numpy as np
+import pandas as pd
 
+from dtale.column_builders import printable
+from dtale.sketches import approx_describe, approx_value_counts
 from dtale.utils import grid_columns, grid_formatter, json_int, json_float
 
+NUMERIC_DESCRIBE = ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+STRING_CHUNK_SIZE = (
+    100000  # number of strings whose characters are classified at a time
+)
+
+# regular expressions matching the characters counted by the string metrics of the Describe popup
+STRING_CHAR_CLASSES = [
+    ("with_space", r"\s"),
+    ("with_accent", r"[À-ÖÙ-öù-ÿĀ-žḀ-ỿ]"),
+    ("with_num", r"[\d]"),
+    ("with_upper", r"[A-Z]"),
+    ("with_lower", r"[a-z]"),
+    (
+        "with_punc",
+        r'(\!|"|\#|\$|%|&|\'|\(|\)|\*|\+|,|\-|\.|/|\:|\;|\<|\=|\>|\?|@|\[|\\|\]|\^|_|\`|\{|\||\}|\~)',
+    ),
+    ("with_hidden", r"[^{}]+".format(printable)),
+]
+# flags a whitespace character preceded by another one
+MULTI_SPACE = 1 << len(STRING_CHAR_CLASSES)
+
+_char_classes = {}
+
+
+def is_numeric_series(s):
+    return pd.api.types.is_numeric_dtype(s) and not pd.api.types.is_bool_dtype(s)
+
+
+def build_numeric_stats(s):
+    """
+    Computes the statistics of a numeric series displayed by the Describe popup in as few passes over its values as
+    possible.  Missing values are dropped once, the moments are all built from the remaining values and the quartiles
+    come from a single partition of them.  The results match those of
+    :meth:`pandas:pandas.Series.describe`, :meth:`pandas:pandas.Series.sum`, :meth:`pandas:pandas.Series.median`,
+    :meth:`pandas:pandas.Series.var` & :meth:`pandas:pandas.Series.sem`.
+
+    :param s: numeric series
+    :type s: :class:`pandas:pandas.Series`
+    :rtype: dict
+    """
+    values = s.dropna().to_numpy(dtype=getattr(s.dtype, "numpy_dtype", s.dtype))
+    count = len(values)
+    stats = dict(count=float(count), sum=values.sum())
+    mean, var = np.nan, np.nan
+    if count:
+        mean = values.sum(dtype=np.float64) / count
+        if count > 1:
+            var = ((mean - values) ** 2).sum(dtype=np.float64) / (count - 1)
+        quantiles = [values.min()] + list(np.percentile(values, [25, 50, 75]))
+        quantiles.append(values.max())
+    else:
+        quantiles = [np.nan] * 5
+    stats["mean"], stats["var"] = mean, var
+    stats["std"] = np.sqrt(var)
+    stats["sem"] = np.sqrt(var) / np.sqrt(count) if count else np.nan
+    for key, val in zip(["min", "25%", "50%", "75%", "max"], quantiles):
+        stats[key] = val
+    stats["median"] = stats["50%"]
+    return stats
+
 
-def load_describe(column_series, additional_aggs=None):
+def describe_value_counts(s, value_counts):
+    """
+    Builds the output of :meth:`pandas:pandas.Series.describe` for a non-numeric series from its value counts so the
+    values only need to be hashed once.
+    """
+    value_counts = value_counts[
+        value_counts > 0
+    ]  # categoricals include unused categories
+    top, freq = np.nan, np.nan
+    if len(value_counts):
+        top, freq = value_counts.index[0], value_counts.values[0]
+    return pd.Series(
+        [s.count(), len(value_counts), top, freq],
+        index=["count", "unique", "top", "freq"],
+        name=s.name,
+        dtype="object",
+    )
+
+
+def load_describe(
+    column_series, additional_aggs=None, approximate=False, value_counts=None
+):
     """
     Helper function for grabbing the output from :meth:`pandas:pandas.Series.describe` in a JSON serializable format
 
     :param column_series: data to describe
     :type column_series: :class:`pandas:pandas.Series`
+    :param approximate: if True, quantiles, unique counts & modes will be estimated using
+                        :meth:`dtale.sketches.approx_describe`
+    :type approximate: bool, optional
+    :param value_counts: output of :meth:`pandas:pandas.Series.value_counts` if it has already been computed, it will
+                         be used for the mode & the description of non-numeric data
+    :type value_counts: :class:`pandas:pandas.Series`, optional
     :return: JSON serializable dictionary of the output from calling :meth:`pandas:pandas.Series.describe`
     """
-    desc = column_series.describe().to_frame().T
+    stats = None
+    if approximate:
+        desc = approx_describe(column_series)
+    elif is_numeric_series(column_series):
+        stats = build_numeric_stats(column_series)
+        desc = pd.Series(
+            [stats[k] for k in NUMERIC_DESCRIBE],
+            index=NUMERIC_DESCRIBE,
+            name=column_series.name,
+        )
+    elif value_counts is not None and not pd.api.types.is_datetime64_any_dtype(
+        column_series
+    ):
+        desc = describe_value_counts(column_series, value_counts)
+    else:
+        desc = column_series.describe()
+    desc = desc.to_frame().T
     code = [
         "# main statistics",
         "stats = df['{col}'].describe().to_frame().T".format(col=column_series.name),
@@ -19,7 +127,15 @@ def load_describe(column_series, additional_aggs=None):
     if additional_aggs:
         for agg in additional_aggs:
             if agg == "mode":
-                mode = column_series.mode().values
+                if approximate or value_counts is not None:
+                    counts = value_counts
+                    if approximate:
+                        counts, _ = approx_value_counts(column_series)
+                    mode = [np.nan]
+                    if len(counts):
+                        mode = counts.index[counts.values == counts.values[0]]
+                else:
+                    mode = column_series.mode().values
                 desc["mode"] = np.nan if len(mode) > 1 else mode[0]
                 code.append(
                     (
@@ -29,7 +145,12 @@ def load_describe(column_series, additional_aggs=None):
                     ).format(col=column_series.name)
                 )
                 continue
-            desc[agg] = getattr(column_series, agg)()
+            if approximate and agg == "median":
+                desc[agg] = desc["50%"]
+            elif stats is not None and agg in stats:
+                desc[agg] = stats[agg]
+            else:
+                desc[agg] = getattr(column_series, agg)()
             code.append(
                 "# {agg}\nstats['{agg}'] = df['{col}'].{agg}()".format(
                     col=column_series.name, agg=agg
@@ -47,7 +168,141 @@ def load_describe(column_series, additional_aggs=None):
         # pandas always returns 'count' as a float and it adds useless decimal points
         desc["count"] = desc["count"].split(".")[0]
     desc["total_count"] = json_int(len(column_series), as_string=True)
-    missing_ct = column_series.isnull().sum()
+    if stats is not None:
+        missing_ct = np.int64(len(column_series) - int(stats["count"]))
+    else:
+        missing_ct = column_series.isnull().sum()
     desc["missing_pct"] = json_float((missing_ct / len(column_series) * 100).round(2))
     desc["missing_ct"] = json_int(missing_ct, as_string=True)
     return desc, code
+
+
+def load_char_classes():
+    """
+    Bit flags of the classes in `STRING_CHAR_CLASSES` each character of the Basic Multilingual Plane belongs to.  The
+    flags are built once by running each regular expression over a string containing every one of those characters.
+
+    :rtype: :class:`numpy:numpy.ndarray`
+    """
+    if "bmp" not in _char_classes:
+        chars = "".join(map(chr, range(0x10000)))
+        flags = np.zeros(0x10000, dtype=np.uint16)
+        for bit, (_, pattern) in enumerate(STRING_CHAR_CLASSES):
+            for match in re.finditer(pattern, chars):
+                flags[match.start() : match.end()] |= 1 << bit
+        _char_classes["bmp"] = flags
+    return _char_classes["bmp"]
+
+
+def classify_chars(codes):
+    """
+    Bit flags of the classes in `STRING_CHAR_CLASSES` each character (passed as code points) belongs to.
+    """
+    flags = np.zeros(len(codes), dtype=np.uint16)
+    bmp = codes < 0x10000
+    flags[bmp] = load_char_classes()[codes[bmp]]
+    if not bmp.all():
+        astral, inverse = np.unique(codes[~bmp], return_inverse=True)
+        astral_flags = np.zeros(len(astral), dtype=np.uint16)
+        for i, code in enumerate(astral):
+            for bit, (_, pattern) in enumerate(STRING_CHAR_CLASSES):
+                if re.match(pattern, chr(code)):
+                    astral_flags[i] |= 1 << bit
+        flags[~bmp] = astral_flags[inverse]
+    return flags
+
+
+def _classify_strings(values):
+    lengths = np.fromiter((len(v) for v in values), dtype=np.int64, count=len(values))
+    flags = np.zeros(len(values), dtype=np.uint16)
+    lead_space = np.zeros(len(values), dtype=bool)
+    trail_space = np.zeros(len(values), dtype=bool)
+    space_runs = np.zeros(len(values), dtype=np.int64)
+    non_empty = lengths > 0
+    if not non_empty.any():
+        return lengths, flags, lead_space, trail_space, space_runs
+
+    codes = np.frombuffer(
+        "".join(values).encode("utf-32-le", "surrogatepass"), dtype=np.uint32
+    )
+    char_flags = classify_chars(codes)
+    starts = (np.cumsum(lengths) - lengths)[non_empty]
+    ends = starts + lengths[non_empty] - 1
+    is_start = np.zeros(len(codes), dtype=bool)
+    is_start[starts] = True
+    is_space = (char_flags & 1).astype(bool)
+    follows_space = np.zeros(len(codes), dtype=bool)
+    follows_space[1:] = is_space[:-1] & ~is_start[1:]
+    char_flags[is_space & follows_space] |= MULTI_SPACE
+    flags[non_empty] = np.bitwise_or.reduceat(char_flags, starts)
+    run_starts = (is_space & ~follows_space).astype(np.int64)
+    space_runs[non_empty] = np.add.reduceat(run_starts, starts)
+
+    # " $" also matches a space followed by a newline which ends the string
+    lead_space[non_empty] = codes[starts] == 32
+    trailing_newline = (codes[ends] == 10) & (ends > starts)
+    trail_space[non_empty] = (codes[ends] == 32) | (
+        trailing_newline & (codes[np.maximum(ends - 1, 0)] == 32)
+    )
+    return lengths, flags, lead_space, trail_space, space_runs
+
+
+def build_string_stats(values, counts=None):
+    """
+    Computes the string metrics displayed by the Describe popup with a single scan over the characters of each chunk
+    of strings.  Each character is classified using a lookup table of bit flags which are then combined per string,
+    rather than running a separate regular expression over the strings for every metric.  If counts are specified
+    each string is weighted by its count (EX: the unique values of a column & their frequencies).
+
+    :param values: strings
+    :type values: list or :class:`numpy:numpy.ndarray`
+    :param counts: number of occurrences of each string
+    :type counts: :class:`numpy:numpy.ndarray`, optional
+    :return: dict of metrics
+    """
+    values = list(values)
+    results = [
+        _classify_strings(values[i : i + STRING_CHUNK_SIZE])
+        for i in range(0, len(values), STRING_CHUNK_SIZE)
+    ] or [_classify_strings([])]
+    lengths, flags, lead_space, trail_space, space_runs = (
+        np.concatenate(arrays) for arrays in zip(*results)
+    )
+    # whitespace runs are collapsed to a single space & words are split on it
+    word_lengths = space_runs + 1
+    weights = np.ones(len(values), dtype=np.int64) if counts is None else counts
+    weights = np.asarray(weights, dtype=np.int64)
+    total = weights.sum()
+
+    def weighted_stats(x):
+        if not total:
+            return 0, 0, np.nan, np.nan
+        mean = (x * weights).sum() / float(total)
+        std = np.nan
+        if total > 1:
+            std = np.sqrt((weights * (x - mean) ** 2).sum() / float(total - 1))
+        present = weights > 0
+        return int(x[present].min()), int(x[present].max()), mean, std
+
+    char_min, char_max, char_mean, char_std = weighted_stats(lengths)
+    word_min, word_max, word_mean, word_std = weighted_stats(word_lengths)
+
+    def flag_count(mask):
+        return int(weights[mask].sum())
+
+    metrics = dict(
+        char_min=char_min,
+        char_max=char_max,
+        char_mean=json_float(char_mean),
+        char_std=json_float(char_std),
+    )
+    for bit, (name, _) in enumerate(STRING_CHAR_CLASSES):
+        metrics[name] = flag_count((flags & (1 << bit)) > 0)
+    metrics["space_at_the_first"] = flag_count(lead_space)
+    metrics["space_at_the_end"] = flag_count(trail_space)
+    metrics["multi_space_after_each_other"] = flag_count((flags & MULTI_SPACE) > 0)
+    metrics["word_min"] = word_min
+    metrics["word_max"] = word_max
+    metrics["word_mean"] = json_float(word_mean)
+    metrics["word_std"] = json_float(word_std)
+    return metrics
@@ -1,7 +1,9 @@
+import hashlib
+
 import pandas as pd
 
 import dtale.global_state as global_state
-from dtale.query import run_query
+from dtale.query import load_sorted_data, run_query
 from dtale.utils import dict_merge, grid_columns, grid_formatter, triple_quote
 from dtale.charts.utils import build_group_inputs_filter
 
@@ -35,13 +37,14 @@ class DuplicateCheck(object):
             )
 
     def test(self):
-        data = global_state.get_data(self.data_id)
+        # the first/last duplicate is picked using the sort applied from the grid
+        data = load_sorted_data(self.data_id)
         return self.checker.check(data)
 
     def execute(self):
         from dtale.views import startup
 
-        data = global_state.get_data(self.data_id)
+        data = load_sorted_data(self.data_id)
         try:
             df, code = self.checker.remove(data)
             instance = startup(data=df, **self.checker.startup_kwargs)
@@ -67,20 +70,71 @@ class DuplicateColumns(object):
         self.cfg = cfg
         self.startup_kwargs = dict(ignore_duplicate=True, data_id=data_id)
 
+    @staticmethod
+    def fingerprint(s):
+        """
+        Builds a fingerprint of a column's values.  Columns with different fingerprints cannot be equal, columns with
+        the same fingerprint are almost certainly equal but will still be compared exactly.
+
+        Object columns are hashed using :func:`hash` rather than the string representations
+        :func:`pandas:pandas.util.hash_pandas_object` uses so that values which compare equal (EX: 1, 1.0 & True)
+        share a fingerprint, all missing values (None, NaN, NaT) share a single hash as well.
+
+        :param s: column
+        :type s: :class:`pandas:pandas.Series`
+        :return: tuple of (dtype, digest of the hashes of each value)
+        """
+        try:
+            if s.dtype.kind == "O":
+                nulls = s.isnull().values
+                vals = pd.Series(
+                    [0 if null else hash(v) for v, null in zip(s.values, nulls)],
+                    dtype="int64",
+                )
+            elif s.dtype.kind == "f":
+                vals = s + 0.0  # -0.0 & 0.0 hash differently
+            else:
+                vals = s
+            hashes = pd.util.hash_pandas_object(vals, index=False).values
+            return str(s.dtype), hashlib.sha1(hashes.tobytes()).hexdigest()
+        except (
+            TypeError
+        ):  # unhashable values (EX: lists) will be compared against every column of the same dtype
+            return str(s.dtype), None
+
     def check(self, df):
-        duplicate_columns = {}
         keep = self.cfg.get("keep") or "none"
         col_indexes = list(range(df.shape[1]))
         if keep == "last":
             col_indexes = col_indexes[::-1]
-        for x_idx, x in enumerate(col_indexes):
-            col = df.iloc[:, x]
-            col_duplicates = duplicate_columns.get(df.columns.values[x], [])
-            for y in col_indexes[x_idx + 1 :]:
-                other_col = df.iloc[:, y]
-                if col.equals(other_col):
-                    col_duplicates.append(df.columns.values[y])
-            duplicate_columns[df.columns.values[x]] = col_duplicates
+
+        # group columns by fingerprint so that only columns within the same group need to be compared
+        groups = {}
+        for x in col_indexes:
+            groups.setdefault(self.fingerprint(df.iloc[:, x]), []).append(x)
+
+        later_duplicates = {}
+        for positions in groups.values():
+            # since equality is transitive each column only needs to be compared to one member of each set of equal
+            # columns found so far
+            matches = []
+            for x in positions:
+                col = df.iloc[:, x]
+                match = next((m for m in matches if col.equals(df.iloc[:, m[0]])), None)
+                if match is None:
+                    matches.append([x])
+                else:
+                    match.append(x)
+            for match in matches:
+                for i, x in enumerate(match):
+                    later_duplicates[x] = match[i + 1 :]
+
+        names = df.columns.values
+        duplicate_columns = {}
+        for x in col_indexes:
+            col_duplicates = duplicate_columns.get(names[x], [])
+            col_duplicates += [names[y] for y in later_duplicates[x]]
+            duplicate_columns[names[x]] = col_duplicates
         return {k: v for k, v in duplicate_columns.items() if len(v) > 0}
 
     def remove(self, df):
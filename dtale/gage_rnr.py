@@ -2,7 +2,6 @@
 from enum import Enum
 import numpy as np
 import math
-import scipy.stats as stats
 
 
 class Component(Enum):
@@ -270,6 +269,8 @@ class GageRnR(Statistics):
 
     def calculate_p(self, dof, F):
         """Calculate P-Values."""
+        import scipy.stats as stats
+
         P = dict()
 
         P[Component.OPERATOR] = stats.f.sf(
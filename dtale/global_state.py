@@ -1,10 +1,19 @@
+import copy
 import io
 import pickle
 import string
 import inspect
+import os
+import threading
+import uuid
 
+from collections import OrderedDict
+from contextlib import closing
 from logging import getLogger
+
+import pandas as pd
 from six import PY3
+from six.moves.urllib.parse import quote
 
 from dtale.utils import dict_merge, format_data
 
@@ -37,11 +46,14 @@ APP_SETTINGS = {
     "enable_custom_filters": False,
     "enable_web_uploads": False,
     "hide_row_expanders": False,
+    "sketch_stats": False,
+    "pps_workers": None,
+    "column_builder_workers": None,
 }
 
 AUTH_SETTINGS = {"active": False, "username": None, "password": None}
 
-CHART_SETTINGS = {"scatter_points": 15000, "3d_points": 40000}
+CHART_SETTINGS = {"scatter_points": 15000, "3d_points": 40000, "downsample_width": 1000}
 
 
 class DtaleInstance(object):
@@ -54,6 +66,8 @@ class DtaleInstance(object):
     _settings = None
     _name = ""
     _rows = 0
+    _data_version = 0
+    _data_token = None
 
     def __init__(self, data):
         self._data = data
@@ -105,6 +119,15 @@ class DtaleInstance(object):
     def settings(self):
         return self._settings
 
+    @property
+    def data_version(self):
+        return self._data_version
+
+    @property
+    def data_token(self):
+        # unlike data_version (a per-instance counter) this is unique to each write of the data across processes
+        return self._data_token or str(self._data_version)
+
     @property
     def is_xarray_dataset(self):
         if self._dataset is not None:
@@ -147,8 +170,20 @@ class DtaleInstance(object):
     def settings(self, settings):
         self._settings = settings
 
+    @data_version.setter
+    def data_version(self, data_version):
+        self._data_version = data_version
+
+    @data_token.setter
+    def data_token(self, data_token):
+        self._data_token = data_token
+
 
 LARGE_ARCTICDB = 1000000
+CORRELATIONS_CACHE_SIZE = 10
+SORT_CACHE_SIZE = 5
+CHART_CACHE_SIZE = 50
+CHART_CACHE_BYTES = 100 * 1024 * 1024
 
 
 def get_num_rows(lib, symbol):
@@ -390,6 +425,301 @@ def safe_loads(data):
     return RestrictedUnpickler(io.BytesIO(data)).load()
 
 
+FRAME_KEY_PREFIX = "__dtale_frame__"
+ARROW_HEADER = b"arrow:"
+PICKLE_HEADER = b"pickle:"
+
+
+def build_frame_key(key, version=""):
+    return "{}|{}|{}".format(FRAME_KEY_PREFIX, key, version)
+
+
+def is_frame_key(key):
+    return str(key).startswith(FRAME_KEY_PREFIX)
+
+
+def build_arrow_table(df):
+    """
+    Convert a dataframe to a :class:`pyarrow.Table` if pyarrow is installed and Arrow can faithfully represent the
+    dataframe's data types & index, otherwise return None.  Rather than converting the whole table back to pandas,
+    only an empty table with the same schema is converted to check the data types survive (EX: object columns of
+    numbers would come back as numbers) and nested types (object columns of lists or dicts) are rejected.
+    """
+    try:
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(df)
+        if any(pa.types.is_nested(field.type) for field in table.schema):
+            return None
+        roundtrip = table.schema.empty_table().to_pandas()
+        if (
+            len(roundtrip.dtypes) == len(df.dtypes)
+            and all(
+                _same_arrow_dtype(dtype, roundtrip_dtype)
+                for dtype, roundtrip_dtype in zip(df.dtypes, roundtrip.dtypes)
+            )
+            and _same_arrow_dtype(df.index.dtype, roundtrip.index.dtype)
+            and list(roundtrip.index.names) == list(df.index.names)
+        ):
+            return table
+    except BaseException:
+        pass
+    return None
+
+
+def _same_arrow_dtype(dtype, roundtrip_dtype):
+    # the categories of an empty table are empty so only the type & ordering of categoricals can be compared
+    if isinstance(dtype, pd.CategoricalDtype):
+        return (
+            isinstance(roundtrip_dtype, pd.CategoricalDtype)
+            and dtype.ordered == roundtrip_dtype.ordered
+        )
+    return dtype == roundtrip_dtype
+
+
+def serialize_frame(df):
+    """
+    Serialize a dataframe to bytes.  If pyarrow is installed the dataframe will be written in Arrow's IPC streaming
+    format, otherwise (or if Arrow cannot faithfully represent the dataframe's data types) it will be pickled.
+    """
+    table = build_arrow_table(df)
+    if table is not None:
+        import pyarrow as pa
+
+        sink = pa.BufferOutputStream()
+        writer = pa.ipc.new_stream(sink, table.schema)
+        writer.write_table(table)
+        writer.close()
+        return ARROW_HEADER + sink.getvalue().to_pybytes()
+    return PICKLE_HEADER + pickle.dumps(df)
+
+
+def deserialize_frame(data):
+    """Deserialize bytes built by :meth:`dtale.global_state.serialize_frame` back to a dataframe."""
+    if data.startswith(ARROW_HEADER):
+        import pyarrow as pa
+
+        reader = pa.ipc.open_stream(pa.py_buffer(data[len(ARROW_HEADER) :]))
+        return reader.read_all().to_pandas()
+    return safe_loads(data[len(PICKLE_HEADER) :])
+
+
+class DtaleFrameSplittingStore(DtaleBaseStore):
+    """
+    Base class for persistent stores which keeps the dataframe of each :class:`dtale.global_state.DtaleInstance` in
+    its own blob keyed by the instance's data token.  The rest of the instance (settings, dtypes, history...) is
+    pickled under the data_id on its own so updating it doesn't require re-serializing the dataframe.  A dataframe
+    blob is only written when a new version of the data is saved.  Tokens are unique to each write of the data, so
+    processes sharing the store never mistake another process's data for their own.  The token of the blob an
+    instance points to is recorded alongside its metadata so writes only ever look up the one key they replace.
+
+    Subclasses must implement _get_raw, _set_raw, _del_raw, _has_raw & _raw_keys.  By default dataframes are saved
+    within the same key/value store, subclasses can change that by overriding _read_frame, _write_frame &
+    _delete_frame.
+    """
+
+    def _frame_cache(self):
+        if not hasattr(self, "_frames"):
+            self._frames = {}
+        return self._frames
+
+    def _stored_frame_token(self, key):
+        raw = self._get_raw(key)
+        if raw is None:
+            return None
+        return getattr(safe_loads(raw), "_frame_token", None)
+
+    def _read_frame(self, key, version):
+        raw = self._get_raw(build_frame_key(key, version))
+        return None if raw is None else deserialize_frame(raw)
+
+    def _write_frame(self, key, version, frame):
+        self._set_raw(build_frame_key(key, version), serialize_frame(frame))
+
+    def _delete_frame(self, key, version):
+        try:
+            self._del_raw(build_frame_key(key, version))
+        except KeyError:  # another process may have already removed it
+            pass
+
+    def _load_frame(self, key, version):
+        cached = self._frame_cache().get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        frame = self._read_frame(key, version)
+        if frame is not None:
+            self._frame_cache()[key] = (version, frame)
+        return frame
+
+    def get(self, key):
+        key = str(key)
+        raw = self._get_raw(key)
+        if raw is None:
+            return None
+        value = safe_loads(raw)
+        frame_token = getattr(value, "_frame_token", None)
+        if isinstance(value, DtaleInstance) and frame_token is not None:
+            value._data = self._load_frame(key, frame_token)
+        return value
+
+    def __setitem__(self, key, value):
+        key = str(key)
+        if not isinstance(value, DtaleInstance):
+            self._set_raw(key, pickle.dumps(value))
+            return
+        stored_token = self._stored_frame_token(key)
+        frame_token = None
+        if value._data is None:
+            self._frame_cache().pop(key, None)
+        else:
+            frame_token = value.data_token
+            if frame_token != stored_token:
+                self._write_frame(key, frame_token, value._data)
+            self._frame_cache()[key] = (frame_token, value._data)
+        value = copy.copy(value)
+        value._data = None
+        value._frame_token = frame_token
+        self._set_raw(key, pickle.dumps(value))
+        # the previous blob is only dropped once nothing points to it anymore
+        if stored_token is not None and stored_token != frame_token:
+            self._delete_frame(key, stored_token)
+
+    def __delitem__(self, key):
+        key = str(key)
+        stored_token = self._stored_frame_token(key)
+        if stored_token is not None:
+            self._delete_frame(key, stored_token)
+        self._frame_cache().pop(key, None)
+        self._del_raw(key)
+
+    def __contains__(self, key):
+        return not is_frame_key(key) and self._has_raw(str(key))
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def keys(self):
+        return [k for k in self._raw_keys() if not is_frame_key(k)]
+
+    def to_dict(self):
+        return {k: self.get(k) for k in self.keys()}
+
+    def items(self):
+        return self.to_dict().items()
+
+    def __len__(self):
+        return len(self.keys())
+
+
+class SafeShelfStore(DtaleFrameSplittingStore):
+    """DBM-backed store with safe deserialization."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def _open(self, flag="r"):
+        try:
+            import dbm
+        except ImportError:
+            import anydbm as dbm  # Python 2
+
+        return closing(dbm.open(self.path, flag))
+
+    def _get_raw(self, key):
+        with self._open() as db:
+            return db.get(key.encode())
+
+    def _set_raw(self, key, value):
+        with self._open(flag="c") as db:
+            db[key.encode()] = value
+
+    def _del_raw(self, key):
+        with self._open(flag="w") as db:
+            del db[key.encode()]
+
+    def _has_raw(self, key):
+        with self._open() as db:
+            return key.encode() in db
+
+    def _raw_keys(self):
+        with self._open() as db:
+            return [k.decode() for k in db.keys()]
+
+    def clear(self):
+        with self._open(flag="n"):
+            pass
+        self._frame_cache().clear()
+
+
+class DtaleArrowStore(SafeShelfStore):
+    """
+    DBM-backed store which saves each dataframe to its own uncompressed Arrow IPC (Feather V2) file.  Those files are
+    memory-mapped when they're read so numeric columns are zero-copy views over the OS page cache, which is shared by
+    every process (EX: gunicorn workers) reading the same data.  Dataframes Arrow can't represent faithfully are
+    pickled instead.
+    """
+
+    ARROW_EXT = ".arrow"
+    PICKLE_EXT = ".pkl"
+
+    def __init__(self, path):
+        super(DtaleArrowStore, self).__init__(path)
+        self.frames_dir = "{}_frames".format(path)
+        if not os.path.exists(self.frames_dir):
+            os.makedirs(self.frames_dir)
+
+    def _frame_prefix(self, key):
+        return "{}_".format(quote(key, safe=""))
+
+    def _frame_path(self, key, version, ext):
+        return os.path.join(
+            self.frames_dir, "{}{}{}".format(self._frame_prefix(key), version, ext)
+        )
+
+    def _read_frame(self, key, version):
+        import pyarrow.feather as feather
+
+        path = self._frame_path(key, version, self.ARROW_EXT)
+        if os.path.exists(path):
+            table = feather.read_table(path, memory_map=True)
+            return table.to_pandas(split_blocks=True)
+        path = self._frame_path(key, version, self.PICKLE_EXT)
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                return safe_loads(f.read())
+        return None
+
+    def _write_frame(self, key, version, frame):
+        import pyarrow.feather as feather
+
+        table = build_arrow_table(frame)
+        ext = self.PICKLE_EXT if table is None else self.ARROW_EXT
+        path = self._frame_path(key, version, ext)
+        tmp_path = "{}.tmp".format(path)
+        if table is not None:
+            feather.write_feather(table, tmp_path, compression="uncompressed")
+        else:
+            with open(tmp_path, "wb") as f:
+                f.write(pickle.dumps(frame))
+        # rename is atomic so other processes never map a partially written file
+        os.rename(tmp_path, path)
+
+    def _delete_frame(self, key, version):
+        for ext in [self.ARROW_EXT, self.PICKLE_EXT]:
+            try:
+                os.remove(self._frame_path(key, version, ext))
+            except OSError:  # missing or another process already removed it
+                pass
+
+    def clear(self):
+        super(DtaleArrowStore, self).clear()
+        for filename in os.listdir(self.frames_dir):
+            try:
+                os.remove(os.path.join(self.frames_dir, filename))
+            except OSError:
+                pass
+
+
 class DtaleArcticDB(DtaleBaseStore):
     """Interface allowing dtale to use 'arcticdb' databases for global data storage."""
 
@@ -487,6 +817,15 @@ class DefaultStore(object):
     def __init__(self):
         self._data_store = DtaleBaseStore()
         self._data_names = dict()
+        self._filter_cache = dict()
+        self._filter_masks = dict()
+        self._column_stats = dict()
+        self._correlations_cache = dict()
+        self._sort_cache = dict()
+        self._nullity_cache = dict()
+        self._chart_cache = OrderedDict()
+        self._chart_cache_bytes = 0
+        self._chart_cache_lock = threading.Lock()
 
     # Use int for data_id for easier sorting
     def build_data_id(self):
@@ -550,8 +889,19 @@ class DefaultStore(object):
         self._data_store[data_id] = new_data
         return data_id
 
-    def get_data(self, data_id, **kwargs):
-        return self.get_data_inst(data_id).load_data(**kwargs)
+    def get_data(self, data_id, writeable=False, **kwargs):
+        """
+        :param writeable: if true, read-only columns (EX: memory-mapped by :class:`dtale.global_state.DtaleArrowStore`)
+                          are replaced with copies so the data can be updated in-place (EX: editing a cell)
+        :type writeable: bool, optional
+        """
+        data = self.get_data_inst(data_id).load_data(**kwargs)
+        if writeable and data is not None:
+            from dtale.pandas_util import ensure_writeable
+
+            for col in data.columns.unique():
+                ensure_writeable(data, col)
+        return data
 
     def get_data_id_by_name(self, data_name):
         data_id = next(
@@ -594,14 +944,135 @@ class DefaultStore(object):
     def get_metadata(self, data_id):
         return self.get_data_inst(data_id).metadata
 
-    def set_data(self, data_id=None, val=None):
+    def get_data_version(self, data_id):
+        return self.get_data_inst(data_id).data_version
+
+    def get_data_token(self, data_id):
+        # caches of derived data are keyed on this rather than get_data_version so they can't be confused across
+        # processes sharing a redis/shelve store
+        return self.get_data_inst(data_id).data_token
+
+    def get_filter_cache(self, data_id):
+        return self._filter_cache.get(str(data_id))
+
+    def set_filter_cache(self, data_id, val):
+        self._filter_cache[str(data_id)] = val
+
+    def get_filter_masks(self, data_id):
+        return self._filter_masks.get(str(data_id)) or {}
+
+    def set_filter_masks(self, data_id, val):
+        self._filter_masks[str(data_id)] = val
+
+    def get_column_stats(self, data_id, column=None):
+        """
+        Statistics are cached along with the token of the data they were built from (see
+        :attr:`dtale.global_state.DtaleInstance.data_token`) so ones built before another process saved new data are
+        treated as missing.  If no column is specified then a dictionary of every valid cached column is returned,
+        which only requires loading the data's token once.
+        """
+        token = self.get_data_inst(data_id).data_token
+        cached = self._column_stats.get(str(data_id), {})
+        if column is None:
+            return {c: stats for c, (t, stats) in cached.items() if t == token}
+        entry = cached.get(column)
+        return entry[1] if entry is not None and entry[0] == token else None
+
+    def set_column_stats(self, data_id, column, val):
+        token = self.get_data_inst(data_id).data_token
+        self._column_stats.setdefault(str(data_id), {})[column] = (token, val)
+
+    def get_correlations_cache(self, data_id, key):
+        return self._correlations_cache.get(str(data_id), {}).get(key)
+
+    def set_correlations_cache(self, data_id, key, val):
+        cache = self._correlations_cache.setdefault(str(data_id), {})
+        cache.pop(key, None)
+        # only hold on to the most recently built matrices (EX: for a handful of different filters)
+        while len(cache) >= CORRELATIONS_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+        cache[key] = val
+
+    def get_sort_cache(self, data_id, key):
+        return self._sort_cache.get(str(data_id), {}).get(key)
+
+    def set_sort_cache(self, data_id, key, val):
+        cache = self._sort_cache.setdefault(str(data_id), {})
+        cache.pop(key, None)
+        # only hold on to the permutations for the most recently used sorts
+        while len(cache) >= SORT_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+        cache[key] = val
+
+    def get_nullity_cache(self, data_id):
+        return self._nullity_cache.get(str(data_id))
+
+    def set_nullity_cache(self, data_id, val):
+        # only the bitmap of the current version of the data is kept (see dtale.nullity.load_nullity)
+        self._nullity_cache[str(data_id)] = val
+
+    def get_chart_cache(self, data_id, key):
+        with self._chart_cache_lock:
+            cache_key = (str(data_id), key)
+            entry = self._chart_cache.pop(cache_key, None)
+            if entry is None:
+                return None
+            self._chart_cache[cache_key] = entry  # mark as most recently used
+            return entry[0]
+
+    def set_chart_cache(self, data_id, key, val, size=0):
+        with self._chart_cache_lock:
+            cache_key = (str(data_id), key)
+            existing = self._chart_cache.pop(cache_key, None)
+            if existing is not None:
+                self._chart_cache_bytes -= existing[1]
+            self._chart_cache[cache_key] = (val, size)
+            self._chart_cache_bytes += size
+            # evict the least recently used charts (across all data) once either limit has been exceeded
+            while len(self._chart_cache) > 1 and (
+                len(self._chart_cache) > CHART_CACHE_SIZE
+                or self._chart_cache_bytes > CHART_CACHE_BYTES
+            ):
+                _, (_, evicted_size) = self._chart_cache.popitem(last=False)
+                self._chart_cache_bytes -= evicted_size
+
+    def _drop_chart_cache(self, data_id=None):
+        with self._chart_cache_lock:
+            for cache_key in list(self._chart_cache):
+                if data_id is None or cache_key[0] == data_id:
+                    _, size = self._chart_cache.pop(cache_key)
+                    self._chart_cache_bytes -= size
+
+    def set_data(self, data_id=None, val=None, changed_columns=None):
         if data_id is None:
             data_id = self.new_data_inst()
         data_id = str(data_id)
-        if data_id not in self._data_store.keys():
+        if data_id not in self._data_store:
             data_id = self.new_data_inst(data_id)
         data_inst = self.get_data_inst(data_id)
         data_inst.data = val
+        # any change to the data invalidates filtered views built from previous versions of it
+        data_inst.data_version += 1
+        prev_token = data_inst.data_token
+        data_inst.data_token = uuid.uuid4().hex
+        self._filter_cache.pop(data_id, None)
+        self._filter_masks.pop(data_id, None)
+        self._correlations_cache.pop(data_id, None)
+        self._sort_cache.pop(data_id, None)
+        self._nullity_cache.pop(data_id, None)
+        self._drop_chart_cache(data_id)
+        # statistics are only dropped for the columns we've been told were altered, if we don't know which columns
+        # were altered then all of them need to be rebuilt
+        if changed_columns is None:
+            self._column_stats.pop(data_id, None)
+        else:
+            column_stats = self._column_stats.get(data_id, {})
+            for col in changed_columns:
+                column_stats.pop(col, None)
+            # statistics of the columns which weren't altered carry over to the new version of the data
+            for col, (token, stats) in list(column_stats.items()):
+                if token == prev_token:
+                    column_stats[col] = (data_inst.data_token, stats)
         self._data_store[data_id] = data_inst
 
     def set_dataset(self, data_id, val):
@@ -620,6 +1091,8 @@ class DefaultStore(object):
         data_id = str(data_id)
         data_inst = self.get_data_inst(data_id)
         data_inst.dtypes = val
+        # correlations are only built for the columns whose dtypes make them eligible
+        self._correlations_cache.pop(data_id, None)
         self._data_store[data_id] = data_inst
 
     def set_name(self, data_id, val):
@@ -637,6 +1110,13 @@ class DefaultStore(object):
         data_id = str(data_id)
         data_inst = self.get_data_inst(data_id)
         data_inst.context_variables = val
+        # context variables can be referenced by queries so they version the data as well
+        data_inst.data_version += 1
+        self._filter_cache.pop(data_id, None)
+        self._filter_masks.pop(data_id, None)
+        self._correlations_cache.pop(data_id, None)
+        self._sort_cache.pop(data_id, None)
+        self._drop_chart_cache(data_id)
         self._data_store[data_id] = data_inst
 
     def set_settings(self, data_id, val):
@@ -659,6 +1139,13 @@ class DefaultStore(object):
 
     def delete_instance(self, data_id):
         data_id = str(data_id)
+        self._filter_cache.pop(data_id, None)
+        self._filter_masks.pop(data_id, None)
+        self._column_stats.pop(data_id, None)
+        self._correlations_cache.pop(data_id, None)
+        self._sort_cache.pop(data_id, None)
+        self._nullity_cache.pop(data_id, None)
+        self._drop_chart_cache(data_id)
         instance = self._data_store.get(data_id)
         if instance:
             if instance.name:
@@ -674,6 +1161,13 @@ class DefaultStore(object):
     def clear_store(self):
         self._data_store.clear()
         self._data_names.clear()
+        self._filter_cache.clear()
+        self._filter_masks.clear()
+        self._column_stats.clear()
+        self._correlations_cache.clear()
+        self._sort_cache.clear()
+        self._nullity_cache.clear()
+        self._drop_chart_cache()
 
 
 """
@@ -911,68 +1405,35 @@ def use_shelve_store(directory):
     """
     from os.path import join
 
-    try:
-        import dbm
-    except ImportError:
-        import anydbm as dbm  # Python 2
-
-    from contextlib import closing
-
-    class SafeShelfStore(DtaleBaseStore):
-        """DBM-backed store with safe deserialization."""
-
-        def __init__(self, path):
-            self.path = path
-
-        def _open(self, flag="r"):
-            return closing(dbm.open(self.path, flag))
-
-        def __contains__(self, key):
-            with self._open() as db:
-                return str(key).encode() in db
-
-        def get(self, key):
-            with self._open() as db:
-                raw = db.get(str(key).encode())
-                if raw is None:
-                    return None
-                return safe_loads(raw)
-
-        def __setitem__(self, key, value):
-            with self._open(flag="c") as db:
-                db[str(key).encode()] = pickle.dumps(value)
-
-        def __delitem__(self, key):
-            with self._open(flag="w") as db:
-                del db[str(key).encode()]
-
-        def __iter__(self):
-            with self._open() as db:
-                return iter([k.decode() for k in db.keys()])
+    def create_shelf(name):
+        file_path = join(directory, name)
+        return SafeShelfStore(file_path)
 
-        def clear(self):
-            with self._open(flag="n"):
-                pass
+    use_store(SafeShelfStore, create_shelf)
 
-        def to_dict(self):
-            with self._open() as db:
-                return {k.decode(): safe_loads(db[k]) for k in db.keys()}
 
-        def items(self):
-            return self.to_dict().items()
+def use_arrow_store(directory):
+    """
+    Configure dtale to use a persistent global data store which saves each dataframe as an uncompressed Arrow
+    (Feather V2) file that is memory-mapped when read.  Numeric columns are zero-copy views over the OS page cache,
+    so multiple processes (EX: gunicorn workers) serving the same data share one copy of it in memory.
 
-        def keys(self):
-            return self.to_dict().keys()
+    :param directory: directory that the db & arrow files will be stored in
+    :type directory: str
+    :return: None
+    """
+    from os.path import join
 
-        def __len__(self):
-            with self._open() as db:
-                return len(db.keys())
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise Exception("pyarrow must be installed")
 
-    def create_shelf(name):
+    def create_arrow_store(name):
         file_path = join(directory, name)
-        return SafeShelfStore(file_path)
+        return DtaleArrowStore(file_path)
 
-    use_store(SafeShelfStore, create_shelf)
+    use_store(DtaleArrowStore, create_arrow_store)
 
 
 def use_redis_store(directory, *args, **kwargs):
@@ -1007,47 +1468,33 @@ def use_redis_store(directory, *args, **kwargs):
 
     _UDS.__init__ = _patched_uds_init
 
-    class DtaleRedis(DtaleBaseStore, Redis):
+    class DtaleRedis(DtaleFrameSplittingStore, Redis):
         """Wrapper class around Redis() to make it work as a global data store in dtale."""
 
         def __init__(self, file_path, *args, **kwargs):
             super(Redis, self).__init__(file_path, *args, **kwargs)
 
-        def __setitem__(self, key, value):
-            key = str(key)
-            self.set(key, value)
+        def _get_raw(self, key):
+            return super(Redis, self).get(key)
 
-        def __delitem__(self, key):
-            key = str(key)
-            super(Redis, self).__delitem__(str(key))
+        def _set_raw(self, key, value):
+            return super(Redis, self).set(key, value)
 
-        def __contains__(self, key):
-            key = str(key)
-            return super(Redis, self).__contains__(str(key))
+        def _del_raw(self, key):
+            super(Redis, self).__delitem__(key)
 
-        def get(self, name, *args, **kwargs):
-            value = super(Redis, self).get(name, *args, **kwargs)
-            if value is not None:
-                return safe_loads(value)
+        def _has_raw(self, key):
+            return super(Redis, self).__contains__(key)
 
-        def keys(self):
-            return [str(k) for k in super(Redis, self).keys()]
+        def _raw_keys(self):
+            return [k.decode("utf-8") for k in super(Redis, self).keys()]
 
         def set(self, name, value, *args, **kwargs):
-            value = pickle.dumps(value)
-            return super(Redis, self).set(name, value, *args, **kwargs)
+            self[name] = value
 
         def clear(self):
             self.flushdb()
-
-        def to_dict(self):
-            return {k.decode("utf-8"): self.get(k) for k in super(Redis, self).keys()}
-
-        def items(self):
-            return self.to_dict().items()
-
-        def __len__(self):
-            return len(self.keys())
+            self._frame_cache().clear()
 
     def create_redis(name):
         file_path = join(directory, name + ".db")
@@ -0,0 +1,154 @@
+import csv
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+from six import string_types
+
+CSV_CHUNK_SIZE = 250000  # number of rows parsed at a time
+SNIFF_SAMPLE_SIZE = 65536  # number of bytes used to detect the delimiter of a CSV
+SNIFF_DELIMITERS = ",\t;|:"
+
+
+def sniff_delimiter(path_or_buf, default=","):
+    """
+    Detects the delimiter of a CSV from a sample of its first lines so it can be parsed using the C engine rather than
+    passing `sep=None`, which forces pandas to use the python engine.
+
+    :param path_or_buf: path to, or buffer containing, a CSV
+    :type path_or_buf: str or file-like
+    :param default: delimiter to use if one cannot be detected
+    :type default: str, optional
+    :return: delimiter
+    :rtype: str
+    """
+    if isinstance(path_or_buf, string_types):
+        with open(path_or_buf, "rb") as f:
+            sample = f.read(SNIFF_SAMPLE_SIZE)
+    else:
+        position = path_or_buf.tell()
+        sample = path_or_buf.read(SNIFF_SAMPLE_SIZE)
+        path_or_buf.seek(position)
+    if isinstance(sample, bytes):
+        sample = sample.decode("utf-8", errors="ignore")
+    # the last line of the sample is most likely incomplete
+    if len(sample) == SNIFF_SAMPLE_SIZE and "\n" in sample:
+        sample = sample[: sample.rindex("\n")]
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=SNIFF_DELIMITERS).delimiter
+    except csv.Error:
+        return default
+
+
+def downcast_numerics(df):
+    """
+    Converts the numeric columns of a dataframe to the smallest dtypes which can hold their values without any loss
+    of information.  Integers are downcast to the smallest integer type containing their range and floats are only
+    converted to float32 if every value survives the round trip.
+
+    :param df: dataframe
+    :type df: :class:`pandas:pandas.DataFrame`
+    :rtype: :class:`pandas:pandas.DataFrame`
+    """
+    columns, changed = [], False
+    for i in range(len(df.columns)):
+        s = df.iloc[:, i]
+        if s.dtype.kind in "iu":
+            downcast = pd.to_numeric(s, downcast="integer")
+        elif s.dtype == np.float64:
+            downcast = s.astype(np.float32)
+            lossless = (downcast.astype(np.float64) == s) | s.isnull()
+            if not lossless.all():
+                downcast = s
+        else:
+            downcast = s
+        changed = changed or downcast.dtype != s.dtype
+        columns.append(downcast)
+    if not changed:
+        return df
+    return pd.concat(columns, axis=1)
+
+
+def combine_chunks(chunks):
+    """
+    Concatenates chunks of a dataframe.  If every chunk has a :class:`pandas:pandas.RangeIndex` the final index is
+    rebuilt so it runs across all the chunks rather than restarting with each one.
+    """
+    chunks = list(chunks)
+    if len(chunks) == 1:
+        return chunks[0]
+    ignore_index = all(isinstance(chunk.index, pd.RangeIndex) for chunk in chunks)
+    return pd.concat(chunks, ignore_index=ignore_index)
+
+
+def read_csv(path_or_buf, chunksize=None, downcast=False, **kwargs):
+    """
+    Loads a CSV using the C engine in chunks of rows so the memory used by the parser stays bounded regardless of
+    the size of the file.  If `sep` is None the delimiter will be detected from a sample of the file.  Multi-character
+    delimiters (which pandas treats as regular expressions) are only supported by the python engine.
+
+    :param path_or_buf: path to, or buffer containing, a CSV
+    :type path_or_buf: str or file-like
+    :param chunksize: number of rows parsed at a time
+    :type chunksize: int, optional
+    :param downcast: if True, each chunk will be passed to :meth:`dtale.ingestion.downcast_numerics`
+    :type downcast: bool, optional
+    :param kwargs: keyword arguments for :meth:`pandas:pandas.read_csv`
+    :rtype: :class:`pandas:pandas.DataFrame`
+    """
+    for sep_key in ["sep", "delimiter"]:
+        if sep_key in kwargs and kwargs[sep_key] is None:
+            kwargs.pop(sep_key)
+            kwargs["sep"] = sniff_delimiter(path_or_buf)
+    if "engine" not in kwargs:
+        sep = kwargs.get("sep", kwargs.get("delimiter"))
+        # the C engine only supports single character delimiters, anything else is treated as a regex
+        c_engine = sep is None or len(sep) == 1 or sep == r"\s+"
+        kwargs["engine"] = "c" if c_engine else "python"
+    reader = pd.read_csv(path_or_buf, chunksize=chunksize or CSV_CHUNK_SIZE, **kwargs)
+    return combine_chunks(
+        downcast_numerics(chunk) if downcast else chunk for chunk in reader
+    )
+
+
+def read_parquet(path, downcast=False, **kwargs):
+    """
+    Loads a parquet file.  When downcasting is requested & pyarrow is available the file is loaded one row-group at
+    a time so only one row-group is ever held at its original size.
+
+    :param path: path to, or buffer containing, a parquet file
+    :type path: str or file-like
+    :param downcast: if True, each row-group will be passed to :meth:`dtale.ingestion.downcast_numerics`
+    :type downcast: bool, optional
+    :param kwargs: keyword arguments for :meth:`pandas:pandas.read_parquet`
+    :rtype: :class:`pandas:pandas.DataFrame`
+    """
+    if not downcast or kwargs.get("engine") not in [None, "auto", "pyarrow"]:
+        return pd.read_parquet(path, **kwargs)
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        return downcast_numerics(pd.read_parquet(path, **kwargs))
+
+    parquet_file = pq.ParquetFile(path)
+    if not parquet_file.num_row_groups:
+        return parquet_file.read().to_pandas()
+    return combine_chunks(
+        downcast_numerics(parquet_file.read_row_group(i).to_pandas())
+        for i in range(parquet_file.num_row_groups)
+    )
+
+
+def save_upload(contents, suffix=""):
+    """
+    Writes an uploaded file (:class:`werkzeug:werkzeug.datastructures.FileStorage`) to a temporary file in chunks
+    rather than reading the whole upload into memory.  The caller is responsible for removing the file.
+
+    :return: path to the temporary file
+    :rtype: str
+    """
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    os.close(fd)
+    contents.save(path)
+    return path
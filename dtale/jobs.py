@@ -0,0 +1,300 @@
+import atexit
+import threading
+import time
+import traceback
+import uuid
+from logging import getLogger
+from multiprocessing.pool import ThreadPool
+
+from dtale.utils import estimate_size
+
+logger = getLogger(__name__)
+
+JOB_WORKERS = 4
+JOB_TTL = 600  # number of seconds the output of a job is kept after it has finished
+JOB_MAX_RESULTS = 100
+JOB_MAX_RESULT_BYTES = 100 * 1024 * 1024
+
+PENDING = "pending"
+RUNNING = "running"
+COMPLETE = "complete"
+ERROR = "error"
+CANCELLED = "cancelled"
+
+
+class JobCancelledException(Exception):
+    """Raised from within a job when :meth:`dtale.jobs.Job.update_progress` is called after it's been cancelled."""
+
+
+class JobFailedException(Exception):
+    """
+    Raised from within a job which has handled an error itself (EX: a route wrapped by
+    :meth:`dtale.views.exception_decorator`) so that it is still marked as failed.
+
+    :param error: description of the error
+    :type error: str
+    :param traceback: traceback of the error
+    :type traceback: str, optional
+    """
+
+    def __init__(self, error, traceback=None):
+        super(JobFailedException, self).__init__(error)
+        self.error = error
+        self.traceback = traceback
+
+
+class Job(object):
+    """
+    Container for the state of a function being executed in the background by :class:`dtale.jobs.JobManager`.
+
+    :param job_id: unique identifier of this job
+    :type job_id: str
+    :param name: description of the work being done (EX: the path of the request which submitted it)
+    :type name: str, optional
+    :param cancellable: whether the work checks for cancellation (by reporting its progress) once it's started
+    :type cancellable: bool, optional
+    """
+
+    def __init__(self, job_id, name=None, cancellable=True):
+        self.id = job_id
+        self.name = name
+        self.cancellable = cancellable
+        self.status = PENDING
+        self.progress = 0.0
+        self.message = None
+        self.result = None
+        self.error = None
+        self.traceback = None
+        self.created = time.time()
+        self.finished = None
+        self.size = 0
+        self._cancel_event = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    @property
+    def done(self):
+        return self.status in [COMPLETE, ERROR, CANCELLED]
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def update_progress(self, progress, message=None):
+        """
+        Update the completion percentage of this job.  This is also where cancellation takes effect, if the job has
+        been cancelled a :class:`dtale.jobs.JobCancelledException` will be raised.
+
+        :param progress: fraction of the work completed (between 0 & 1)
+        :type progress: float
+        :param message: description of the work currently being done
+        :type message: str, optional
+        """
+        if self.cancelled:
+            raise JobCancelledException("Job {} has been cancelled".format(self.id))
+        self.progress = min(max(float(progress), 0.0), 1.0)
+        if message is not None:
+            self.message = message
+
+    def to_dict(self):
+        return dict(
+            id=self.id,
+            name=self.name,
+            cancellable=self.cancellable,
+            status=self.status,
+            progress=self.progress,
+            message=self.message,
+            error=self.error,
+            traceback=self.traceback,
+        )
+
+
+class JobManager(object):
+    """
+    Executes functions in a bounded pool of background threads so long-running work doesn't have to hold an HTTP
+    connection open.  Jobs are kept in memory for `ttl` seconds after they finish so their output can be retrieved,
+    which means that when running under multiple processes (EX: gunicorn workers) the job must be polled from the
+    process that submitted it.  Once more than `max_results` jobs have finished, or their output exceeds
+    `max_result_bytes`, the jobs which finished first are dropped regardless of their `ttl`.
+
+    :param workers: maximum number of jobs to execute at the same time
+    :type workers: int, optional
+    :param ttl: number of seconds the output of a job is kept after it has finished
+    :type ttl: int, optional
+    :param max_results: maximum number of finished jobs to keep
+    :type max_results: int, optional
+    :param max_result_bytes: maximum (estimated) number of bytes of output of finished jobs to keep
+    :type max_result_bytes: int, optional
+    """
+
+    def __init__(
+        self,
+        workers=JOB_WORKERS,
+        ttl=JOB_TTL,
+        max_results=JOB_MAX_RESULTS,
+        max_result_bytes=JOB_MAX_RESULT_BYTES,
+    ):
+        self.workers = workers
+        self.ttl = ttl
+        self.max_results = max_results
+        self.max_result_bytes = max_result_bytes
+        self._jobs = {}
+        self._pool = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _get_pool(self):
+        # the threads are only started once the first job is submitted, callers must hold self._lock
+        if self._pool is None:
+            self._pool = ThreadPool(self.workers)
+        return self._pool
+
+    def _purge(self):
+        now = time.time()
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.done and now - job.finished > self.ttl
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+        # the output of the jobs which finished first is dropped once either limit has been exceeded
+        finished = sorted(
+            (job for job in self._jobs.values() if job.done), key=lambda j: j.finished
+        )
+        kept, total_bytes = len(finished), sum(job.size for job in finished)
+        for job in finished:
+            if kept <= self.max_results and total_bytes <= self.max_result_bytes:
+                break
+            del self._jobs[job.id]
+            kept, total_bytes = kept - 1, total_bytes - job.size
+
+    def _run(self, job, func, args, kwargs):
+        if job.cancelled:
+            job.finished = time.time()
+            job.status = CANCELLED
+            return
+        job.status = RUNNING
+        self._local.job = job
+        status = ERROR
+        try:
+            job.result = func(*args, **kwargs)
+            job.progress = 1.0
+            status = COMPLETE
+        except JobCancelledException:
+            status = CANCELLED
+        except JobFailedException as ex:
+            job.error = ex.error
+            job.traceback = ex.traceback
+        except BaseException as ex:
+            logger.exception(ex)
+            job.error = str(ex)
+            job.traceback = str(traceback.format_exc())
+        finally:
+            self._local.job = None
+            if job.cancelled:
+                status = CANCELLED
+                job.result = None
+            job.size = 0 if job.result is None else estimate_size(job.result)
+            # the status is updated last so anyone polling will only see a finished job once it's fully populated
+            job.finished = time.time()
+            job.status = status
+            with self._lock:
+                self._purge()
+
+    def submit(self, func, args=(), kwargs=None, name=None, cancellable=True):
+        """
+        Queue a function for execution in the background.
+
+        :param func: function to execute
+        :type func: func
+        :param args: positional arguments to pass to func
+        :type args: tuple, optional
+        :param kwargs: keyword arguments to pass to func
+        :type kwargs: dict, optional
+        :param name: description of the work being done
+        :type name: str, optional
+        :param cancellable: whether func reports its progress (which is where cancellation takes effect)
+        :type cancellable: bool, optional
+        :return: identifier of the job
+        :rtype: str
+        """
+        job = Job(str(uuid.uuid4()), name=name, cancellable=cancellable)
+        with self._lock:
+            self._purge()
+            self._jobs[job.id] = job
+            pool = self._get_pool()
+        pool.apply_async(self._run, (job, func, args, kwargs or {}))
+        return job.id
+
+    def get(self, job_id):
+        with self._lock:
+            self._purge()
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        """
+        Cancel a job.  Jobs which haven't started yet will never run, jobs which are running will stop the next time
+        they report their progress.  Jobs which never report their progress can't be cancelled.
+
+        :param job_id: identifier of the job
+        :type job_id: str
+        :return: True if the job exists, can be cancelled and had not already finished
+        :rtype: bool
+        """
+        job = self.get(job_id)
+        if job is None or job.done or not job.cancellable:
+            return False
+        job.cancel()
+        return True
+
+    def current_job(self):
+        return getattr(self._local, "job", None)
+
+    def clear(self):
+        with self._lock:
+            for job in self._jobs.values():
+                job.cancel()
+            self._jobs.clear()
+
+    def close(self):
+        self.clear()
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+
+_manager = JobManager()
+atexit.register(_manager.close)
+
+
+def submit(func, args=(), kwargs=None, name=None, cancellable=True):
+    return _manager.submit(
+        func, args=args, kwargs=kwargs, name=name, cancellable=cancellable
+    )
+
+
+def get_job(job_id):
+    return _manager.get(job_id)
+
+
+def cancel_job(job_id):
+    return _manager.cancel(job_id)
+
+
+def update_progress(progress, message=None):
+    """
+    Report the progress of the job being executed by the current thread.  If the current thread isn't executing a
+    job this does nothing, so it is safe to call from code which is also run synchronously.
+    """
+    job = _manager.current_job()
+    if job is not None:
+        job.update_progress(progress, message)
+
+
+def cleanup():
+    _manager.clear()
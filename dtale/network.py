@@ -0,0 +1,257 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+import dtale.global_state as global_state
+from dtale.utils import grid_columns, grid_formatter, json_float
+
+# approximate memory used by networkx for each node, edge & edge weight of a graph
+GRAPH_NODE_BYTES = 250
+GRAPH_EDGE_BYTES = 250
+GRAPH_WEIGHT_BYTES = 150
+
+
+class Network(object):
+    """
+    Edges of a network stored as arrays of integer node codes (built using :meth:`pandas:pandas.factorize`) along
+    with the analytics which can be derived from them.  The :class:`networkx:networkx.Graph` is only built the first
+    time something requires it.  Edges missing either of their nodes are ignored.
+
+    When the network is cached (see :meth:`dtale.network.load_network`) its entry is re-registered with its new size
+    once the graph has been built so the chart cache's memory bound accounts for it.
+
+    :param df: dataframe
+    :type df: :class:`pandas:pandas.DataFrame`
+    :param to_col: column containing the node each edge goes to
+    :type to_col: str
+    :param from_col: column containing the node each edge comes from
+    :type from_col: str
+    :param weight: column containing the weight of each edge
+    :type weight: str, optional
+    :param cache_key: data_id & key the network is stored under within the chart cache
+    :type cache_key: tuple, optional
+    """
+
+    def __init__(self, df, to_col, from_col, weight=None, cache_key=None):
+        self.to_col = to_col
+        self.from_col = from_col
+        self.weight = weight
+        nodes = pd.concat([df[to_col], df[from_col]], ignore_index=True)
+        try:
+            codes, labels = pd.factorize(nodes, sort=True)
+        except TypeError:  # unorderable node values
+            codes, labels = pd.factorize(nodes)
+        self.labels = np.asarray(labels, dtype=object)
+        valid = (codes[: len(df)] >= 0) & (codes[len(df) :] >= 0)
+        self.rows = np.flatnonzero(valid)
+        self.to = codes[: len(df)][valid]
+        self.frm = codes[len(df) :][valid]
+        self.weights = df[weight].values[valid] if weight else None
+        self._graph = None
+        self._analysis = None
+        self._cache_key = cache_key
+        # requests for the same network can arrive in parallel so the graph is only ever built once
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self):
+        weights = 0 if self.weights is None else self.weights.nbytes
+        total = self.rows.nbytes + self.to.nbytes + self.frm.nbytes + weights
+        if self._graph is not None:
+            edge_bytes = GRAPH_EDGE_BYTES + (GRAPH_WEIGHT_BYTES if self.weight else 0)
+            total += GRAPH_NODE_BYTES * self._graph.number_of_nodes()
+            total += edge_bytes * self._graph.number_of_edges()
+        return total
+
+    @property
+    def graph(self):
+        if self._graph is None:
+            with self._lock:
+                if self._graph is None:
+                    self._graph = self._build_graph()
+                    self._update_cache_size()
+        return self._graph
+
+    def _build_graph(self):
+        import networkx as nx
+
+        G = nx.Graph()
+        if self.weight:
+            G.add_weighted_edges_from(
+                zip(self.to.tolist(), self.frm.tolist(), self.weights.tolist())
+            )
+        else:
+            G.add_edges_from(zip(self.to.tolist(), self.frm.tolist()))
+        return G
+
+    def _update_cache_size(self):
+        if self._cache_key is None:
+            return
+        data_id, key = self._cache_key
+        # the entry may have been evicted (or its data replaced) while the graph was being built
+        if global_state.get_chart_cache(data_id, key) is self:
+            global_state.set_chart_cache(data_id, key, self, size=self.nbytes)
+
+    def degrees(self):
+        """
+        Degree of each node (indexed by node code) computed the same way as :meth:`networkx:networkx.Graph.degree`,
+        duplicate edges are only counted once and self-loops are counted twice.
+
+        :return: tuple of the degrees & the node codes in the order they were first seen
+        """
+        pairs = np.column_stack([self.to, self.frm])
+        pairs = np.unique(np.sort(pairs, axis=1), axis=0)
+        size = len(self.labels)
+        degrees = np.bincount(pairs[:, 0], minlength=size) + np.bincount(
+            pairs[:, 1], minlength=size
+        )
+        order = pd.unique(np.column_stack([self.to, self.frm]).ravel())
+        return degrees, order
+
+    def analysis(self):
+        import networkx as nx
+
+        if self._analysis is not None:
+            return self._analysis
+
+        degrees, order = self.degrees()
+        node_degrees = degrees[order]
+        most_connected = order[np.argmax(node_degrees)]
+        max_edge, min_edge, avg_weight = (None, None, None)
+        if self.weight:
+            sorted_edges = sorted(
+                self.graph.edges(data=True), key=lambda x: x[2]["weight"], reverse=True
+            )
+            max_edge, min_edge = sorted_edges[0], sorted_edges[-1]
+            avg_weight = pd.Series(self.weights).mean()
+
+        def build_edge_desc(edge):
+            if edge is None:
+                return None
+            return "{} (source: {}, target: {})".format(
+                edge[-1]["weight"], self.labels[edge[0]], self.labels[edge[1]]
+            )
+
+        self._analysis = {
+            "node_ct": len(order),
+            "triangle_ct": int(sum(nx.triangles(self.graph).values()) / 3),
+            "most_connected_node": "{} (Connections: {})".format(
+                self.labels[most_connected], degrees[most_connected]
+            ),
+            "leaf_ct": int((node_degrees == 1).sum()),
+            "edge_ct": int(node_degrees.sum()),
+            "max_edge": build_edge_desc(max_edge),
+            "min_edge": build_edge_desc(min_edge),
+            "avg_weight": json_float(avg_weight),
+        }
+        return self._analysis
+
+    def shortest_path(self, start, end):
+        import networkx as nx
+
+        lookup = pd.Index(self.labels)
+
+        def find_node(label, desc):
+            if label in lookup:
+                return lookup.get_loc(label)
+            # node values are passed as strings so fall back to comparing them as strings
+            matches = np.flatnonzero(lookup.astype("str") == label)
+            if not len(matches):
+                raise nx.NodeNotFound("{} {} is not in G".format(desc, label))
+            return matches[0]
+
+        path = nx.shortest_path(
+            self.graph,
+            source=find_node(start, "Source"),
+            target=find_node(end, "Target"),
+        )
+        return self.labels[path].tolist()
+
+    def build_data(self, df, group=None, color=None, columnar=False):
+        """
+        Builds the nodes, edges & groups displayed by the network viewer.  Node ids start at 1 and follow the sorted
+        order of the node values.
+
+        :param df: dataframe the network was built from
+        :type df: :class:`pandas:pandas.DataFrame`
+        :param group: column containing the group of each "from" node
+        :type group: str, optional
+        :param color: column containing the color of each "from" node
+        :type color: str, optional
+        :param columnar: if True the nodes & edges are returned as dictionaries of lists rather than lists of
+                         dictionaries
+        :type columnar: bool, optional
+        :rtype: dict
+        """
+        node_ids = np.arange(1, len(self.labels) + 1)
+        # nodes are only ever part of the output if they belong to a complete edge
+        used = np.zeros(len(self.labels), dtype=bool)
+        used[self.to] = True
+        used[self.frm] = True
+
+        def build_mapping(col, default):
+            values = np.full(len(self.labels), default, dtype=object)
+            if col:
+                mapping = pd.Series(
+                    df[col].astype("str").values[self.rows], index=self.frm
+                )
+                mapping = mapping[~mapping.index.duplicated(keep="last")]
+                values[mapping.index.values] = mapping.values
+            return values[used]
+
+        groups = build_mapping(group, "N/A")
+        nodes = dict(
+            id=node_ids[used].tolist(),
+            label=self.labels[used].tolist(),
+            group=groups.tolist(),
+            color=build_mapping(color, None).tolist(),
+        )
+        groups = pd.Series(nodes["id"], index=groups)
+        groups = groups[~groups.index.duplicated(keep="last")].to_dict()
+
+        edges = pd.DataFrame(dict(to=node_ids[self.to], **{"from": node_ids[self.frm]}))
+        if self.weight:
+            edges.loc[:, "value"] = self.weights
+        edge_f = grid_formatter(grid_columns(edges), nan_display="nan")
+        edges = edge_f.format_lists(edges)
+
+        if not columnar:
+            nodes = [dict(zip(nodes, node)) for node in zip(*nodes.values())]
+            edges = [dict(zip(edges, edge)) for edge in zip(*edges.values())]
+        return dict(nodes=nodes, edges=edges, groups=groups)
+
+
+def load_network(data_id, to_col, from_col, weight=None):
+    """
+    Loads the :class:`dtale.network.Network` of the data associated with data_id, it is cached per version of the data
+    and to, from & weight columns.
+
+    :param data_id: identifier of data
+    :type data_id: str
+    :param to_col: column containing the node each edge goes to
+    :type to_col: str
+    :param from_col: column containing the node each edge comes from
+    :type from_col: str
+    :param weight: column containing the weight of each edge
+    :type weight: str, optional
+    :rtype: :class:`dtale.network.Network`
+    """
+    key = (
+        "network",
+        global_state.get_data_token(data_id),
+        to_col,
+        from_col,
+        weight or None,
+    )
+    network = global_state.get_chart_cache(data_id, key)
+    if network is None:
+        network = Network(
+            global_state.get_data(data_id),
+            to_col,
+            from_col,
+            weight,
+            cache_key=(data_id, key),
+        )
+        global_state.set_chart_cache(data_id, key, network, size=network.nbytes)
+    return network
@@ -0,0 +1,215 @@
+import json
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+
+import dtale.global_state as global_state
+
+try:
+    from pandas.arrays import BooleanArray
+except ImportError:  # pragma: no cover
+    BooleanArray = None
+
+MISSINGNO_CHARTS = ["matrix", "bar", "heatmap", "dendrogram"]
+# missingno draws its matrix 10 inches tall so anything beyond this many rows can't be distinguished anyway
+MATRIX_ROWS = 1000
+AGGREGATE = "aggregate"
+SAMPLE = "sample"
+
+
+def build_nullity(df):
+    """
+    Builds the null-indicator bitmap of a dataframe. Each column is packed to one bit per row using
+    :meth:`numpy:numpy.packbits` so it's an eighth of the size of the boolean mask returned by
+    :meth:`pandas:pandas.DataFrame.isnull`.
+
+    :param df: dataframe
+    :type df: :class:`pandas:pandas.DataFrame`
+    :return: dictionary of the packed bits (rows x columns), the row count & the column names
+    :rtype: dict
+    """
+    rows = len(df)
+    bits = np.zeros(((rows + 7) // 8, len(df.columns)), dtype=np.uint8)
+    # packing one column at a time keeps us from ever materializing the full boolean mask
+    for i in range(len(df.columns)):
+        bits[:, i] = np.packbits(df.iloc[:, i].isnull().values)
+    return dict(bits=bits, rows=rows, columns=list(df.columns))
+
+
+def load_nullity(data_id):
+    """
+    Loads the null-indicator bitmap for the current version of the data associated with data_id, building it if it
+    hasn't been built already.  The bitmap is kept in its own per-data_id cache rather than the chart cache so it
+    isn't evicted by (or doesn't evict) rendered charts.
+
+    :param data_id: identifier of data
+    :type data_id: str
+    :return: output of :meth:`dtale.nullity.build_nullity`
+    :rtype: dict
+    """
+    version = global_state.get_data_token(data_id)
+    cached = global_state.get_nullity_cache(data_id)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    nullity = build_nullity(global_state.get_data(data_id))
+    global_state.set_nullity_cache(data_id, (version, nullity))
+    return nullity
+
+
+def unpack_nullity(nullity):
+    return np.unpackbits(nullity["bits"], axis=0)[: nullity["rows"]].astype(bool)
+
+
+def reduce_rows(mask, rows, sampling=SAMPLE):
+    """
+    Reduces a null-indicator mask to a maximum number of rows.
+
+    - sample: evenly spaced rows are kept, so the density of missing values in the chart matches the data
+    - aggregate: consecutive rows are grouped into buckets and a cell is missing if any row in its bucket is missing,
+      so no missing values disappear from the chart (but sparse missing values will look dense)
+
+    :param mask: boolean mask (rows x columns)
+    :type mask: :class:`numpy:numpy.ndarray`
+    :param rows: maximum number of rows
+    :type rows: int
+    :param sampling: sample or aggregate
+    :type sampling: str, optional
+    :return: tuple of the reduced mask & the positions of the rows representing each row of the reduced mask
+    """
+    total = len(mask)
+    if not rows or total <= rows:
+        return mask, None
+    if sampling == SAMPLE:
+        positions = np.linspace(0, total - 1, rows).astype(np.int64)
+        return mask[positions], positions
+    positions = np.unique(np.linspace(0, total, rows + 1).astype(np.int64)[:-1])
+    return np.logical_or.reduceat(mask, positions, axis=0), positions
+
+
+def _nullity_column(mask, values):
+    if BooleanArray is not None:
+        return BooleanArray(values, mask)
+    return np.where(mask, np.nan, 1.0).astype("float32")
+
+
+def _build_nullity_frame(data_id, rows, sampling, date_index, nullity):
+    nullity = nullity or load_nullity(data_id)
+    mask, positions = reduce_rows(unpack_nullity(nullity), rows, sampling=sampling)
+    columns = [col for col in nullity["columns"] if col != date_index]
+    index = None
+    if date_index:
+        index = global_state.get_data(data_id)[date_index].values
+        index = pd.Index(index if positions is None else index[positions])
+    values = np.ones(len(mask), dtype=bool)
+    df = pd.DataFrame(
+        {
+            col: _nullity_column(mask[:, i], values)
+            for i, col in enumerate(nullity["columns"])
+            if col != date_index
+        },
+        index=index,
+        columns=columns,
+    )
+    return df, positions
+
+
+def build_nullity_frame(
+    data_id, rows=None, sampling=SAMPLE, date_index=None, nullity=None
+):
+    """
+    Builds a stand-in for the data associated with data_id which only contains its missing values. missingno only
+    ever looks at the nullity of the data it's given so the charts it builds from this are the same as those built
+    from the data itself.
+
+    :param data_id: identifier of data
+    :type data_id: str
+    :param rows: maximum number of rows, see :meth:`dtale.nullity.reduce_rows`
+    :type rows: int, optional
+    :param sampling: how rows are reduced, sample or aggregate
+    :type sampling: str, optional
+    :param date_index: column to use as the index of the frame
+    :type date_index: str, optional
+    :param nullity: output of :meth:`dtale.nullity.build_nullity`, loaded from cache if not specified
+    :type nullity: dict, optional
+    :rtype: :class:`pandas:pandas.DataFrame`
+    """
+    return _build_nullity_frame(data_id, rows, sampling, date_index, nullity)[0]
+
+
+def _set_date_ticks(ax, dates, positions, freq):
+    # missingno can only label dates which exist in the index so once the rows have been reduced the labels are
+    # placed on the rows representing each date instead
+    ticks = pd.date_range(dates[0], dates[-1], freq=freq)
+    locs = pd.Index(dates).get_indexer(ticks)
+    if (locs < 0).any():
+        raise KeyError("Could not divide time index into desired frequency.")
+    ax.set_yticks(np.searchsorted(positions, locs, side="right") - 1)
+    ax.set_yticklabels(ticks.strftime("%Y-%m-%d"), fontsize=20, rotation=0)
+
+
+def render_missingno(
+    data_id, chart_type, date_index=None, freq=None, rows=MATRIX_ROWS, sampling=None
+):
+    """
+    Renders a missingno chart of the data associated with data_id to a PNG. Charts are cached per version of the
+    data, chart type & parameters.
+
+    :param data_id: identifier of data
+    :type data_id: str
+    :param chart_type: matrix, bar, heatmap or dendrogram
+    :type chart_type: str
+    :param date_index: (matrix only) column to use as the index of the matrix
+    :type date_index: str, optional
+    :param freq: (matrix only) frequency of the labels on a date index
+    :type freq: str, optional
+    :param rows: (matrix only) maximum number of rows to display, see :meth:`dtale.nullity.reduce_rows`
+    :type rows: int, optional
+    :param sampling: (matrix only) how rows are reduced, sample (the default) or aggregate
+    :type sampling: str, optional
+    :return: PNG
+    :rtype: bytes
+    """
+    import missingno as msno
+    from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
+
+    if chart_type not in MISSINGNO_CHARTS:
+        raise ValueError("{} is not a valid missingno chart!".format(chart_type))
+    params = {}
+    if chart_type == "matrix":
+        params = dict(
+            date_index=date_index,
+            freq=freq,
+            rows=rows,
+            sampling=sampling or SAMPLE,
+        )
+    key = (
+        "missingno",
+        global_state.get_data_token(data_id),
+        chart_type,
+        json.dumps(params, sort_keys=True),
+    )
+    png = global_state.get_chart_cache(data_id, key)
+    if png is not None:
+        return png
+
+    if chart_type == "matrix":
+        df, positions = _build_nullity_frame(
+            data_id, rows, params["sampling"], date_index, None
+        )
+        if date_index and freq and positions is not None:
+            figure = msno.matrix(df)
+            dates = global_state.get_data(data_id)[date_index].values
+            _set_date_ticks(figure, dates, positions, freq)
+        elif date_index:
+            figure = msno.matrix(df, freq=freq)
+        else:
+            figure = msno.matrix(df)
+    else:
+        figure = getattr(msno, chart_type)(build_nullity_frame(data_id))
+
+    output = BytesIO()
+    FigureCanvas(figure.get_figure()).print_png(output)
+    png = output.getvalue()
+    global_state.set_chart_cache(data_id, key, png, size=len(png))
+    return png
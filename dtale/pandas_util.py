@@ -50,4 +50,16 @@ def assign_col_data(df, col, updates):
     if is_pandas2():
         df[col] = updates
     else:
+        if col in df.columns:
+            ensure_writeable(df, col)
         df.loc[:, col] = updates
+
+
+def ensure_writeable(df, col):
+    """
+    Columns of dataframes loaded from memory-mapped files (EX: :class:`dtale.global_state.DtaleArrowStore`) are
+    read-only views so replace the column with a copy of itself before it gets updated in-place.
+    """
+    values = df[col].values
+    if getattr(values, "flags", None) is not None and not values.flags.writeable:
+        df[col] = df[col].copy()
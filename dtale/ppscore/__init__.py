@@ -1,3 +1,3 @@
 # flake8: NOQA
 
-from dtale.ppscore.calculation import score, predictors, matrix
+from dtale.ppscore.calculation import score, predictors, matrix, iter_matrix
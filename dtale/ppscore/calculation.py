@@ -229,24 +229,56 @@ def _determine_case_and_prepare_df(df, x, y, sample=5000, random_seed=123):
         # )
 
     df = _maybe_sample(df, sample, random_seed=random_seed)
+    return df, _determine_case(df, x, y)
 
-    if _feature_is_id(df, x):
-        return df, "feature_is_id"
 
-    category_count = df[y].value_counts().count()
+def _determine_case(df, x, y, category_counts=None):
+    """
+    Returns str with the name of the determined case based on the columns x and y of a dataframe which has already
+    had its missing values dropped and been sampled
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Dataframe that contains the columns x and y
+    x : str
+        Name of the column x which acts as the feature
+    y : str
+        Name of the column y which acts as the target
+    category_counts : dict or `None`
+        Number of unique values in each column which have already been calculated for the same rows of df. Any
+        counts which need to be calculated will be added to it.
+
+    Returns
+    -------
+    str
+        Name of the case
+    """
+    if category_counts is None:
+        category_counts = {}
+
+    def _category_count(column):
+        if column not in category_counts:
+            category_counts[column] = df[column].value_counts().count()
+        return category_counts[column]
+
+    if _dtype_represents_categories(df[x]) and _category_count(x) == len(df[x]):
+        return "feature_is_id"
+
+    category_count = _category_count(y)
     if category_count == 1:
         # it is helpful to separate this case in order to save unnecessary calculation time
-        return df, "target_is_constant"
+        return "target_is_constant"
     if _dtype_represents_categories(df[y]) and (category_count == len(df[y])):
         # it is important to separate this case in order to save unnecessary calculation time
-        return df, "target_is_id"
+        return "target_is_id"
 
     if _dtype_represents_categories(df[y]):
-        return df, "classification"
+        return "classification"
     if is_numeric_dtype(df[y]):
         # this check needs to be after is_bool_dtype (which is part of _dtype_represents_categories) because bool
         # is considered numeric by pandas
-        return df, "regression"
+        return "regression"
 
     if is_datetime64_any_dtype(df[y]) or is_timedelta64_dtype(df[y]):
         # IDEA: show warning
@@ -254,13 +286,13 @@ def _determine_case_and_prepare_df(df, x, y, sample=5000, random_seed=123):
         #     f"The target column {y} has the dtype {df[y].dtype} which is not supported. "
         #     f"A possible solution might be to convert {y} to a string column"
         # ))
-        return df, "target_is_datetime"
+        return "target_is_datetime"
 
     # IDEA: show warning
     # raise Exception(
     #     f"Could not infer a valid task based on the target {y}. The dtype {df[y].dtype} is not yet supported"
     # )  # pragma: no cover
-    return df, "target_data_type_not_supported"
+    return "target_data_type_not_supported"
 
 
 def _feature_is_id(df, x):
@@ -307,11 +339,25 @@ def _is_column_in_df(column, df):
 
 
 def _score(
-    df, x, y, task, sample, cross_validation, random_seed, invalid_score, catch_errors
+    df,
+    x,
+    y,
+    task,
+    sample,
+    cross_validation,
+    random_seed,
+    invalid_score,
+    catch_errors,
+    prepared=None,
 ):
-    df, case_type = _determine_case_and_prepare_df(
-        df, x, y, sample=sample, random_seed=random_seed
-    )
+    if prepared is not None and x != y and x in prepared[1] and y in prepared[1]:
+        sampled_df, category_counts = prepared
+        df = sampled_df[[x, y]]
+        case_type = _determine_case(df, x, y, category_counts=category_counts)
+    else:
+        df, case_type = _determine_case_and_prepare_df(
+            df, x, y, sample=sample, random_seed=random_seed
+        )
     task = _get_task(case_type, invalid_score)
 
     if case_type in ["classification", "regression"]:
@@ -449,6 +495,31 @@ def score(
 
         random_seed = int(random() * 1000)
 
+    return _safe_score(
+        df,
+        x,
+        y,
+        task,
+        sample,
+        cross_validation,
+        random_seed,
+        invalid_score,
+        catch_errors,
+    )
+
+
+def _safe_score(
+    df,
+    x,
+    y,
+    task,
+    sample,
+    cross_validation,
+    random_seed,
+    invalid_score,
+    catch_errors,
+    prepared=None,
+):
     try:
         return _score(
             df,
@@ -460,6 +531,7 @@ def score(
             random_seed,
             invalid_score,
             catch_errors,
+            prepared=prepared,
         )
     except Exception as exception:
         if catch_errors:
@@ -592,7 +664,123 @@ def predictors(df, y, output="df", sorted=True, **kwargs):
     return _format_list_of_dicts(scores=scores, output=output, sorted=sorted)
 
 
-def matrix(df, output="df", sorted=False, **kwargs):
+def _prepare_matrix(df, sample, random_seed):
+    """
+    Prepares the data shared by every pair of columns in a PPS matrix. Pairs of columns without missing values keep
+    the same rows after dropping missing values & sampling, so those columns are sampled once up front rather than
+    once per pair. The number of unique values in each of those columns (used to determine the case of each pair) is
+    also cached as it's calculated.
+
+    Returns
+    -------
+    tuple
+        sampled pandas.DataFrame of the columns without missing values & dict of the unique value counts for them
+    """
+    null_free_columns = []
+    if len(df):
+        null_free_columns = [col for col in df if not df[col].isnull().values.any()]
+    sampled_df = _maybe_sample(df[null_free_columns], sample, random_seed=random_seed)
+    return sampled_df, {}
+
+
+_MATRIX_WORKER_STATE = {}
+
+
+def _init_matrix_worker(df, prepared, settings):
+    "Stores the data shared by all the pairs of a PPS matrix in a worker process"
+    _MATRIX_WORKER_STATE.update(dict(df=df, prepared=prepared, settings=settings))
+
+
+def _score_matrix_pair(pair):
+    "Calculates the PPS for a pair of columns within a worker process"
+    x, y = pair
+    return _safe_score(
+        _MATRIX_WORKER_STATE["df"],
+        x,
+        y,
+        prepared=_MATRIX_WORKER_STATE["prepared"],
+        **_MATRIX_WORKER_STATE["settings"]
+    )
+
+
+def iter_matrix(df, workers=None, **kwargs):
+    """
+    Generator calculating the Predictive Power Score (PPS) for all pairs of columns in the dataframe, which yields the
+    score dict for each pair as soon as it's available so partial results can be consumed while the rest of the
+    matrix is calculated.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The dataframe that contains the data
+    workers : int or `None`
+        Number of processes to spread the pairs of columns over. If `None` or 1 all the scores are calculated in the
+        current process.
+    kwargs:
+        Other key-word arguments that shall be forwarded to the pps.score method,
+        e.g. `sample, `cross_validation, `random_seed, `invalid_score`, `catch_errors`
+
+    Returns
+    -------
+    generator of Dict
+        The PPS dicts in the same order as pps.matrix
+    """
+    if not isinstance(df, pd.DataFrame):
+        raise TypeError(
+            (
+                "The 'df' argument should be a pandas.DataFrame but you passed a {}\n"
+                "Please convert your input to a pandas.DataFrame"
+            ).format(type(df))
+        )
+
+    settings = dict(
+        task=NOT_SUPPORTED_ANYMORE,
+        sample=5000,
+        cross_validation=4,
+        random_seed=123,
+        invalid_score=0,
+        catch_errors=True,
+    )
+    if (
+        not df.columns.is_unique
+        or not set(kwargs).issubset(settings)
+        or kwargs.get("task", NOT_SUPPORTED_ANYMORE) is not NOT_SUPPORTED_ANYMORE
+    ):
+        # let pps.score raise the appropriate error
+        for x in df:
+            for y in df:
+                yield score(df, x, y, **kwargs)
+        return
+
+    settings.update(kwargs)
+    if settings["random_seed"] is None:
+        from random import random
+
+        # the same seed is needed for every pair in order to share the sampled data between them
+        settings["random_seed"] = int(random() * 1000)
+
+    prepared = _prepare_matrix(df, settings["sample"], settings["random_seed"])
+    pairs = [(x, y) for x in df for y in df]
+    if not workers or workers <= 1:
+        for x, y in pairs:
+            yield _safe_score(df, x, y, prepared=prepared, **settings)
+        return
+
+    from dtale.utils import build_process_pool
+
+    pool = build_process_pool(
+        workers, initializer=_init_matrix_worker, initargs=(df, prepared, settings)
+    )
+    try:
+        chunksize = max(1, min(len(pairs) // (workers * 4), 16))
+        for result in pool.imap(_score_matrix_pair, pairs, chunksize=chunksize):
+            yield result
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def matrix(df, output="df", sorted=False, workers=None, **kwargs):
     """
     Calculate the Predictive Power Score (PPS) matrix for all columns in the dataframe
 
@@ -604,6 +792,9 @@ def matrix(df, output="df", sorted=False, **kwargs):
         Control the type of the output. Either return a pandas.DataFrame (df) or a list with the score dicts
     sorted: bool
         Whether or not to sort the output dataframe/list by the ppscore
+    workers : int or `None`
+        Number of processes to spread the pairs of columns over. If `None` or 1 all the scores are calculated in the
+        current process.
     kwargs:
         Other key-word arguments that shall be forwarded to the pps.score method,
         e.g. `sample, `cross_validation, `random_seed, `invalid_score`, `catch_errors`
@@ -636,6 +827,6 @@ def matrix(df, output="df", sorted=False, **kwargs):
             ).format(sorted)
         )
 
-    scores = [score(df, x, y, **kwargs) for x in df for y in df]
+    scores = list(iter_matrix(df, workers=workers, **kwargs))
 
     return _format_list_of_dicts(scores=scores, output=output, sorted=sorted)
@@ -1,11 +1,13 @@
+import json
 import re
 
+import numpy as np
 import pandas as pd
 
 import dtale.global_state as global_state
 
 from dtale.pandas_util import check_pandas_version, is_pandas3
-from dtale.utils import format_data, get_bool_arg
+from dtale.utils import build_sort_positions, format_data, get_bool_arg
 
 # Patterns that could enable code execution via pandas.DataFrame.query()
 _DANGEROUS_QUERY_PATTERNS = re.compile(
@@ -30,6 +32,10 @@ _DANGEROUS_QUERY_PATTERNS = re.compile(
     re.IGNORECASE,
 )
 
+POSITION_COL = (
+    "_dtale_position"  # temporary column tracking row positions through filters
+)
+
 
 def validate_query_safety(query):
     """Defense-in-depth validation of query strings before passing to DataFrame.query().
@@ -243,6 +249,226 @@ def handle_predefined(data_id, df=None):
     return df
 
 
+def build_predefined_key(data_id):
+    curr_settings = global_state.get_settings(data_id) or {}
+    return json.dumps(
+        curr_settings.get("predefinedFilters") or {}, sort_keys=True, default=str
+    )
+
+
+def load_filter_mask(data_id, df):
+    """
+    Builds a boolean mask of the rows in df which satisfy all the column & outlier filters saved to the settings of
+    the data associated with data_id.  Each filter is compiled to its own mask using
+    :meth:`dtale.column_filters.build_filter_mask` which is cached (keyed on the data token, predefined filters &
+    the filter's configuration) so when a filter is added or updated only that filter's mask needs to be built.
+
+    :param data_id: integer string identifier for a D-Tale process's data
+    :type data_id: str
+    :param df: dataframe with any predefined filters already applied
+    :type df: :class:`pandas:pandas.DataFrame`
+    :return: :class:`numpy:numpy.ndarray` of booleans or None if there are no filters
+    """
+    from dtale.column_filters import build_filter_mask
+
+    curr_settings = global_state.get_settings(data_id) or {}
+    version = (global_state.get_data_token(data_id), build_predefined_key(data_id))
+    engine = global_state.get_app_settings().get("query_engine", "python")
+    cached_masks = global_state.get_filter_masks(data_id)
+    masks = {}
+    final_mask = None
+    for p in ["columnFilters", "outlierFilters"]:
+        for col, fltr in (curr_settings.get(p) or {}).items():
+            key = (p, col)
+            cfg = json.dumps(fltr, sort_keys=True, default=str)
+            cached = cached_masks.get(key)
+            if cached is not None and cached[:2] == (version, cfg):
+                mask = cached[2]
+            else:
+                mask = build_filter_mask(df, fltr, engine=engine)
+            masks[key] = (version, cfg, mask)
+            final_mask = mask if final_mask is None else final_mask & mask
+    # only masks for filters which are still applied are kept
+    global_state.set_filter_masks(data_id, masks)
+    return final_mask
+
+
+def filter_data(
+    data_id, query=None, ignore_empty=False, highlight_filter=False, df=None
+):
+    """
+    Applies predefined filters, column & outlier filters and a custom query to the data associated with data_id.
+    This is equivalent to
+    `run_query(handle_predefined(data_id), build_query(data_id, query), context_vars, ...)` except that column &
+    outlier filters are applied using cached boolean masks (see :meth:`dtale.query.load_filter_mask`) so only the
+    custom query needs to be evaluated by :meth:`pandas:pandas.DataFrame.query`.
+
+    :param data_id: integer string identifier for a D-Tale process's data
+    :type data_id: str
+    :param query: custom query string
+    :type query: str, optional
+    :param ignore_empty: if false then an exception will be raised if no data is left after filtering
+    :type ignore_empty: bool, optional
+    :param highlight_filter: if true, then highlight which rows will be filtered rather than drop them
+    :type highlight_filter: boolean, optional
+    :param df: dataframe to filter, defaults to the data associated with data_id
+    :type df: :class:`pandas:pandas.DataFrame`, optional
+    :return: filtered dataframe (and the indexes of rows which satisfy the filters if highlight_filter is true)
+    """
+    curr_settings = global_state.get_settings(data_id) or {}
+    context_vars = global_state.get_context_variables(data_id)
+    df = handle_predefined(data_id, df)
+    if curr_settings.get("invertFilter", False):
+        return run_query(
+            df,
+            build_query(data_id, query),
+            context_vars,
+            ignore_empty=ignore_empty,
+            highlight_filter=highlight_filter,
+        )
+
+    mask = load_filter_mask(data_id, df)
+    if highlight_filter:
+        if mask is None:
+            return run_query(
+                df,
+                query,
+                context_vars,
+                ignore_empty=ignore_empty,
+                highlight_filter=True,
+            )
+        filtered = run_query(df[mask], query, context_vars, ignore_empty=True)
+        if not len(filtered) and not ignore_empty:
+            raise Exception(
+                'query "{}" found no data, please alter'.format(
+                    build_query(data_id, query)
+                )
+            )
+        return df, set(filtered.index)
+
+    if mask is not None:
+        df = df[mask]
+        if not len(df) and not ignore_empty:
+            raise Exception(
+                'query "{}" found no data, please alter'.format(
+                    build_query(data_id, query)
+                )
+            )
+    return run_query(df, query, context_vars, ignore_empty=ignore_empty)
+
+
+def build_filter_cache_key(data_id, query, sort=None, highlight_filter=False):
+    return (
+        global_state.get_data_token(data_id),
+        build_query(data_id, query),
+        build_predefined_key(data_id),
+        json.dumps(sort or []),
+        highlight_filter,
+    )
+
+
+def load_sort_positions(data_id, sort):
+    """
+    Returns the permutation of row positions which sorts the data associated with data_id (see
+    :meth:`dtale.utils.build_sort_positions`).  Rather than physically re-sorting the stored dataframe these
+    permutations are cached per data_id for the most recently used sorts (keyed on the data token) so switching
+    between them doesn't require any sorting.
+
+    :param data_id: integer string identifier for a D-Tale process's data
+    :type data_id: str
+    :param sort: list of [column, direction] pairs
+    :type sort: list
+    :return: :class:`numpy:numpy.ndarray` of row positions or None if there is no sort
+    """
+    if not sort:
+        return None
+    key = json.dumps(sort)
+    version = global_state.get_data_token(data_id)
+    cached = global_state.get_sort_cache(data_id, key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    positions = build_sort_positions(global_state.get_data(data_id), sort)
+    global_state.set_sort_cache(data_id, key, (version, positions))
+    return positions
+
+
+def load_sorted_data(data_id, data=None):
+    """
+    Returns the data associated with data_id in the order of the sort currently applied from the grid using the
+    permutation from :meth:`dtale.query.load_sort_positions`.  The stored data itself is never re-ordered so anything
+    whose output depends on the order of the rows (EX: diffs, cumulative sums or keeping the first duplicate) should
+    load its data from here.
+
+    :param data_id: integer string identifier for a D-Tale process's data
+    :type data_id: str
+    :param data: dataframe containing the same rows as the stored data (EX: the output of handle_predefined)
+    :type data: :class:`pandas:pandas.DataFrame`, optional
+    :rtype: :class:`pandas:pandas.DataFrame`
+    """
+    data = global_state.get_data(data_id) if data is None else data
+    sort_positions = load_sort_positions(
+        data_id, (global_state.get_settings(data_id) or {}).get("sortInfo")
+    )
+    if sort_positions is None:
+        return data
+    return data.iloc[sort_positions]
+
+
+def load_filtered_positions(data_id, query, sort=None, highlight_filter=False):
+    """
+    Returns the integer row positions of the data associated with data_id which remain after applying any predefined
+    filters, column filters and the custom query passed in.  The positions are cached per data_id (keyed on the data
+    token, query, predefined filter values & sort) so that repeated requests for different windows of the same view
+    (EX: scrolling the grid) only need to slice the positions rather than re-evaluating the filters over the whole
+    dataframe.  If a sort is specified the positions are returned in sorted order using the permutation from
+    :meth:`dtale.query.load_sort_positions`.
+
+    :param data_id: integer string identifier for a D-Tale process's data
+    :type data_id: str
+    :param query: custom query string
+    :type query: str
+    :param sort: sort information currently applied to the data
+    :type sort: list, optional
+    :param highlight_filter: if true, then highlight which rows will be filtered rather than drop them
+    :type highlight_filter: boolean, optional
+    :return: tuple of (:class:`numpy:numpy.ndarray` of row positions, indexes to highlight as filtered)
+    """
+    key = build_filter_cache_key(data_id, query, sort, highlight_filter)
+    cached = global_state.get_filter_cache(data_id)
+    if cached is not None and cached[0] == key:
+        return cached[1], cached[2]
+
+    data = global_state.get_data(data_id)
+    position_data = None
+    if not data.index.is_unique:
+        # labels can't identify rows so their positions are carried through the filters in a temporary column
+        position_data = data.assign(**{POSITION_COL: np.arange(len(data))})
+    filtered = filter_data(
+        data_id,
+        query,
+        ignore_empty=True,
+        highlight_filter=highlight_filter,
+        df=position_data,
+    )
+    filtered_indexes = []
+    if highlight_filter:
+        filtered, filtered_indexes = filtered
+    if position_data is None:
+        positions = data.index.get_indexer(filtered.index)
+    else:
+        positions = filtered[POSITION_COL].values
+    sort_positions = load_sort_positions(data_id, sort)
+    if sort_positions is not None:
+        if len(positions) == len(data):
+            positions = sort_positions
+        else:
+            keep = np.zeros(len(data), dtype=bool)
+            keep[positions] = True
+            positions = sort_positions[keep[sort_positions]]
+    global_state.set_filter_cache(data_id, (key, positions, filtered_indexes))
+    return positions, filtered_indexes
+
+
 def load_filterable_data(data_id, req, query=None, columns=None):
     filtered = get_bool_arg(req, "filtered")
     if global_state.is_arcticdb:
@@ -255,11 +481,18 @@ def load_filterable_data(data_id, req, query=None, columns=None):
         data, _ = format_data(data)
         return data
     if filtered:
-        final_query = query or build_query(data_id, global_state.get_query(data_id))
-        return run_query(
-            handle_predefined(data_id),
-            final_query,
-            global_state.get_context_variables(data_id),
-            ignore_empty=True,
+        if query:
+            return run_query(
+                handle_predefined(data_id, load_sorted_data(data_id)),
+                query,
+                global_state.get_context_variables(data_id),
+                ignore_empty=True,
+            )
+        # the cached positions of the current view also carry the sort applied from the grid
+        positions, _ = load_filtered_positions(
+            data_id,
+            global_state.get_query(data_id),
+            sort=(global_state.get_settings(data_id) or {}).get("sortInfo"),
         )
-    return global_state.get_data(data_id)
+        return global_state.get_data(data_id).iloc[positions]
+    return load_sorted_data(data_id)
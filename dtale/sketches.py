@@ -0,0 +1,287 @@
+import numpy as np
+import pandas as pd
+
+import dtale.global_state as global_state
+
+SKETCH_MIN_ROWS = (
+    1000000  # columns with fewer rows always have their statistics computed exactly
+)
+SKETCH_CHUNK_SIZE = 100000  # number of rows fed to a sketch at a time
+FREQUENT_ITEMS_CAPACITY = (
+    1000  # maximum number of values tracked when approximating value counts
+)
+
+
+def use_sketches(s):
+    """
+    Whether the statistics of a series should be approximated using sketches rather than computed exactly.  This is
+    only the case when the "sketch_stats" application setting has been turned on and the series contains at least
+    `SKETCH_MIN_ROWS` rows.
+
+    :param s: series
+    :type s: :class:`pandas:pandas.Series`
+    :rtype: bool
+    """
+    sketch_stats = global_state.get_app_settings().get("sketch_stats", False)
+    return bool(sketch_stats) and len(s) >= SKETCH_MIN_ROWS
+
+
+def iter_chunks(s, chunk_size=None):
+    """
+    Yields the non-null values of a series in chunks of rows so a sketch never has to hold more than one chunk (and
+    its own state) in memory.
+    """
+    chunk_size = chunk_size or SKETCH_CHUNK_SIZE
+    for start in range(0, len(s), chunk_size):
+        chunk = s.iloc[start : start + chunk_size]
+        yield chunk[chunk.notnull()]
+
+
+class HyperLogLog(object):
+    """
+    HyperLogLog sketch for estimating the number of distinct values in a stream using `2 ** precision` one-byte
+    registers.  Values are hashed using :meth:`pandas:pandas.util.hash_pandas_object`.  The relative standard error
+    of the estimate is `1.04 / sqrt(2 ** precision)`, which is roughly 0.8% for the default precision of 14 (16KB of
+    registers).
+
+    :param precision: number of bits of each hash used to select its register
+    :type precision: int, optional
+    """
+
+    def __init__(self, precision=14):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @property
+    def relative_error(self):
+        return 1.04 / np.sqrt(len(self.registers))
+
+    def update(self, values):
+        if not len(values):
+            return self
+        hashes = pd.util.hash_pandas_object(pd.Series(values), index=False).values
+        buckets = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+        # ranks are built from (at most) the lowest 50 bits so they can be converted to floats without losing any
+        width = min(64 - self.precision, 50)
+        remainder = (hashes & np.uint64((1 << width) - 1)).astype(np.float64)
+        _, bit_lengths = np.frexp(remainder)
+        ranks = (width - bit_lengths + 1).astype(np.uint8)
+        np.maximum.at(self.registers, buckets, ranks)
+        return self
+
+    def merge(self, other):
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self):
+        m = float(len(self.registers))
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.power(2.0, -self.registers.astype(np.int64)).sum()
+        zeros = int((self.registers == 0).sum())
+        if estimate <= 2.5 * m and zeros:
+            # linear counting is more accurate for small cardinalities
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+
+class KLLSketch(object):
+    """
+    KLL sketch (Karnin, Lang & Liberty) for estimating quantiles of a stream of numbers.  Items are stored in a
+    hierarchy of compactors, each level holding items with twice the weight of the level below it, and the capacity of
+    each level shrinks geometrically the further it is from the top so the sketch holds `O(k)` items.  The error of a
+    quantile is stated as a normalized rank error, roughly 1.3% for the default `k` of 200.
+
+    :param k: capacity of the top level of the sketch
+    :type k: int, optional
+    :param seed: seed of the random offsets used by compactions
+    :type seed: int, optional
+    """
+
+    def __init__(self, k=200, seed=0):
+        self.k = k
+        self.levels = [np.empty(0)]
+        self.count = 0
+        self._random = np.random.RandomState(seed)
+
+    @property
+    def rank_error(self):
+        # normalized rank error of a single quantile as measured for the Apache DataSketches KLL sketch
+        return 2.296 / self.k**0.9723
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(int(np.ceil(self.k * (2.0 / 3) ** depth)), 2)
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return self
+        self.count += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # an odd item is left behind so compactions always preserve the total weight of the sketch
+                leftover, items = items[: len(items) % 2], items[len(items) % 2 :]
+                offset = self._random.randint(2)
+                self.levels[level + 1] = np.concatenate(
+                    [self.levels[level + 1], items[offset::2]]
+                )
+                self.levels[level] = leftover
+            level += 1
+
+    def quantiles(self, qs):
+        """
+        :param qs: quantiles to estimate, each between 0 and 1
+        :type qs: list of float
+        :return: estimated value for each quantile
+        :rtype: list of float
+        """
+        if not self.count:
+            return [np.nan for _ in qs]
+        items = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [
+                np.full(len(level), 2**i, dtype=np.int64)
+                for i, level in enumerate(self.levels)
+            ]
+        )
+        order = np.argsort(items, kind="mergesort")
+        items, weights = items[order], weights[order]
+        # each item stands in for "weight" copies of itself so it is positioned at the middle of their ranks which
+        # makes the estimates match linearly interpolated quantiles for as long as nothing has been compacted
+        positions = np.cumsum(weights) - (weights + 1) / 2.0
+        targets = np.asarray(qs, dtype=np.float64) * (self.count - 1)
+        return np.interp(targets, positions, items).tolist()
+
+
+class FrequentItems(object):
+    """
+    Misra-Gries summary for finding the most frequent values of a stream.  At most `capacity` values are tracked and
+    the count of each value is underestimated by at most `n / (capacity + 1)`, so any value occurring more often than
+    that is guaranteed to be tracked.  Chunks are summarized using :meth:`pandas:pandas.Series.value_counts` and
+    merged into the summary, so memory is bounded by the size of a chunk rather than the number of distinct values.
+
+    :param capacity: maximum number of values tracked
+    :type capacity: int, optional
+    """
+
+    def __init__(self, capacity=FREQUENT_ITEMS_CAPACITY):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype="int64")
+        self.max_error = (
+            0  # total amount subtracted from the count of every tracked value
+        )
+
+    def update(self, values):
+        chunk_counts = pd.Series(values).value_counts()
+        chunk_counts = chunk_counts[chunk_counts > 0]
+        if not len(chunk_counts):
+            return self
+        if isinstance(chunk_counts.index, pd.CategoricalIndex):
+            chunk_counts.index = chunk_counts.index.astype("object")
+        if len(self.counts):
+            counts = pd.concat([self.counts, chunk_counts])
+            counts = counts.groupby(level=0, sort=False).sum()
+        else:
+            counts = chunk_counts
+        if len(counts) > self.capacity:
+            counts = counts.sort_values(ascending=False)
+            threshold = counts.values[self.capacity]
+            counts = counts.iloc[: self.capacity] - threshold
+            counts = counts[counts > 0]
+            self.max_error += int(threshold)
+        self.counts = counts
+        return self
+
+    def top(self, n=None):
+        counts = self.counts.sort_values(ascending=False, kind="mergesort")
+        return counts if n is None else counts.head(n)
+
+
+def approx_unique_count(s):
+    """
+    Estimates the number of distinct non-null values in a series using :class:`dtale.sketches.HyperLogLog`.
+
+    :param s: series
+    :type s: :class:`pandas:pandas.Series`
+    :return: tuple of the estimate & its relative standard error
+    """
+    hll = HyperLogLog()
+    for chunk in iter_chunks(s):
+        hll.update(chunk)
+    return hll.count(), hll.relative_error
+
+
+def approx_quantiles(s, qs):
+    """
+    Estimates quantiles of a numeric series using :class:`dtale.sketches.KLLSketch`.
+
+    :param s: series
+    :type s: :class:`pandas:pandas.Series`
+    :param qs: quantiles to estimate, each between 0 and 1
+    :type qs: list of float
+    :return: tuple of the estimates & their normalized rank error
+    """
+    kll = KLLSketch()
+    for chunk in iter_chunks(s):
+        kll.update(chunk.values)
+    return kll.quantiles(qs), kll.rank_error
+
+
+def approx_value_counts(s, capacity=FREQUENT_ITEMS_CAPACITY):
+    """
+    Estimates the most frequent values of a series using :class:`dtale.sketches.FrequentItems`.
+
+    :param s: series
+    :type s: :class:`pandas:pandas.Series`
+    :param capacity: maximum number of values tracked
+    :type capacity: int, optional
+    :return: tuple of the counts of the tracked values (sorted in descending order) & the maximum amount any of
+             those counts has been underestimated by
+    """
+    frequent = FrequentItems(capacity)
+    for chunk in iter_chunks(s):
+        frequent.update(chunk)
+    counts = frequent.top()
+    counts.name = s.name
+    return counts, frequent.max_error
+
+
+def approx_describe(s):
+    """
+    Sketch-backed version of :meth:`pandas:pandas.Series.describe`.  Numeric series have their count, mean, std, min
+    & max computed exactly (none of which require more than constant memory) and their quartiles estimated.  Any
+    other series has its number of unique values and its most frequent value estimated.
+
+    :param s: series
+    :type s: :class:`pandas:pandas.Series`
+    :rtype: :class:`pandas:pandas.Series`
+    """
+    if pd.api.types.is_numeric_dtype(s) and not pd.api.types.is_bool_dtype(s):
+        quartiles, _ = approx_quantiles(s, [0.25, 0.5, 0.75])
+        return pd.Series(
+            [s.count(), s.mean(), s.std(), s.min()] + quartiles + [s.max()],
+            index=["count", "mean", "std", "min", "25%", "50%", "75%", "max"],
+            name=s.name,
+        )
+    unique_ct, _ = approx_unique_count(s)
+    counts, _ = approx_value_counts(s)
+    top, freq = (counts.index[0], counts.values[0]) if len(counts) else (None, None)
+    return pd.Series(
+        [s.count(), unique_ct, top, freq],
+        index=["count", "unique", "top", "freq"],
+        name=s.name,
+        dtype="object",
+    )
@@ -1,9 +1,5 @@
 import pandas as pd
 from six import PY3
-from statsmodels.tsa.filters.bk_filter import bkfilter
-from statsmodels.tsa.filters.cf_filter import cffilter
-from statsmodels.tsa.filters.hp_filter import hpfilter
-from statsmodels.tsa.seasonal import seasonal_decompose
 
 import dtale.global_state as global_state
 from dtale.query import run_query
@@ -53,6 +49,8 @@ class BKFilter(object):
         self.cfg = cfg
 
     def run(self, data):
+        from statsmodels.tsa.filters.bk_filter import bkfilter
+
         index, col, low, high, K = (
             self.cfg.get(p) for p in ["index", "col", "low", "high", "K"]
         )
@@ -71,6 +69,8 @@ class CFFilter(object):
         self.cfg = cfg
 
     def run(self, data):
+        from statsmodels.tsa.filters.cf_filter import cffilter
+
         index, col, low, high, drift = (
             self.cfg.get(p) for p in ["index", "col", "low", "high", "drift"]
         )
@@ -89,6 +89,8 @@ class HPFilter(object):
         self.cfg = cfg
 
     def run(self, data):
+        from statsmodels.tsa.filters.hp_filter import hpfilter
+
         index, col, lamb = (self.cfg.get(p) for p in ["index", "col", "lamb"])
         df = build_data(data, self.cfg)
         cycle, trend = hpfilter(df, lamb=1600)
@@ -105,6 +107,8 @@ class SeasonalDecompose(object):
         self.cfg = cfg
 
     def run(self, data):
+        from statsmodels.tsa.seasonal import seasonal_decompose
+
         index, col, model = (self.cfg.get(p) for p in ["index", "col", "model"])
         df = build_data(data, self.cfg)
         sd_df = seasonal_decompose(df, model=model)
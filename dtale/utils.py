@@ -249,6 +249,22 @@ DECIMAL_CTX = decimal.Context()
 DECIMAL_CTX.prec = 20
 
 
+def format_float_string(x, precision=2):
+    """
+    Convert float to a string with thousands separators and no trailing zeroes (EX: 1,234.5643)
+
+    :param x: value to be converted to string
+    :param precision: maximum precision of float to be returned
+    :return: string value
+    :rtype: str
+    """
+    str_output = format(
+        DECIMAL_CTX.create_decimal(repr(float(x))), ",.{}f".format(str(precision))
+    )
+    # drop trailing zeroes off & trailing decimal points if necessary
+    return str_output.rstrip("0").rstrip(".")
+
+
 def json_float(x, precision=2, nan_display="nan", inf_display="inf", as_string=False):
     """
     Convert value to float to be used within JSON output
@@ -267,12 +283,7 @@ def json_float(x, precision=2, nan_display="nan", inf_display="inf", as_string=F
         if not np.isnan(x):
             output = float(round(x, precision))
             if as_string:
-                str_output = format(
-                    DECIMAL_CTX.create_decimal(repr(float(x))),
-                    ",.{}f".format(str(precision)),
-                )
-                # drop trailing zeroes off & trailing decimal points if necessary
-                return str_output.rstrip("0").rstrip(".")
+                return format_float_string(x, precision)
             return output
         return nan_display
     except BaseException:
@@ -322,6 +333,149 @@ def json_timestamp(x, nan_display="", **kwargs):
         return nan_display
 
 
+def _is_numpy_kind(s, kinds):
+    return not pd.api.types.is_extension_array_dtype(s.dtype) and s.dtype.kind in kinds
+
+
+def _fill_values(size, mask, values, nan_display):
+    output = np.empty(size, dtype=object)
+    output[:] = nan_display
+    output[mask] = values
+    return output.tolist()
+
+
+def format_string_values(s, nan_display="", **kwargs):
+    """
+    Vectorized version of :meth:`dtale.utils.json_string` which converts an entire column of values at once.  Columns
+    which cannot be converted safely in bulk (EX: object columns of mixed types) will return `None` so the caller can
+    fall back to :meth:`dtale.utils.json_string`.
+
+    :param s: column of values
+    :type s: :class:`pandas:pandas.Series`
+    :param nan_display: value to use for missing values
+    :return: list of string values
+    :rtype: list
+    """
+    if _is_numpy_kind(s, "b"):
+        return np.where(s.values, "True", "False").tolist()
+    if pd.api.types.is_string_dtype(s.dtype) and isinstance(s.dtype, pd.StringDtype):
+        mask = ~s.isnull().values
+        return _fill_values(len(s), mask, s.values[mask].astype(object), nan_display)
+    if s.dtype == object and pd.api.types.infer_dtype(s, skipna=True) in [
+        "string",
+        "empty",
+    ]:
+        # every non-null value is already a string so str() would return it unchanged
+        mask = ~s.isnull().values
+        return _fill_values(len(s), mask, s.values[mask], nan_display)
+    return None
+
+
+def format_int_values(s, nan_display="", as_string=False, fmt="{:,d}"):
+    """
+    Vectorized version of :meth:`dtale.utils.json_int` which converts an entire column of values at once.  Returns
+    `None` for columns which aren't backed by a numeric :class:`numpy:numpy.ndarray`.
+
+    :param s: column of values
+    :type s: :class:`pandas:pandas.Series`
+    :param nan_display: value to use for missing or infinite values
+    :param as_string: return integers as formatted strings (EX: 1,000,000)
+    :return: list of integer values
+    :rtype: list
+    """
+    if _is_numpy_kind(s, "iu"):
+        output = s.values.tolist()
+        return [fmt.format(v) for v in output] if as_string else output
+    if not _is_numpy_kind(s, "f"):
+        return None
+    values = s.values
+    mask = np.isfinite(values)
+    finite_values = values[mask]
+    if len(finite_values) and np.abs(finite_values).max() >= 2**63:
+        return None
+    finite_values = finite_values.astype(np.int64)
+    if as_string:
+        finite_values = [fmt.format(v) for v in finite_values.tolist()]
+    return _fill_values(len(values), mask, finite_values, nan_display)
+
+
+def round_float_values(values, precision):
+    """
+    Rounds an array of floats the same way python's :func:`round` does.  :meth:`numpy:numpy.round` scales the values
+    by `10 ** precision` before rounding which can push values lying (almost) exactly halfway between two roundings to
+    the other side, so those values are re-rounded individually.
+
+    :param values: floats
+    :type values: :class:`numpy:numpy.ndarray`
+    :param precision: number of decimals
+    :type precision: int
+    :rtype: :class:`numpy:numpy.ndarray`
+    """
+    with np.errstate(invalid="ignore", over="ignore"):
+        rounded = np.round(values, precision)
+        scaled = np.abs(values) * 10.0**precision
+        halfway = np.abs(scaled - np.floor(scaled) - 0.5) <= 1e-6 * np.maximum(
+            scaled, 1
+        )
+    for i in np.flatnonzero(halfway | ~np.isfinite(scaled)):
+        rounded[i] = round(float(values[i]), precision)
+    return rounded
+
+
+def format_float_values(
+    s, precision=2, nan_display="nan", inf_display="inf", as_string=False
+):
+    """
+    Vectorized version of :meth:`dtale.utils.json_float` which converts an entire column of values at once.  Returns
+    `None` for columns which aren't backed by a numeric :class:`numpy:numpy.ndarray`.
+
+    :param s: column of values
+    :type s: :class:`pandas:pandas.Series`
+    :param precision: precision of floats to be returned
+    :param nan_display: value to use for missing values
+    :param inf_display: value to use for infinite values
+    :param as_string: return floats as formatted strings (EX: 1,234.5643)
+    :return: list of float values
+    :rtype: list
+    """
+    if not _is_numpy_kind(s, "iuf"):
+        return None
+    values = s.values.astype(np.float64)
+    mask = np.isfinite(values)
+    if as_string:
+        finite_values = [
+            format_float_string(v, precision) for v in values[mask].tolist()
+        ]
+    else:
+        finite_values = round_float_values(values[mask], precision)
+    output = _fill_values(len(values), mask, finite_values, nan_display)
+    if inf_display != nan_display:
+        for i in np.flatnonzero(np.isinf(values)):
+            output[i] = inf_display
+    return output
+
+
+def format_date_values(s, fmt="%Y-%m-%d %H:%M:%S.%f", nan_display="", **kwargs):
+    """
+    Vectorized version of :meth:`dtale.utils.json_date` which converts an entire column of values at once using
+    :meth:`pandas:pandas.Series.dt.strftime`.  Returns `None` for columns which aren't datetimes.
+
+    :param s: column of values
+    :type s: :class:`pandas:pandas.Series`
+    :param fmt: the date string formatting to be applied
+    :param nan_display: value to use for missing values
+    :return: list of date strings
+    :rtype: list
+    """
+    if not pd.api.types.is_datetime64_any_dtype(s.dtype):
+        return None
+    mask = ~s.isnull().values
+    output = s[mask].dt.strftime(fmt)
+    output = output.str.replace(r"\.000000$", "", regex=True)
+    output = output.str.replace(r" 00:00:00$", "", regex=True)
+    return _fill_values(len(s), mask, output.values.astype(object), nan_display)
+
+
 class JSONFormatter(object):
     """
     Class for formatting dictionaries and lists of dictionaries into JSON compliant data
@@ -338,14 +492,22 @@ class JSONFormatter(object):
 
     def __init__(self, nan_display="", as_string=False):
         self.fmts = []
+        self.column_fmts = []
         self.nan_display = nan_display
         self.as_string = as_string
 
+    def add_fmt(self, idx, name, f, column_f=None):
+        self.fmts.append([idx, name, f])
+        self.column_fmts.append(column_f)
+
     def add_string(self, idx, name=None):
         def f(x, nan_display):
             return json_string(x, nan_display=nan_display)
 
-        self.fmts.append([idx, name, f])
+        def column_f(s, nan_display):
+            return format_string_values(s, nan_display=nan_display)
+
+        self.add_fmt(idx, name, f, column_f)
 
     def add_int(self, idx, name=None, as_string=False):
         def f(x, nan_display):
@@ -353,7 +515,12 @@ class JSONFormatter(object):
                 x, nan_display=nan_display, as_string=as_string or self.as_string
             )
 
-        self.fmts.append([idx, name, f])
+        def column_f(s, nan_display):
+            return format_int_values(
+                s, nan_display=nan_display, as_string=as_string or self.as_string
+            )
+
+        self.add_fmt(idx, name, f, column_f)
 
     def add_float(self, idx, name=None, precision=6, as_string=False):
         def f(x, nan_display):
@@ -364,7 +531,15 @@ class JSONFormatter(object):
                 as_string=as_string or self.as_string,
             )
 
-        self.fmts.append([idx, name, f])
+        def column_f(s, nan_display):
+            return format_float_values(
+                s,
+                precision,
+                nan_display=nan_display,
+                as_string=as_string or self.as_string,
+            )
+
+        self.add_fmt(idx, name, f, column_f)
 
     def add_timestamp(self, idx, name=None, as_string=False):
         def f(x, nan_display):
@@ -372,13 +547,16 @@ class JSONFormatter(object):
                 x, nan_display=nan_display, as_string=as_string or self.as_string
             )
 
-        self.fmts.append([idx, name, f])
+        self.add_fmt(idx, name, f)
 
     def add_date(self, idx, name=None, fmt="%Y-%m-%d %H:%M:%S.%f"):
         def f(x, nan_display):
             return json_date(x, fmt=fmt, nan_display=nan_display)
 
-        self.fmts.append([idx, name, f])
+        def column_f(s, nan_display):
+            return format_date_values(s, fmt=fmt, nan_display=nan_display)
+
+        self.add_fmt(idx, name, f, column_f)
 
     def add_json(self, idx, name=None):
         def f(x, nan_display):
@@ -386,7 +564,7 @@ class JSONFormatter(object):
                 return None
             return x
 
-        self.fmts.append([idx, name, f])
+        self.add_fmt(idx, name, f)
 
     def format_dict(self, lst):
         return {
@@ -394,13 +572,57 @@ class JSONFormatter(object):
             for idx, name, f in self.fmts
         }
 
+    def format_column(self, s, f, column_f=None, values=None):
+        """
+        Formats an entire column of values.  If there is a vectorized formatter available for the column's data type
+        it will be used, otherwise each value will be passed through the cell-level formatter.
+
+        :param s: column of values
+        :type s: :class:`pandas:pandas.Series`
+        :param f: cell-level formatter
+        :param column_f: vectorized formatter
+        :param values: values to pass to the cell-level formatter, defaults to iterating over `s`
+        :return: list of formatted values
+        :rtype: list
+        """
+        if column_f is not None:
+            output = column_f(s, nan_display=self.nan_display)
+            if output is not None:
+                return output
+        return [
+            f(v, nan_display=self.nan_display)
+            for v in (s if values is None else values)
+        ]
+
     def format_dicts(self, lsts):
-        return list(map(self.format_dict, lsts))
+        """
+        Formats rows into a list of dictionaries.  When passed a :class:`pandas:pandas.DataFrame` the formatting will
+        be done column-by-column (the index being position 0 and each column being its position + 1 just like
+        :meth:`pandas:pandas.DataFrame.itertuples`) and then zipped together into rows.  Otherwise each item will be
+        formatted one at a time.
+
+        :param lsts: dataframe or iterable of rows (EX: output of :meth:`pandas:pandas.DataFrame.itertuples`)
+        :return: list of dictionaries
+        :rtype: list
+        """
+        if not isinstance(lsts, pd.DataFrame):
+            return list(map(self.format_dict, lsts))
+
+        names, columns = [], []
+        for (idx, name, f), column_f in zip(self.fmts, self.column_fmts):
+            s = pd.Series(lsts.index) if idx == 0 else lsts.iloc[:, idx - 1]
+            names.append(name)
+            columns.append(self.format_column(s, f, column_f))
+        if not columns:
+            return [{} for _ in range(len(lsts))]
+        return [dict(zip(names, row)) for row in zip(*columns)]
 
     def format_lists(self, df):
         return {
-            name: [f(v, nan_display=self.nan_display) for v in df[name].values]
-            for _idx, name, f in self.fmts
+            name: self.format_column(
+                pd.Series(df[name].values), f, column_f, values=df[name].values
+            )
+            for (_idx, name, f), column_f in zip(self.fmts, self.column_fmts)
             if name in df.columns
         }
 
@@ -494,6 +716,64 @@ def sort_df_for_grid(df, params):
     return df.sort_index()
 
 
+def build_sort_positions(df, sort):
+    """
+    Builds the permutation of row positions which would sort a dataframe based on the 'sort' configuration used by
+    :meth:`dtale.utils.sort_df_for_grid` (list of [column, ASC/DESC] pairs).  This is the equivalent of
+    `df.sort_values(...)` except that the dataframe isn't copied, the values of each column are converted to integer
+    codes and sorted using :func:`numpy:numpy.lexsort` (missing values are sorted last).
+
+    :param df: dataframe
+    :type df: :class:`pandas:pandas.DataFrame`
+    :param sort: list of [column, direction] pairs
+    :type sort: list
+    :return: integer row positions in sorted order
+    :rtype: :class:`numpy:numpy.ndarray`
+    """
+    keys = []
+    try:
+        for col, dir in sort:
+            codes, uniques = pd.factorize(df[col], sort=True)
+            missing = codes == -1
+            if dir != "ASC":
+                codes = len(uniques) - 1 - codes
+            codes[missing] = len(uniques)
+            keys.append(codes)
+    except (
+        TypeError
+    ):  # columns containing values which can't be compared to one another
+        cols, dirs = [], []
+        for col, dir in sort:
+            cols.append(col)
+            dirs.append(dir == "ASC")
+        return (
+            df[cols]
+            .reset_index(drop=True)
+            .sort_values(cols, ascending=dirs)
+            .index.values
+        )
+    # lexsort uses the last key as its primary sort
+    return np.lexsort(keys[::-1])
+
+
+def estimate_size(obj):
+    """
+    Rough estimate of the number of bytes of memory used by a structure of dictionaries, lists & scalars (EX: the
+    JSON-ready output of a chart).
+
+    :param obj: object to measure
+    :return: number of bytes
+    :rtype: int
+    """
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(
+            estimate_size(k) + estimate_size(v) for k, v in obj.items()
+        )
+    if isinstance(obj, (list, tuple)):
+        return sys.getsizeof(obj) + sum(estimate_size(v) for v in obj)
+    return sys.getsizeof(obj)
+
+
 def find_dtype(s):
     """
     Helper function to determine the dtype of a :class:`pandas:pandas.Series`
@@ -615,7 +895,7 @@ def format_grid(df, overrides=None):
     """
     col_types = grid_columns(df)
     f = grid_formatter(col_types, overrides=overrides)
-    return {"results": f.format_dicts(df.itertuples()), "columns": col_types}
+    return {"results": f.format_dicts(df), "columns": col_types}
 
 
 def handle_error(error_info):
@@ -779,6 +1059,165 @@ def export_to_parquet_buffer(data):
     return parquet_buffer
 
 
+EXPORT_CHUNK_SIZE = 100000  # number of rows written per chunk (or parquet row-group) when streaming exports
+
+
+def iter_export_chunks(data, positions=None, columns=None, chunk_size=None):
+    """
+    Splits the rows of a dataframe into chunks so they can be exported without ever building a copy of the full
+    output.
+
+    :param data: dataframe
+    :type data: :class:`pandas:pandas.DataFrame`
+    :param positions: row positions to export (EX: filtered & sorted), defaults to every row
+    :type positions: :class:`numpy:numpy.ndarray`, optional
+    :param columns: columns to export, defaults to every column
+    :type columns: list, optional
+    :param chunk_size: number of rows in each chunk
+    :type chunk_size: int, optional
+    :return: generator of :class:`pandas:pandas.DataFrame`
+    """
+    chunk_size = chunk_size or EXPORT_CHUNK_SIZE
+    total = len(data) if positions is None else len(positions)
+    # an empty chunk is still returned for empty data so headers & schemas get written
+    for start in range(0, max(total, 1), chunk_size):
+        if positions is None:
+            chunk = data.iloc[start : start + chunk_size]
+        else:
+            chunk = data.iloc[positions[start : start + chunk_size]]
+        yield chunk if columns is None else chunk[columns]
+
+
+def export_to_csv_stream(
+    data, tsv=False, positions=None, columns=None, chunk_size=None
+):
+    """
+    Streaming version of :meth:`dtale.utils.export_to_csv_buffer` which returns the CSV in chunks of rows.
+
+    :return: generator of strings
+    """
+    kwargs = dict(encoding="utf-8", index=False)
+    if tsv:
+        kwargs["sep"] = "\t"
+    chunks = iter_export_chunks(data, positions, columns, chunk_size)
+    for i, chunk in enumerate(chunks):
+        csv_buffer = StringIO()
+        chunk.to_csv(csv_buffer, header=i == 0, **kwargs)
+        yield csv_buffer.getvalue()
+
+
+class ParquetStreamSink(object):
+    """
+    Write-only file-like object which hands back whatever pyarrow has written to it since the last call to
+    :meth:`dtale.utils.ParquetStreamSink.flush_chunk`.  The total number of bytes written is tracked separately
+    from the buffer because the offsets in the parquet footer are based on it.
+    """
+
+    def __init__(self):
+        self.closed = False
+        self._position = 0
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def writable(self):
+        return True
+
+    def seekable(self):
+        return False
+
+    def flush_chunk(self):
+        output = b"".join(self._chunks)
+        self._chunks = []
+        return output
+
+
+def build_parquet_schema(data, positions=None, columns=None, chunk_size=None):
+    """
+    Builds the parquet schema of an export from its first chunk of rows and validates it against every row of the
+    columns whose types can vary from row to row (object columns).  This is done before anything is streamed so
+    that data which can't be exported raises an error rather than breaking off a response which has already started.
+
+    :param data: dataframe
+    :type data: :class:`pandas:pandas.DataFrame`
+    :param positions: row positions to export (EX: filtered & sorted), defaults to every row
+    :type positions: :class:`numpy:numpy.ndarray`, optional
+    :param columns: columns to export, defaults to every column
+    :type columns: list, optional
+    :param chunk_size: number of rows in each chunk
+    :type chunk_size: int, optional
+    :rtype: :class:`pyarrow:pyarrow.Schema`
+    """
+    import pyarrow as pa
+
+    chunk = next(iter_export_chunks(data, positions, columns, chunk_size))
+    schema = pa.Schema.from_pandas(chunk, preserve_index=False)
+    for i, field in enumerate(schema):
+        null_type = pa.types.is_null(field.type)
+        if not null_type and chunk[field.name].dtype != "object":
+            continue
+        # columns are converted one at a time so there's only ever one of them held as arrow data
+        s = data[field.name]
+        if positions is not None:
+            s = s.iloc[positions]
+        try:
+            # a column which is entirely null in the first chunk has no type so it comes from the rest of the column
+            field_type = pa.Array.from_pandas(
+                s, type=None if null_type else field.type
+            ).type
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as ex:
+            raise ValueError(
+                "Column '{}' cannot be exported to parquet: {}".format(field.name, ex)
+            )
+        if null_type:
+            schema = schema.set(i, pa.field(field.name, field_type))
+    return schema
+
+
+def export_to_parquet_stream(data, positions=None, columns=None, chunk_size=None):
+    """
+    Streaming version of :meth:`dtale.utils.export_to_parquet_buffer` which writes each chunk of rows as a
+    separate parquet row-group using :class:`pyarrow:pyarrow.parquet.ParquetWriter`.  The schema is validated (see
+    :meth:`dtale.utils.build_parquet_schema`) before this returns.
+
+    :return: generator of bytes
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError(
+            "In order to use the parquet exporter you must install pyarrow!"
+        )
+
+    schema = build_parquet_schema(data, positions, columns, chunk_size)
+
+    def _stream():
+        sink = ParquetStreamSink()
+        writer = pq.ParquetWriter(sink, schema, compression="gzip")
+        for chunk in iter_export_chunks(data, positions, columns, chunk_size):
+            writer.write_table(
+                pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+            )
+            yield sink.flush_chunk()
+        writer.close()
+        yield sink.flush_chunk()
+
+    return _stream()
+
+
 def is_app_root_defined(app_root):
     return app_root is not None and app_root != "/"
 
@@ -789,6 +1228,44 @@ def fix_url_path(path):
     return path
 
 
+def build_process_pool(workers, initializer=None, initargs=()):
+    """
+    Builds a :class:`multiprocessing.pool.Pool` whose processes are started using the "forkserver" method where it's
+    available.  Forking the current process (the default on linux) isn't safe once other threads are running (EX:
+    flask's threaded server or the threads of :mod:`dtale.jobs`) since a lock held by one of those threads at the time
+    of the fork can never be released within the child.
+
+    :param workers: number of processes
+    :type workers: int
+    :param initializer: function each process will call when it starts
+    :type initializer: func, optional
+    :param initargs: arguments to pass to initializer (these are pickled so they should be kept small)
+    :type initargs: tuple, optional
+    :rtype: :class:`multiprocessing.pool.Pool`
+    """
+    import multiprocessing
+
+    context = multiprocessing
+    if "forkserver" in getattr(multiprocessing, "get_all_start_methods", list)():
+        context = multiprocessing.get_context("forkserver")
+    return context.Pool(workers, initializer=initializer, initargs=initargs)
+
+
+def get_pool_workers(workers):
+    """
+    Bounds the number of processes configured for a pool by the number of CPUs available.
+
+    :param workers: configured number of processes, if this is empty pools are disabled
+    :type workers: int
+    :return: number of processes or None if pools are disabled (or would only contain one process)
+    :rtype: int
+    """
+    from multiprocessing import cpu_count
+
+    workers = min(int(workers or 0), cpu_count())
+    return workers if workers > 1 else None
+
+
 def apply(df, func, *args, **kwargs):
     try:
         import swifter  # noqa: F401
@@ -798,6 +1275,78 @@ def apply(df, func, *args, **kwargs):
         return df.apply(func, *args, **kwargs)
 
 
+def factorize_rows(data):
+    """
+    Assigns an integer code to each distinct value of a series (or distinct row of a dataframe) using
+    :meth:`pandas:pandas.factorize`.  Missing values are treated as one more distinct value rather than being dropped.
+
+    :param data: series or dataframe
+    :type data: :class:`pandas:pandas.Series` or :class:`pandas:pandas.DataFrame`
+    :return: tuple of the code of each row & the position of the first row with each code (ordered by code)
+    :raises TypeError: if the data contains unhashable values (EX: lists)
+    """
+    frame = data if isinstance(data, pd.DataFrame) else data.to_frame()
+    codes = np.zeros(len(frame), dtype=np.int64)
+    for i in range(len(frame.columns)):
+        col_codes, col_uniques = pd.factorize(frame.iloc[:, i])
+        col_codes = np.where(col_codes < 0, len(col_uniques), col_codes)
+        if i == 0:
+            codes = col_codes
+        else:
+            codes, _ = pd.factorize(codes * (len(col_uniques) + 1) + col_codes)
+    _, first = np.unique(codes, return_index=True)
+    return codes, first
+
+
+def transform_unique(s, transform):
+    """
+    Applies a transformation which maps each value of a series independently of the others (EX: string cleaners) to
+    the distinct values of the series only and broadcasts the results back to every row.  A column with millions of
+    rows but only thousands of distinct values is transformed in the time it takes to transform those thousands.
+
+    :param s: series (or dataframe whose rows are mapped independently of each other)
+    :type s: :class:`pandas:pandas.Series` or :class:`pandas:pandas.DataFrame`
+    :param transform: function which takes a series (or dataframe) & returns a series of the same length
+    :type transform: func
+    :rtype: :class:`pandas:pandas.Series`
+    """
+    try:
+        codes, first = factorize_rows(s)
+    except TypeError:  # unhashable values
+        return transform(s)
+    output = transform(s.iloc[first].reset_index(drop=True)).iloc[codes]
+    output.index = s.index
+    return output
+
+
+def apply_unique(data, func):
+    """
+    Same as :meth:`dtale.utils.apply` except the function is only called once for each distinct value of a series
+    (or distinct row of a dataframe, whose values are passed to the function as positional arguments) and the results
+    are broadcast back to every row.
+
+    :param data: series or dataframe
+    :type data: :class:`pandas:pandas.Series` or :class:`pandas:pandas.DataFrame`
+    :param func: function to apply
+    :type func: func
+    :rtype: :class:`pandas:pandas.Series`
+    """
+    if isinstance(data, pd.DataFrame):
+        return transform_unique(
+            data,
+            lambda df: pd.Series(
+                [func(*row) for row in zip(*(df[c] for c in df.columns))],
+                dtype=None if len(df) else "object",
+            ),
+        )
+    return transform_unique(
+        data,
+        lambda s: pd.Series(
+            [func(v) for v in s], name=s.name, dtype=None if len(s) else "object"
+        ),
+    )
+
+
 def optimize_df(df):
     for col in df.select_dtypes(include=["object"]):
         num_unique_values = len(df[col].unique())
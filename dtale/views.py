@@ -2,13 +2,16 @@
 from __future__ import absolute_import, division
 
 import os
+import sys
 import time
 from builtins import map, range, str, zip
 from collections import namedtuple
 from functools import wraps
 from logging import getLogger
+from multiprocessing.pool import ThreadPool
 
 from flask import (
+    copy_current_request_context,
     current_app,
     json,
     make_response,
@@ -19,15 +22,10 @@ from flask import (
 )
 
 import itertools
-import missingno as msno
-import networkx as nx
 import numpy as np
 import pandas as pd
 import platform
 import requests
-import scipy.stats as sts
-import seaborn as sns
-import xarray as xr
 from six import BytesIO, PY3, string_types, StringIO
 
 import dtale.correlations as correlations
@@ -35,36 +33,48 @@ import dtale.datasets as datasets
 import dtale.env_util as env_util
 import dtale.gage_rnr as gage_rnr
 import dtale.global_state as global_state
+import dtale.jobs as jobs
 import dtale.pandas_util as pandas_util
 import dtale.predefined_filters as predefined_filters
 from dtale import dtale
-from dtale.charts.utils import build_base_chart, CHART_POINTS_LIMIT
+from dtale.charts.utils import (
+    DENSITY_BINS,
+    build_base_chart,
+    build_density_data,
+    downsample,
+)
 from dtale.cli.clickutils import retrieve_version
 from dtale.column_analysis import ColumnAnalysis
-from dtale.column_builders import ColumnBuilder, printable
+from dtale.column_builders import ColumnBuilder
 from dtale.column_filters import ColumnFilter
 from dtale.column_replacements import ColumnReplacement
 from dtale.combine_data import CombineData
-from dtale.describe import load_describe
+from dtale.describe import build_string_stats, load_describe
 from dtale.duplicate_checks import DuplicateCheck
-from dtale.dash_application.charts import (
-    build_raw_chart,
-    chart_url_params,
-    chart_url_querystring,
-    export_chart,
-    export_png,
-    export_chart_data,
-    url_encode_func,
-)
+from dtale.ingestion import read_csv, read_parquet, save_upload, sniff_delimiter
+from dtale.network import load_network
+from dtale.nullity import MATRIX_ROWS, render_missingno
 from dtale.data_reshapers import DataReshaper
 from dtale.code_export import build_code_export
+from dtale.sketches import (
+    KLLSketch,
+    HyperLogLog,
+    approx_quantiles,
+    approx_unique_count,
+    approx_value_counts,
+    use_sketches,
+)
 from dtale.query import (
     build_col_key,
+    build_filter_cache_key,
     build_query,
     build_query_builder,
+    filter_data,
     handle_predefined,
     load_filterable_data,
+    load_filtered_positions,
     load_index_filter,
+    load_sorted_data,
     run_query,
 )
 from dtale.timeseries_analysis import TimeseriesAnalysis
@@ -78,7 +88,7 @@ from dtale.utils import (
     coord_type,
     dict_merge,
     divide_chunks,
-    export_to_csv_buffer,
+    export_to_csv_stream,
     find_dtype,
     find_dtype_formatter,
     format_data,
@@ -87,6 +97,7 @@ from dtale.utils import (
     get_dtypes,
     get_int_arg,
     get_json_arg,
+    get_pool_workers,
     get_str_arg,
     get_url_quote,
     get_url_unquote,
@@ -105,13 +116,13 @@ from dtale.utils import (
     retrieve_grid_params,
     running_with_flask_debug,
     running_with_pytest,
-    sort_df_for_grid,
     unique_count,
 )
 from dtale.translations import text
 
 logger = getLogger(__name__)
 IDX_COL = str("dtale_index")
+PPS_POOL_MIN_COLUMNS = 10
 
 
 def exception_decorator(func):
@@ -125,6 +136,71 @@ def exception_decorator(func):
     return _handle_exceptions
 
 
+def serialize_response(response):
+    """
+    Converts the output of a route into something which can be stored and used to build the same response any number
+    of times.  The body of some responses (EX: streamed files) can only be read once.
+
+    :param response: output of a flask route
+    :return: dict of body, status, mimetype & headers
+    :rtype: dict
+    """
+    response = make_response(response)
+    response.direct_passthrough = False
+    return dict(
+        body=response.get_data(),
+        status=response.status_code,
+        mimetype=response.mimetype,
+        headers=[
+            (key, value)
+            for key, value in response.headers
+            if key.lower() not in ["content-type", "content-length"]
+        ],
+    )
+
+
+def async_decorator(func=None, cancellable=False):
+    """
+    Allows a route to be executed as a background job (using :mod:`dtale.jobs`) by passing "async=true" in its query
+    string.  Rather than holding the HTTP connection open until the work is done the id of the job is returned
+    immediately, its progress can then be polled from /job-status and its output loaded from /job-result.
+
+    Routes handle their own errors (using :meth:`dtale.views.exception_decorator`) so any JSON output containing an
+    error marks the job as failed.
+
+    :param cancellable: whether the route reports its progress using :meth:`dtale.jobs.update_progress`, which is
+                        where cancellation takes effect, routes which don't can't be cancelled once submitted
+    :type cancellable: bool, optional
+    """
+    if func is None:
+        return lambda f: async_decorator(f, cancellable=cancellable)
+
+    @wraps(func)
+    def _handle_async(*args, **kwargs):
+        if not get_bool_arg(request, "async"):
+            return func(*args, **kwargs)
+
+        @copy_current_request_context
+        def _run_job():
+            response = serialize_response(func(*args, **kwargs))
+            if response["mimetype"] == "application/json":
+                output = json.loads(response["body"])
+                if (
+                    isinstance(output, dict)
+                    and output.get("error")
+                    and not output.get("success")
+                ):
+                    raise jobs.JobFailedException(
+                        output["error"], output.get("traceback")
+                    )
+            return response
+
+        job_id = jobs.submit(_run_job, name=request.path, cancellable=cancellable)
+        return jsonify(success=True, job_id=job_id)
+
+    return _handle_async
+
+
 def matplotlib_decorator(func):
     @wraps(func)
     def _handle_matplotlib(*args, **kwargs):
@@ -276,10 +352,15 @@ class DtaleData(object):
     @property
     def data(self):
         """
-        Property which is a reference to the globally stored data associated with this instance
+        Property which is a reference to the globally stored data associated with this instance.  If a sort has been
+        applied from the grid a sorted copy is returned (the stored data is never re-ordered) so in-place updates
+        will only be reflected in D-Tale if they're assigned back to this property.
 
         """
-        return global_state.get_data(self._data_id)
+        # users commonly update this in-place so it can't contain read-only (memory-mapped) columns
+        return load_sorted_data(
+            self._data_id, global_state.get_data(self._data_id, writeable=True)
+        )
 
     @property
     def view_data(self):
@@ -452,6 +533,8 @@ class DtaleData(object):
         :type height: str or int, optional
         :return: :class:`ipython:IPython.display.IFrame`
         """
+        from dtale.dash_application.charts import url_encode_func
+
         try:
             from IPython.display import IFrame
         except ImportError:
@@ -575,6 +658,8 @@ class DtaleData(object):
         :type height: str or int, optional
         :return: :class:`ipython:IPython.display.IFrame`
         """
+        from dtale.dash_application.charts import chart_url_querystring
+
         params = dict(
             chart_type=chart_type,
             query=query,
@@ -660,6 +745,8 @@ class DtaleData(object):
                  - if 'filepath' is specified it will save the chart to the path specified
                  - otherwise it will return the HTML output as a string
         """
+        from dtale.dash_application.charts import build_raw_chart, export_chart
+
         params = dict(
             return_object=return_object,
             chart_type=chart_type,
@@ -718,7 +805,7 @@ class DtaleData(object):
             logger.debug("You must ipython>=5.0 installed to use this functionality")
 
 
-def dtype_formatter(data, dtypes, data_ranges, prev_dtypes=None):
+def dtype_formatter(data, dtypes, data_ranges, prev_dtypes=None, data_id=None):
     """
     Helper function to build formatter for the descriptive information about each column in the dataframe you
     are viewing in D-Tale.  This data is later returned to the browser to help with controlling inputs to functions
@@ -732,28 +819,23 @@ def dtype_formatter(data, dtypes, data_ranges, prev_dtypes=None):
     :type data_ranges: dict, optional
     :param prev_dtypes: previous column information for syncing updates to pre-existing columns
     :type prev_dtypes: dict, optional
+    :param data_id: integer string identifier for a D-Tale process's data.  If specified, the statistics for each
+                    column will be cached and only rebuilt once that column has been altered
+    :type data_id: str, optional
     :return: formatter function which takes column indexes and names
     :rtype: func
     """
 
-    def _formatter(col_index, col):
-        visible = True
-        dtype = dtypes.get(col)
-        if prev_dtypes and col in prev_dtypes:
-            visible = prev_dtypes[col].get("visible", True)
+    def _build_stats(col, dtype):
         s = data[col]
-        dtype_data = dict(
-            name=col,
-            dtype=dtype,
-            index=col_index,
-            visible=visible,
-            hasOutliers=0,
-            hasMissing=1,
-        )
-        if global_state.is_arcticdb:
-            return dtype_data
-
-        dtype_data["unique_ct"] = unique_count(s)
+        dtype_data = dict(dtype=dtype, hasOutliers=0)
+        # statistics of huge columns can be approximated in bounded memory, the error of each is stored in "approx"
+        sketched = use_sketches(s)
+        if sketched:
+            dtype_data["unique_ct"], unique_err = approx_unique_count(s)
+            dtype_data["approx"] = dict(unique_ct=unique_err)
+        else:
+            dtype_data["unique_ct"] = unique_count(s)
         dtype_data["hasMissing"] = int(s.isnull().sum())
         classification = classify_type(dtype)
         if (
@@ -768,6 +850,8 @@ def dtype_formatter(data, dtypes, data_ranges, prev_dtypes=None):
             if not any((np.isnan(v) or np.isinf(v) for v in [o_s, o_e])):
                 dtype_data["hasOutliers"] += int(((s < o_s) | (s > o_e)).sum())
                 dtype_data["outlierRange"] = dict(lower=o_s, upper=o_e)
+                if sketched:
+                    dtype_data["approx"]["outlierRange"] = KLLSketch().rank_error
             skew_val = pandas_util.run_function(s, "skew")
             if skew_val is not None:
                 dtype_data["skew"] = json_float(skew_val)
@@ -778,11 +862,16 @@ def dtype_formatter(data, dtypes, data_ranges, prev_dtypes=None):
         if classification in ["F", "I"] and not s.isnull().all():
             # build variance flag
             unique_ct = dtype_data["unique_ct"]
-            check1 = (unique_ct / len(data[col])) < 0.1
+            check1 = (unique_ct / len(s)) < 0.1
             check2 = False
             if check1 and unique_ct >= 2:
-                val_counts = s.value_counts()
-                check2 = (val_counts.values[0] / val_counts.values[1]) > 20
+                if sketched:
+                    val_counts, count_err = approx_value_counts(s)
+                    dtype_data["approx"]["lowVariance"] = count_err
+                else:
+                    val_counts = s.value_counts()
+                if len(val_counts) > 1:
+                    check2 = (val_counts.values[0] / val_counts.values[1]) > 20
             dtype_data["lowVariance"] = bool(check1 and check2)
             dtype_data["coord"] = coord_type(s)
 
@@ -807,9 +896,41 @@ def dtype_formatter(data, dtypes, data_ranges, prev_dtypes=None):
                 dtype_data["hasMissing"] += int(
                     (s.astype("str").str.strip() == "").sum()
                 )
-
         return dtype_data
 
+    cached_stats = {}
+
+    def _load_cached_stats():
+        # loaded on first use since the data may be saved between building this formatter & calling it
+        if "stats" not in cached_stats:
+            cached_stats["stats"] = global_state.get_column_stats(data_id)
+        return cached_stats["stats"]
+
+    def _formatter(col_index, col):
+        visible = True
+        dtype = dtypes.get(col)
+        if prev_dtypes and col in prev_dtypes:
+            visible = prev_dtypes[col].get("visible", True)
+        dtype_data = dict(
+            name=col,
+            dtype=dtype,
+            index=col_index,
+            visible=visible,
+            hasOutliers=0,
+            hasMissing=1,
+        )
+        if global_state.is_arcticdb:
+            return dtype_data
+
+        stats = None
+        if data_id is not None:
+            stats = _load_cached_stats().get(col)
+        if stats is None or stats["dtype"] != dtype:
+            stats = _build_stats(col, dtype)
+            if data_id is not None:
+                global_state.set_column_stats(data_id, col, stats)
+        return dict_merge(dtype_data, stats)
+
     return _formatter
 
 
@@ -832,19 +953,47 @@ def calc_data_ranges(data, dtypes={}):
             return {}
 
 
-def build_dtypes_state(data, prev_state=None, ranges=None):
+def build_dtypes_state(data, prev_state=None, ranges=None, data_id=None, workers=None):
     """
     Helper function to build globally managed state pertaining to a D-Tale instances columns & data types
 
     :param data: dataframe to build data type information for
     :type data: :class:`pandas:pandas.DataFrame`
+    :param data_id: integer string identifier for a D-Tale process's data.  If specified, statistics will only be
+                    calculated for columns which have not been cached since they were last altered
+    :type data_id: str, optional
+    :param workers: number of threads to spread the calculation of column statistics over
+    :type workers: int, optional
     :return: a list of dictionaries containing column names, indexes and data types
     """
     prev_dtypes = {c["name"]: c for c in prev_state or []}
     dtypes = get_dtypes(data)
-    loaded_ranges = ranges or calc_data_ranges(data, dtypes)
-    dtype_f = dtype_formatter(data, dtypes, loaded_ranges, prev_dtypes)
-    return [dtype_f(i, c) for i, c in enumerate(data.columns)]
+    loaded_ranges = ranges
+    if not loaded_ranges:
+        cached_stats = {} if data_id is None else global_state.get_column_stats(data_id)
+        uncached_cols = [
+            c
+            for c in data.columns
+            if (cached_stats.get(c) or {}).get("dtype") != dtypes.get(c)
+        ]
+        if len(uncached_cols) == len(data.columns):
+            loaded_ranges = calc_data_ranges(data, dtypes)
+        elif len(uncached_cols):
+            loaded_ranges = calc_data_ranges(data[uncached_cols], dtypes)
+        else:
+            loaded_ranges = {}
+    dtype_f = dtype_formatter(data, dtypes, loaded_ranges, prev_dtypes, data_id)
+    cols = list(enumerate(data.columns))
+    if (workers or 1) > 1 and len(cols) > 1:
+        # most of the statistics are calculated by numpy/pandas routines which release the GIL so threads
+        # are enough to spread the work across cores without having to copy each column to another process
+        pool = ThreadPool(min(workers, len(cols)))
+        try:
+            return pool.map(lambda col: dtype_f(*col), cols)
+        finally:
+            pool.close()
+            pool.join()
+    return [dtype_f(i, c) for i, c in cols]
 
 
 def check_duplicate_data(data):
@@ -866,6 +1015,12 @@ def check_duplicate_data(data):
             raise DuplicateDataError(d_id)
 
 
+def is_xarray_dataset(data):
+    # xarray is only checked for if it has already been imported, data can't be a Dataset otherwise
+    xr = sys.modules.get("xarray")
+    return xr is not None and isinstance(data, xr.Dataset)
+
+
 def convert_xarray_to_dataset(dataset, **indexers):
     def _convert_zero_dim_dataset(dataset):
         ds_dict = dataset.to_dict()
@@ -947,6 +1102,7 @@ def startup(
     force_save=True,
     main_title=None,
     main_title_font=None,
+    profile_workers=None,
 ):
     """
     Loads and stores data globally
@@ -1012,6 +1168,9 @@ def startup(
     :param highlight_filter: if True, then highlight rows on the frontend which will be filtered when applying a filter
                              rather than hiding them from the dataframe
     :type highlight_filter: boolean, optional
+    :param profile_workers: number of threads to use when calculating the statistics for each column on startup. If
+                            not specified then columns will be profiled one at a time
+    :type profile_workers: int, optional
     """
 
     if (
@@ -1079,6 +1238,7 @@ def startup(
             enable_web_uploads=enable_web_uploads,
             main_title=main_title,
             main_title_font=main_title_font,
+            profile_workers=profile_workers,
         )
         startup_code = (
             "from arcticdb import Arctic\n"
@@ -1106,12 +1266,11 @@ def startup(
             pd.Series,
             pd.DatetimeIndex,
             pd.MultiIndex,
-            xr.Dataset,
             np.ndarray,
             list,
             dict,
         )
-        if not isinstance(data, valid_types):
+        if not isinstance(data, valid_types) and not is_xarray_dataset(data):
             raise Exception(
                 (
                     "data loaded must be one of the following types: pandas.DataFrame, pandas.Series, "
@@ -1119,7 +1278,7 @@ def startup(
                 )
             )
 
-        if isinstance(data, xr.Dataset):
+        if is_xarray_dataset(data):
             df = convert_xarray_to_dataset(data)
             instance = startup(
                 url,
@@ -1156,6 +1315,7 @@ def startup(
                 enable_web_uploads=enable_web_uploads,
                 main_title=main_title,
                 main_title_font=main_title_font,
+                profile_workers=profile_workers,
             )
 
             global_state.set_dataset(instance._data_id, data)
@@ -1208,7 +1368,6 @@ def startup(
             base_settings["predefinedFilters"] = base_predefined
         if sort:
             base_settings["sortInfo"] = sort
-            data = sort_df_for_grid(data, dict(sort=sort))
         if nan_display is not None:
             base_settings["nanDisplay"] = nan_display
         if hide_shutdown is not None:
@@ -1260,7 +1419,11 @@ def startup(
                     + [c for c in dtypes_data.columns if c not in curr_locked]
                 ]
         dtypes_state = build_dtypes_state(
-            dtypes_data, global_state.get_dtypes(data_id) or [], ranges=ranges
+            dtypes_data,
+            global_state.get_dtypes(data_id) or [],
+            ranges=ranges,
+            data_id=data_id,
+            workers=profile_workers,
         )
 
         for col in dtypes_state:
@@ -1811,7 +1974,9 @@ def update_column_position(data_id):
             curr_cols[col_idx + 1] = col
             curr_cols[col_idx] = col_to_shift
 
-    global_state.set_data(data_id, global_state.get_data(data_id)[curr_cols])
+    global_state.set_data(
+        data_id, global_state.get_data(data_id)[curr_cols], changed_columns=[]
+    )
     refresh_col_indexes(data_id)
     return jsonify(success=True)
 
@@ -1841,7 +2006,7 @@ def update_locked(data_id):
     final_cols = curr_settings["locked"] + [
         c for c in curr_data.columns if c not in curr_settings["locked"]
     ]
-    global_state.set_data(data_id, curr_data[final_cols])
+    global_state.set_data(data_id, curr_data[final_cols], changed_columns=[])
     global_state.set_settings(data_id, curr_settings)
     refresh_col_indexes(data_id)
     return jsonify(success=True)
@@ -1883,6 +2048,7 @@ def update_visibility(data_id):
 
 
 @dtale.route("/build-column/<data_id>")
+@async_decorator(cancellable=True)
 @exception_decorator
 def build_column(data_id):
     """
@@ -1893,6 +2059,9 @@ def build_column(data_id):
                  end, quarter start...)
      - bins: bucketing numeric data into bins using :meth:`pandas:pandas.cut` & :meth:`pandas:pandas.qcut`
 
+    Builders which are spread over multiple processes (see :class:`dtale.column_builders.ColumnBuilder`) report their
+    progress when run as a background job by passing "async=true".
+
     :param data_id: integer string identifier for a D-Tale process's data
     :type data_id: str
     :param name: string from flask.request.args['name'] of new column to create
@@ -1921,13 +2090,16 @@ def build_column(data_id):
         builder = ColumnBuilder(data_id, col_type, name, cfg)
         new_col_data = builder.build_column()
         new_cols = []
+        changed_cols = []
         if isinstance(new_col_data, pd.Series):
             pandas_util.assign_col_data(data, name, new_col_data)
             new_cols.append(name)
+            changed_cols.append(name)
         else:
             for i in range(len(new_col_data.columns)):
                 new_col = new_col_data.iloc[:, i]
                 pandas_util.assign_col_data(data, str(new_col.name), new_col)
+                changed_cols.append(str(new_col.name))
 
         new_types = {}
         data_ranges = {}
@@ -1937,8 +2109,8 @@ def build_column(data_id):
                 new_ranges = calc_data_ranges(data[[new_col]])
                 data_ranges[new_col] = new_ranges.get(new_col, data_ranges.get(new_col))
             new_types[new_col] = dtype
-        dtype_f = dtype_formatter(data, new_types, data_ranges)
-        global_state.set_data(data_id, data)
+        dtype_f = dtype_formatter(data, new_types, data_ranges, data_id=data_id)
+        global_state.set_data(data_id, data, changed_columns=changed_cols)
         curr_dtypes = global_state.get_dtypes(data_id)
         if next((cdt for cdt in curr_dtypes if cdt["name"] in new_cols), None):
             curr_dtypes = [
@@ -1983,6 +2155,7 @@ def build_column_bins_tester(data_id):
 
 
 @dtale.route("/duplicates/<data_id>")
+@async_decorator
 @exception_decorator
 def get_duplicates(data_id):
     dupe_type = get_str_arg(request, "type")
@@ -1996,6 +2169,7 @@ def get_duplicates(data_id):
 
 
 @dtale.route("/reshape/<data_id>")
+@async_decorator
 @exception_decorator
 def reshape_data(data_id):
     output = get_str_arg(request, "output")
@@ -2077,7 +2251,7 @@ def build_replacement(data_id):
         curr_col_dtype = dtype_f(col_index, col)
         curr_dtypes = [curr_col_dtype if d["name"] == col else d for d in curr_dtypes]
 
-    global_state.set_data(data_id, data)
+    global_state.set_data(data_id, data, changed_columns=[name or col])
     global_state.set_dtypes(data_id, curr_dtypes)
     curr_history = global_state.get_history(data_id) or []
     curr_history += [builder.build_code()]
@@ -2147,12 +2321,19 @@ def dtypes(data_id):
 def build_sequential_diffs(s, col, sort=None):
     if sort is not None:
         s = s.sort_values(ascending=sort == "ASC")
-    diff = s.diff()
-    diff = diff[diff == diff]  # remove nan or nat values
-    min_diff = diff.min()
-    max_diff = diff.max()
+    if isinstance(s.dtype, np.dtype) and s.dtype.kind in "if":
+        diff = np.diff(s.values)
+        if s.dtype.kind == "i":
+            diff = diff.astype(np.float64)
+        diff = pd.Series(diff[~np.isnan(diff)])
+    else:
+        diff = s.diff()
+        diff = diff[diff == diff]  # remove nan or nat values
     avg_diff = diff.mean()
     diff_vals = diff.value_counts().sort_values(ascending=False)
+    # the extremes can be read from the distinct differences rather than scanning all of them again
+    min_diff = diff_vals.index.min()
+    max_diff = diff_vals.index.max()
     diff_vals.index.name = "value"
     diff_vals.name = "count"
     diff_vals = diff_vals.reset_index()
@@ -2172,7 +2353,7 @@ def build_sequential_diffs(s, col, sort=None):
 
     metrics = {
         "diffs": {
-            "data": diff_vals_f.format_dicts(diff_vals.head(100).itertuples()),
+            "data": diff_vals_f.format_dicts(diff_vals.head(100)),
             "top": diff_ct > 100,
             "total": diff_ct,
         },
@@ -2183,44 +2364,26 @@ def build_sequential_diffs(s, col, sort=None):
     return metrics, code
 
 
-def build_string_metrics(s, col):
-    char_len = s.len()
-
-    def calc_len(x):
-        try:
-            return len(x)
-        except BaseException:
-            return 0
-
-    word_len = apply(s.replace(r"[\s]+", " ").str.split(" "), calc_len)
-
-    def txt_count(r):
-        return s.count(r).astype(bool).sum()
-
-    string_metrics = dict(
-        char_min=int(char_len.min()),
-        char_max=int(char_len.max()),
-        char_mean=json_float(char_len.mean()),
-        char_std=json_float(char_len.std()),
-        with_space=int(txt_count(r"\s")),
-        with_accent=int(txt_count(r"[À-ÖÙ-öù-ÿĀ-žḀ-ỿ]")),
-        with_num=int(txt_count(r"[\d]")),
-        with_upper=int(txt_count(r"[A-Z]")),
-        with_lower=int(txt_count(r"[a-z]")),
-        with_punc=int(
-            txt_count(
-                r'(\!|"|\#|\$|%|&|\'|\(|\)|\*|\+|,|\-|\.|/|\:|\;|\<|\=|\>|\?|@|\[|\\|\]|\^|_|\`|\{|\||\}|\~)'
-            )
-        ),
-        space_at_the_first=int(txt_count(r"^ ")),
-        space_at_the_end=int(txt_count(r" $")),
-        multi_space_after_each_other=int(txt_count(r"\s{2,}")),
-        with_hidden=int(txt_count(r"[^{}]+".format(printable))),
-        word_min=int(word_len.min()),
-        word_max=int(word_len.max()),
-        word_mean=json_float(word_len.mean()),
-        word_std=json_float(word_len.std()),
-    )
+def build_string_metrics(s, col, value_counts=None):
+    """
+    Builds the string metrics of the Describe popup using :meth:`dtale.describe.build_string_stats`.  If the value
+    counts of the column are available only its distinct values need to be scanned.
+
+    :param s: non-null values of a column
+    :type s: :class:`pandas:pandas.Series`
+    :param col: column name
+    :type col: str
+    :param value_counts: output of :meth:`pandas:pandas.Series.value_counts` for the column
+    :type value_counts: :class:`pandas:pandas.Series`, optional
+    :return: tuple of metrics & code
+    """
+    if value_counts is not None:
+        value_counts = value_counts[value_counts > 0]
+        string_metrics = build_string_stats(
+            value_counts.index.astype("str"), value_counts.values
+        )
+    else:
+        string_metrics = build_string_stats(s.astype("str").values)
 
     punc_reg = (
         """\tr'(\\!|"|\\#|\\$|%|&|\\'|\\(|\\)|\\*|\\+|,|\\-|\\.|/|\\:|\\;|\\<|\\=|"""
@@ -2235,7 +2398,7 @@ def build_string_metrics(s, col):
         "\t\treturn len(x)",
         "\texcept:",
         "\t\treturn 0\n",
-        "word_len = s.replace(r'[\\s]+', ' ').str.split(' ').apply(calc_len)\n",
+        "word_len = s.replace(r'[\\s]+', ' ', regex=True).str.split(' ').apply(calc_len)\n",
         "def txt_count(r):",
         "\treturn s.count(r).astype(bool).sum()\n",
         "char_min=char_len.min()",
@@ -2265,6 +2428,7 @@ def build_string_metrics(s, col):
 
 
 @dtale.route("/describe/<data_id>")
+@async_decorator
 @exception_decorator
 def describe(data_id):
     """
@@ -2283,6 +2447,56 @@ def describe(data_id):
 
     """
     column = get_str_arg(request, "col")
+    cache_key = build_describe_cache_key(data_id, column)
+    return_data = None
+    if cache_key is not None:
+        return_data = global_state.get_chart_cache(data_id, cache_key)
+    if return_data is None:
+        return_data = load_column_description(data_id, column)
+        if cache_key is not None:
+            global_state.set_chart_cache(data_id, cache_key, return_data)
+    code = build_code_export(data_id) + return_data["code"]
+    return jsonify(dict_merge(return_data, dict(code="\n".join(code))))
+
+
+def build_describe_cache_key(data_id, column):
+    """
+    Builds the key the output of the Describe popup for a column is cached under.  It covers the version of the data,
+    the sort currently applied (sequential diffs depend on it) and, if the popup is describing the filtered data, the
+    filters currently applied.  The output is not cached for arcticdb since its data can be altered outside of D-Tale.
+    """
+    if global_state.is_arcticdb:
+        return None
+    curr_settings = global_state.get_settings(data_id) or {}
+    filters = None
+    if get_bool_arg(request, "filtered"):
+        filters = build_filter_cache_key(
+            data_id,
+            global_state.get_query(data_id),
+            sort=curr_settings.get("sortInfo"),
+        )
+    sketch_stats = bool(global_state.get_app_settings().get("sketch_stats"))
+    return (
+        "describe",
+        global_state.get_data_token(data_id),
+        column,
+        json.dumps(curr_settings.get("sortInfo") or []),
+        filters,
+        sketch_stats,
+    )
+
+
+def load_column_description(data_id, column):
+    """
+    Builds the output of the Describe popup for a column.  The column's values are hashed at most once, the value
+    counts being shared by the description, the mode, the unique values & the string metrics.
+
+    :param data_id: integer string identifier for a D-Tale process's data
+    :type data_id: str
+    :param column: column name
+    :type column: str
+    :return: dict (with the code snippet stored as a list of lines)
+    """
     curr_settings = global_state.get_settings(data_id) or {}
     columns_to_load = [column]
     indexes = curr_settings.get("indexes", [])
@@ -2306,18 +2520,35 @@ def describe(data_id):
         additional_aggs = ["sum", "median", "mode", "var", "sem"]
     elif classification == "F":
         additional_aggs = ["sum", "median", "var", "sem"]
-    code = build_code_export(data_id)
-    desc, desc_code = load_describe(data[column], additional_aggs=additional_aggs)
-    code += desc_code
+    is_large = global_state.store.get(data_id).is_large
+    approximate = use_sketches(data[column])
+    value_counts = None
+    if not approximate and classification != "F" and not is_large:
+        value_counts = data[column].value_counts()
+    desc, code = load_describe(
+        data[column],
+        additional_aggs=additional_aggs,
+        approximate=approximate,
+        value_counts=value_counts,
+    )
     return_data = dict(describe=desc, success=True)
+    if approximate:
+        return_data["approx"] = dict(
+            unique_ct=HyperLogLog().relative_error, quantiles=KLLSketch().rank_error
+        )
     if "unique" not in return_data["describe"] and "unique_ct" in dtype:
         return_data["describe"]["unique"] = json_int(dtype["unique_ct"], as_string=True)
     for p in ["skew", "kurt"]:
         if p in dtype:
             return_data["describe"][p] = dtype[p]
 
-    if classification != "F" and not global_state.store.get(data_id).is_large:
-        uniq_vals = data[column].value_counts().sort_values(ascending=False)
+    if classification != "F" and not is_large:
+        if approximate:
+            uniq_vals, return_data["approx"]["counts"] = approx_value_counts(
+                data[column]
+            )
+        else:
+            uniq_vals = value_counts.sort_values(ascending=False)
         uniq_vals.index.name = "value"
         uniq_vals.name = "count"
         uniq_vals = uniq_vals.reset_index()
@@ -2380,13 +2611,10 @@ def describe(data_id):
             uniq_grp["value"] = uniq_grp["value"].astype(conversion_type)
             uniq_f, _ = build_formatters(uniq_grp)
             return_data["uniques"][uniq_type] = dict(
-                data=uniq_f.format_dicts(uniq_grp.itertuples()), total=total, top=top
+                data=uniq_f.format_dicts(uniq_grp), total=total, top=top
             )
 
-    if (
-        classification in ["I", "F", "D"]
-        and not global_state.store.get(data_id).is_large
-    ):
+    if classification in ["I", "F", "D"] and not is_large:
         sd_metrics, sd_code = build_sequential_diffs(data[column], column)
         return_data["sequential_diffs"] = sd_metrics
         code.append(sd_code)
@@ -2394,13 +2622,13 @@ def describe(data_id):
     if classification == "S":
         str_col = data[column]
         sm_metrics, sm_code = build_string_metrics(
-            str_col[~str_col.isnull()].astype("str").str, column
+            str_col[~str_col.isnull()], column, value_counts=value_counts
         )
         return_data["string_metrics"] = sm_metrics
         code += sm_code
 
-    return_data["code"] = "\n".join(code)
-    return jsonify(return_data)
+    return_data["code"] = code
+    return return_data
 
 
 @dtale.route("/variance/<data_id>")
@@ -2421,11 +2649,17 @@ def variance(data_id):
     }
 
     """
+    import scipy.stats as sts
+
     column = get_str_arg(request, "col")
     data = load_filterable_data(data_id, request)
     s = data[column]
     code = ["s = df['{}']".format(column)]
-    unique_ct = unique_count(s)
+    sketched = use_sketches(s)
+    if sketched:
+        unique_ct, unique_err = approx_unique_count(s)
+    else:
+        unique_ct = unique_count(s)
     code.append("unique_ct = s.unique().size")
     s_size = len(s)
     code.append("s_size = len(s)")
@@ -2433,8 +2667,14 @@ def variance(data_id):
     code.append("check1 = (unique_ct / s_size) < 0.1")
     return_data = dict(check1=dict(unique=unique_ct, size=s_size, result=check1))
     dtype = global_state.get_dtype_info(data_id, column)
-    if unique_ct >= 2:
+    val_counts = []
+    if sketched:
+        return_data["approx"] = dict(unique_ct=unique_err)
+        if unique_ct >= 2:
+            val_counts, return_data["approx"]["counts"] = approx_value_counts(s)
+    elif unique_ct >= 2:
         val_counts = s.value_counts()
+    if len(val_counts) > 1:
         check2 = bool((val_counts.values[0] / val_counts.values[1]) > 20)
         fmt = find_dtype_formatter(dtype["dtype"])
         return_data["check2"] = dict(
@@ -2469,8 +2709,11 @@ def variance(data_id):
 
 def calc_outlier_range(s):
     try:
-        q1 = s.quantile(0.25)
-        q3 = s.quantile(0.75)
+        if use_sketches(s):
+            (q1, q3), _ = approx_quantiles(s, [0.25, 0.75])
+        else:
+            q1 = s.quantile(0.25)
+            q3 = s.quantile(0.75)
     except BaseException:  # this covers the case when a series contains pd.NA
         return np.nan, np.nan
     iqr = q3 - q1
@@ -2570,7 +2813,7 @@ def delete_col(data_id):
     curr_settings["locked"] = [
         c for c in curr_settings.get("locked", []) if c not in columns
     ]
-    global_state.set_data(data_id, data)
+    global_state.set_data(data_id, data, changed_columns=columns)
     global_state.set_dtypes(data_id, dtypes)
     global_state.set_settings(data_id, curr_settings)
     return jsonify(success=True)
@@ -2598,7 +2841,7 @@ def rename_col(data_id):
     curr_settings["locked"] = [
         rename if c == column else c for c in curr_settings.get("locked", [])
     ]
-    global_state.set_data(data_id, data)
+    global_state.set_data(data_id, data, changed_columns=[column, rename])
     global_state.set_dtypes(data_id, dtypes)
     global_state.set_settings(data_id, curr_settings)
     return jsonify(success=True)
@@ -2632,7 +2875,7 @@ def duplicate_col(data_id):
             cols.append(new_col)
             idx += 1
 
-    global_state.set_data(data_id, data[cols])
+    global_state.set_data(data_id, data[cols], changed_columns=[new_col])
     global_state.set_dtypes(data_id, dtypes)
     return jsonify(success=True, col=new_col)
 
@@ -2646,14 +2889,13 @@ def edit_cell(data_id):
     updated_str = updated
 
     # make sure to load filtered data in order to get correct row index
-    data = run_query(
-        handle_predefined(data_id),
-        build_query(data_id, global_state.get_query(data_id)),
-        global_state.get_context_variables(data_id),
-        ignore_empty=True,
+    positions, _ = load_filtered_positions(
+        data_id,
+        global_state.get_query(data_id),
+        sort=(global_state.get_settings(data_id) or {}).get("sortInfo"),
     )
-    row_index_val = data.iloc[[row_index]].index[0]
-    data = global_state.get_data(data_id)
+    data = global_state.get_data(data_id, writeable=True)
+    row_index_val = data.index[positions[row_index]]
     dtype = find_dtype(data[column])
 
     code = []
@@ -2719,7 +2961,7 @@ def edit_cell(data_id):
                 row_index=row_index_val, column=column, updated=updated_str
             )
         )
-    global_state.set_data(data_id, data)
+    global_state.set_data(data_id, data, changed_columns=[column])
     curr_history = global_state.get_history(data_id) or []
     curr_history += code
     global_state.set_history(data_id, curr_history)
@@ -2727,7 +2969,7 @@ def edit_cell(data_id):
     data = global_state.get_data(data_id)
     dtypes = global_state.get_dtypes(data_id)
     ranges = calc_data_ranges(data[[column]])
-    dtype_f = dtype_formatter(data, {column: dtype}, ranges)
+    dtype_f = dtype_formatter(data, {column: dtype}, ranges, data_id=data_id)
     dtypes = [
         dtype_f(dt["index"], column) if dt["name"] == column else dt for dt in dtypes
     ]
@@ -2865,7 +3107,7 @@ def get_data(data_id):
                 data = data[
                     curr_locked + [c for c in data.columns if c not in curr_locked]
                 ]
-                results = f.format_dicts(data.itertuples())
+                results = f.format_dicts(data)
                 results = [dict_merge({IDX_COL: i}, r) for i, r in enumerate(results)]
             elif query_builder:
                 df = instance.load_data(
@@ -2882,7 +3124,7 @@ def get_data(data_id):
                     sub_range = list(map(int, sub_range.split("-")))
                     if len(sub_range) == 1:
                         sub_df = df.iloc[sub_range[0] : sub_range[0] + 1]
-                        sub_df = f.format_dicts(sub_df.itertuples())
+                        sub_df = f.format_dicts(sub_df)
                         results[sub_range[0]] = dict_merge(
                             {IDX_COL: sub_range[0]}, sub_df[0]
                         )
@@ -2893,7 +3135,7 @@ def get_data(data_id):
                             if end >= total - 1
                             else df.iloc[start : end + 1]
                         )
-                        sub_df = f.format_dicts(sub_df.itertuples())
+                        sub_df = f.format_dicts(sub_df)
                         for i, d in zip(range(start, end + 1), sub_df):
                             results[i] = dict_merge({IDX_COL: i}, d)
             elif len(date_range):
@@ -2905,7 +3147,7 @@ def get_data(data_id):
                     sub_range = list(map(int, sub_range.split("-")))
                     if len(sub_range) == 1:
                         sub_df = df.iloc[sub_range[0] : sub_range[0] + 1]
-                        sub_df = f.format_dicts(sub_df.itertuples())
+                        sub_df = f.format_dicts(sub_df)
                         results[sub_range[0]] = dict_merge(
                             {IDX_COL: sub_range[0]}, sub_df[0]
                         )
@@ -2916,7 +3158,7 @@ def get_data(data_id):
                             if end >= total - 1
                             else df.iloc[start : end + 1]
                         )
-                        sub_df = f.format_dicts(sub_df.itertuples())
+                        sub_df = f.format_dicts(sub_df)
                         for i, d in zip(range(start, end + 1), sub_df):
                             results[i] = dict_merge({IDX_COL: i}, d)
             else:
@@ -2932,7 +3174,7 @@ def get_data(data_id):
                             curr_locked
                             + [c for c in sub_df.columns if c not in curr_locked]
                         ]
-                        sub_df = f.format_dicts(sub_df.itertuples())
+                        sub_df = f.format_dicts(sub_df)
                         results[sub_range[0]] = dict_merge(
                             {IDX_COL: sub_range[0]}, sub_df[0]
                         )
@@ -2947,7 +3189,7 @@ def get_data(data_id):
                             curr_locked
                             + [c for c in sub_df.columns if c not in curr_locked]
                         ]
-                        sub_df = f.format_dicts(sub_df.itertuples())
+                        sub_df = f.format_dicts(sub_df)
                         for i, d in zip(range(start, end + 1), sub_df):
                             results[i] = dict_merge({IDX_COL: i}, d)
     else:
@@ -2959,50 +3201,50 @@ def get_data(data_id):
         if any(c not in curr_dtypes for c in data.columns):
             data, _ = format_data(data)
             data = data[curr_locked + [c for c in data.columns if c not in curr_locked]]
-            global_state.set_data(data_id, data)
+            global_state.set_data(
+                data_id,
+                data,
+                changed_columns=[c for c in data.columns if c not in curr_dtypes],
+            )
             global_state.set_dtypes(
                 data_id,
-                build_dtypes_state(data, global_state.get_dtypes(data_id) or []),
+                build_dtypes_state(
+                    data, global_state.get_dtypes(data_id) or [], data_id=data_id
+                ),
             )
 
         col_types = global_state.get_dtypes(data_id)
         f = grid_formatter(
             col_types, nan_display=curr_settings.get("nanDisplay", "nan")
         )
-        if curr_settings.get("sortInfo") != params.get("sort"):
-            data = sort_df_for_grid(data, params)
-            global_state.set_data(data_id, data)
         if params.get("sort") is not None:
             curr_settings = dict_merge(curr_settings, dict(sortInfo=params["sort"]))
         else:
             curr_settings = {k: v for k, v in curr_settings.items() if k != "sortInfo"}
-        filtered_indexes = []
-        data = run_query(
-            handle_predefined(data_id),
-            final_query,
-            global_state.get_context_variables(data_id),
-            ignore_empty=True,
+        positions, filtered_indexes = load_filtered_positions(
+            data_id,
+            global_state.get_query(data_id),
+            sort=params.get("sort"),
             highlight_filter=highlight_filter,
         )
-        if highlight_filter:
-            data, filtered_indexes = data
         global_state.set_settings(data_id, curr_settings)
 
-        total = len(data)
+        total = len(positions)
         results = {}
         if total:
             if export:
                 export_rows = get_int_arg(request, "export_rows")
                 if export_rows:
-                    data = data.head(export_rows)
-                results = f.format_dicts(data.itertuples())
+                    positions = positions[:export_rows]
+                data = data.iloc[positions]
+                results = f.format_dicts(data)
                 results = [dict_merge({IDX_COL: i}, r) for i, r in enumerate(results)]
             else:
                 for sub_range in ids:
                     sub_range = list(map(int, sub_range.split("-")))
                     if len(sub_range) == 1:
-                        sub_df = data.iloc[sub_range[0] : sub_range[0] + 1]
-                        sub_df = f.format_dicts(sub_df.itertuples())
+                        sub_df = data.iloc[positions[sub_range[0] : sub_range[0] + 1]]
+                        sub_df = f.format_dicts(sub_df)
                         results[sub_range[0]] = dict_merge(
                             {IDX_COL: sub_range[0]}, sub_df[0]
                         )
@@ -3011,11 +3253,11 @@ def get_data(data_id):
                     else:
                         [start, end] = sub_range
                         sub_df = (
-                            data.iloc[start:]
+                            data.iloc[positions[start:]]
                             if end >= total - 1
-                            else data.iloc[start : end + 1]
+                            else data.iloc[positions[start : end + 1]]
                         )
-                        sub_df = f.format_dicts(sub_df.itertuples())
+                        sub_df = f.format_dicts(sub_df)
                         for i, d in zip(range(start, end + 1), sub_df):
                             results[i] = dict_merge({IDX_COL: i}, d)
                             if highlight_filter and i in filtered_indexes:
@@ -3106,12 +3348,7 @@ def load_filtered_ranges(data_id):
     curr_filtered_ranges = curr_settings.get("filteredRanges", {})
     if final_query == curr_filtered_ranges.get("query"):
         return jsonify(curr_filtered_ranges)
-    data = run_query(
-        handle_predefined(data_id),
-        final_query,
-        global_state.get_context_variables(data_id),
-        ignore_empty=True,
-    )
+    data = filter_data(data_id, global_state.get_query(data_id), ignore_empty=True)
 
     def _filter_numeric(col):
         s = data[col]
@@ -3142,33 +3379,32 @@ def load_filtered_ranges(data_id):
 @exception_decorator
 def data_export(data_id):
     curr_dtypes = global_state.get_dtypes(data_id) or []
-    data = run_query(
-        handle_predefined(data_id),
-        build_query(data_id, global_state.get_query(data_id)),
-        global_state.get_context_variables(data_id),
-        ignore_empty=True,
+    positions, _ = load_filtered_positions(
+        data_id,
+        global_state.get_query(data_id),
+        sort=(global_state.get_settings(data_id) or {}).get("sortInfo"),
     )
-    data = data[
-        [
-            c["name"]
-            for c in sorted(curr_dtypes, key=lambda c: c["index"])
-            if c["visible"]
-        ]
+    data = global_state.get_data(data_id)
+    columns = [
+        c["name"] for c in sorted(curr_dtypes, key=lambda c: c["index"]) if c["visible"]
     ]
+    # the output is streamed in chunks of rows so the full export is never held in memory
     file_type = get_str_arg(request, "type", "csv")
     if file_type in ["csv", "tsv"]:
         tsv = file_type == "tsv"
-        csv_buffer = export_to_csv_buffer(data, tsv=tsv)
+        csv_stream = export_to_csv_stream(
+            data, tsv=tsv, positions=positions, columns=columns
+        )
         filename = build_chart_filename("data", ext=file_type)
-        return send_file(csv_buffer.getvalue(), filename, "text/{}".format(file_type))
+        return send_file(csv_stream, filename, "text/{}".format(file_type))
     elif file_type == "parquet":
-        from dtale.utils import export_to_parquet_buffer
+        from dtale.utils import export_to_parquet_stream
 
-        parquet_buffer = export_to_parquet_buffer(data)
-        filename = build_chart_filename("data", ext="parquet.gzip")
-        return send_file(
-            parquet_buffer.getvalue(), filename, "application/octet-stream"
+        parquet_stream = export_to_parquet_stream(
+            data, positions=positions, columns=columns
         )
+        filename = build_chart_filename("data", ext="parquet.gzip")
+        return send_file(parquet_stream, filename, "application/octet-stream")
     return jsonify(success=False)
 
 
@@ -3204,6 +3440,7 @@ def build_correlations_matrix_image(
     code,
 ):
     import matplotlib.pyplot as plt
+    import seaborn as sns
     from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
 
     plt.figure(figsize=(20, 12))
@@ -3233,9 +3470,52 @@ def build_correlations_matrix_image(
 
 
 def build_correlations_matrix(data_id, is_pps=False, encode_strings=False, image=False):
+    query = build_query(data_id, global_state.get_query(data_id))
+    cache_key = ("matrix",) + correlations.build_cache_key(
+        data_id, query, encode_strings=encode_strings, is_pps=is_pps
+    )
+    matrix_data = global_state.get_correlations_cache(data_id, cache_key)
+    if matrix_data is None:
+        matrix_data = _build_correlations_matrix(
+            data_id, query, is_pps=is_pps, encode_strings=encode_strings
+        )
+        global_state.set_correlations_cache(data_id, cache_key, matrix_data)
+    (
+        valid_corr_cols,
+        valid_str_corr_cols,
+        valid_date_cols,
+        dummy_col_mappings,
+        pps_data,
+        code,
+        data,
+    ) = matrix_data
+    if image:
+        return build_correlations_matrix_image(
+            data,
+            is_pps,
+            valid_corr_cols,
+            valid_str_corr_cols,
+            valid_date_cols,
+            dummy_col_mappings,
+            pps_data,
+            code,
+        )
+    # hand back copies so callers can't alter what's been cached
+    return (
+        list(valid_corr_cols),
+        list(valid_str_corr_cols),
+        valid_date_cols,
+        dummy_col_mappings,
+        pps_data,
+        code,
+        data.copy(),
+    )
+
+
+def _build_correlations_matrix(data_id, query, is_pps=False, encode_strings=False):
     data = run_query(
         handle_predefined(data_id),
-        build_query(data_id, global_state.get_query(data_id)),
+        query,
         global_state.get_context_variables(data_id),
     )
     valid_corr_cols, valid_str_corr_cols, valid_date_cols = correlations.get_col_groups(
@@ -3297,17 +3577,6 @@ def build_correlations_matrix(data_id, is_pps=False, encode_strings=False, image
     code = "\n".join(code)
     if isinstance(data, pd.DataFrame):
         data.index.name = str("column")
-    if image:
-        return build_correlations_matrix_image(
-            data,
-            is_pps,
-            valid_corr_cols,
-            valid_str_corr_cols,
-            valid_date_cols,
-            dummy_col_mappings,
-            pps_data,
-            code,
-        )
     return (
         valid_corr_cols,
         valid_str_corr_cols,
@@ -3320,6 +3589,7 @@ def build_correlations_matrix(data_id, is_pps=False, encode_strings=False, image
 
 
 @dtale.route("/correlations/<data_id>")
+@async_decorator(cancellable=True)
 @exception_decorator
 def get_correlations(data_id):
     """
@@ -3361,7 +3631,7 @@ def get_correlations(data_id):
     col_types = grid_columns(data)
     f = grid_formatter(col_types, nan_display=None)
     return jsonify(
-        data=f.format_dicts(data.itertuples()),
+        data=f.format_dicts(data),
         dates=valid_date_cols,
         strings=valid_str_corr_cols,
         dummyColMappings=dummy_col_mappings,
@@ -3394,6 +3664,10 @@ def get_chart_data(data_id):
     :param agg: string from flask.request.args['agg'] points to a specific function that can be applied to
                 :func: pandas.core.groupby.DataFrameGroupBy.  Possible values are: count, first, last mean,
                 median, min, max, std, var, mad, prod, sum
+    :param chartType: string from flask.request.args['chartType'] type of chart being built, only line & scatter
+                      charts are downsampled
+    :param width: integer from flask.request.args['width'] pixel width of the chart which line & scatter data is
+                  downsampled to
     :returns: JSON {
         data: {
             series1: { x: [x1, x2, ..., xN], y: [y1, y2, ..., yN] },
@@ -3420,6 +3694,14 @@ def get_chart_data(data_id):
     allow_duplicates = get_bool_arg(request, "allowDupes")
     window = get_int_arg(request, "rollingWin")
     comp = get_str_arg(request, "rollingComp")
+    chart_type = get_str_arg(request, "chartType")
+    chart_kwargs = {}
+    if chart_type in ["line", "scatter"]:
+        chart_kwargs["downsample_width"] = (
+            get_int_arg(request, "width")
+            or global_state.get_chart_settings()["downsample_width"]
+        )
+        chart_kwargs["downsample_method"] = "lttb" if chart_type == "line" else "minmax"
     data, code = build_base_chart(
         data,
         x,
@@ -3429,6 +3711,7 @@ def get_chart_data(data_id):
         allow_duplicates=allow_duplicates,
         rolling_win=window,
         rolling_comp=comp,
+        **chart_kwargs
     )
     data["success"] = True
     return jsonify(data)
@@ -3456,7 +3739,23 @@ def get_ppscore_matrix(df):
     try:
         import dtale.ppscore as ppscore
 
-        pps_data = ppscore.matrix(df)
+        # scoring each pair of columns requires cross-validating a model so wide data can be spread over processes
+        workers = None
+        if len(df.columns) >= PPS_POOL_MIN_COLUMNS:
+            workers = get_pool_workers(
+                global_state.get_app_settings().get("pps_workers")
+            )
+        total = len(df.columns) ** 2
+        scores = []
+        for score in ppscore.iter_matrix(df, workers=workers):
+            scores.append(score)
+            jobs.update_progress(
+                len(scores) / float(total),
+                "Calculated {} of {} predictive power scores".format(
+                    len(scores), total
+                ),
+            )
+        pps_data = pd.DataFrame(scores)
         data = (
             pps_data[["x", "y", "ppscore"]].set_index(["x", "y"]).unstack()["ppscore"]
         )
@@ -3466,6 +3765,8 @@ def get_ppscore_matrix(df):
         pps_data = format_grid(pps_data)
         pps_data = pps_data["results"]
         return data, pps_data
+    except jobs.JobCancelledException:
+        raise
     except BaseException:
         return [], None
 
@@ -3606,6 +3907,13 @@ def get_scatter(data_id):
     :param cols: comma-separated string from flask.request.args['cols'] containing names of two columns in dataframe
     :param dateCol: string from flask.request.args['dateCol'] with name of date-type column in dateframe for timeseries
     :param date: string from flask.request.args['date'] date value in dateCol to filter dataframe to
+    :param width: integer from flask.request.args['width'] pixel width of the chart, scatters with more points than
+                  the "scatter_points" chart setting are decimated to it
+    :param density: boolean from flask.request.args['density'] if true the points will be rasterized into a grid of
+                    counts rather than returned individually
+    :param bins: integer from flask.request.args['bins'] number of bins along each axis of a density grid
+    :param xRange: JSON string from flask.request.args['xRange'] [min, max] of the visible x-axis of a density grid
+    :param yRange: JSON string from flask.request.args['yRange'] [min, max] of the visible y-axis of a density grid
     :returns: JSON {
         data: [{col1: 0.123, col2: 0.123, index: 1},...,{col1: 0.123, col2: 0.123, index: N}],
         stats: {
@@ -3716,17 +4024,34 @@ def get_scatter(data_id):
         ).format(col1=col1, col2=col2, idx_col=idx_col)
     )
 
-    max_points = global_state.get_chart_settings()["scatter_points"]
-    if len(data) > max_points:
-        return jsonify(
-            stats=stats,
-            code="\n".join(code),
-            error="Dataset exceeds {:,} records, cannot render scatter. Please apply filter...".format(
-                max_points
-            ),
-            traceback=CHART_POINTS_LIMIT,
+    if get_bool_arg(request, "density"):
+        # rasterize the points into a grid of counts, ranges are passed when the chart has been zoomed
+        data = dict(
+            density=build_density_data(
+                data,
+                col1,
+                col2,
+                bins=get_int_arg(request, "bins", DENSITY_BINS),
+                x_range=get_json_arg(request, "xRange"),
+                y_range=get_json_arg(request, "yRange"),
+            )
+        )
+        code.append(
+            (
+                "\nimport numpy as np\n\n"
+                "counts, x_edges, y_edges = np.histogram2d(\n"
+                "\tscatter_data['{col1}'], scatter_data['{col2}'], bins={bins}\n"
+                ")"
+            ).format(col1=col1, col2=col2, bins=data["density"]["bins"])
+        )
+    else:
+        width = (
+            get_int_arg(request, "width")
+            or global_state.get_chart_settings()["downsample_width"]
         )
-    data, _code = build_base_chart(data, cols[0], y_cols, allow_duplicates=True)
+        # rather than refusing to render, dense scatters are decimated to the points which outline them
+        data = downsample(data, col1, [col2], width, method="minmax")
+        data, _code = build_base_chart(data, cols[0], y_cols, allow_duplicates=True)
     data["x"] = cols[0]
     data["y"] = cols[1]
     data["stats"] = stats
@@ -3824,7 +4149,7 @@ def get_xarray_dimension_values(data_id, dim):
     dim_entries = ds.coords[dim].data
     dim = pd.DataFrame({"value": dim_entries})
     dim_f, _ = build_formatters(dim)
-    return jsonify(data=dim_f.format_dicts(dim.itertuples()))
+    return jsonify(data=dim_f.format_dicts(dim))
 
 
 @dtale.route("/update-xarray-selection/<data_id>")
@@ -3878,6 +4203,8 @@ def send_file(output, filename, content_type):
 @dtale.route("/chart-export/<data_id>")
 @exception_decorator
 def chart_export(data_id):
+    from dtale.dash_application.charts import chart_url_params, export_chart, export_png
+
     export_type = get_str_arg(request, "export_type")
     params = chart_url_params(request.args.to_dict())
     if export_type == "png":
@@ -3894,6 +4221,8 @@ def chart_export(data_id):
 @dtale.route("/chart-export-all/<data_id>")
 @exception_decorator
 def chart_export_all(data_id):
+    from dtale.dash_application.charts import chart_url_params, export_chart
+
     params = chart_url_params(request.args.to_dict())
     params["export_all"] = True
     output = export_chart(data_id, params)
@@ -3905,6 +4234,8 @@ def chart_export_all(data_id):
 @dtale.route("/chart-csv-export/<data_id>")
 @exception_decorator
 def chart_csv_export(data_id):
+    from dtale.dash_application.charts import chart_url_params, export_chart_data
+
     params = chart_url_params(request.args.to_dict())
     csv_buffer = export_chart_data(data_id, params)
     filename = build_chart_filename(params["chart_type"], ext="csv")
@@ -3949,7 +4280,7 @@ UPLOAD_SEPARATORS = {"comma": ",", "tab": "\t", "colon": ":", "pipe": "|"}
 
 
 def build_csv_kwargs(request):
-    # Set engine to python to auto detect delimiter...
+    # a separator of None will be detected from a sample of the file
     kwargs = {"sep": None}
     sep_type = request.form.get("separatorType")
 
@@ -3973,13 +4304,20 @@ def upload():
     for filename in request.files:
         contents = request.files[filename]
         _, ext = os.path.splitext(filename)
+        downcast = request.form.get("downcast") == "true"
         if ext in [".csv", ".tsv"]:
             kwargs = build_csv_kwargs(request)
-            df = pd.read_csv(
-                StringIO(contents.read().decode()), engine="python", **kwargs
-            )
+            # uploads are written to disk in chunks rather than decoded into one giant string
+            path = save_upload(contents, suffix=ext)
+            try:
+                if kwargs["sep"] is None:
+                    kwargs["sep"] = sniff_delimiter(path)
+                df = read_csv(path, downcast=downcast, **kwargs)
+            finally:
+                os.remove(path)
             return load_new_data(
-                df, "df = pd.read_csv('{}', engine='python', sep=None)".format(filename)
+                df,
+                "df = pd.read_csv('{}', sep={})".format(filename, repr(kwargs["sep"])),
             )
         if ext in [".xls", ".xlsx"]:
             engine = "xlrd" if ext == ".xls" else "openpyxl"
@@ -3996,7 +4334,11 @@ def upload():
             }
             return handle_excel_upload(dfs)
         if "parquet" in filename:
-            df = pd.read_parquet(contents)
+            path = save_upload(contents, suffix=ext)
+            try:
+                df = read_parquet(path, downcast=downcast)
+            finally:
+                os.remove(path)
             return load_new_data(df, "df = pd.read_parquet('{}')".format(filename))
         raise Exception("File type of {} is not supported!".format(ext))
 
@@ -4120,119 +4462,39 @@ def build_row_text(data_id):
 @dtale.route("/network-data/<data_id>")
 @exception_decorator
 def network_data(data_id):
-    df = global_state.get_data(data_id)
     to_col = get_str_arg(request, "to")
     from_col = get_str_arg(request, "from")
-    group = get_str_arg(request, "group", "")
-    color = get_str_arg(request, "color", "")
-    weight = get_str_arg(request, "weight")
-
-    nodes = list(df[to_col].unique())
-    nodes += list(df[~df[from_col].isin(nodes)][from_col].unique())
-    nodes = sorted(nodes)
-    nodes = {node: node_id for node_id, node in enumerate(nodes, 1)}
-
-    edge_cols = [to_col, from_col]
-    if weight:
-        edge_cols.append(weight)
-
-    if pandas_util.check_pandas_version("2.1.0"):
-        edges = df[[to_col, from_col]].map(nodes.get)
-    else:
-        edges = df[[to_col, from_col]].applymap(nodes.get)
-    edges.columns = ["to", "from"]
-    if weight:
-        edges.loc[:, "value"] = df[weight]
-    edge_f = grid_formatter(grid_columns(edges), nan_display="nan")
-    edges = edge_f.format_dicts(edges.itertuples())
-
-    def build_mapping(col):
-        if col:
-            return df[[from_col, col]].set_index(from_col)[col].astype("str").to_dict()
-        return {}
-
-    group = build_mapping(group)
-    color = build_mapping(color)
-    groups = {}
-
-    def build_group(node, node_id):
-        group_val = group.get(node, "N/A")
-        groups[group_val] = node_id
-        return group_val
-
-    nodes = [
-        dict(
-            id=node_id,
-            label=node,
-            group=build_group(node, node_id),
-            color=color.get(node),
-        )
-        for node, node_id in nodes.items()
-    ]
-    return jsonify(dict(nodes=nodes, edges=edges, groups=groups, success=True))
+    network = load_network(data_id, to_col, from_col, get_str_arg(request, "weight"))
+    return_data = network.build_data(
+        global_state.get_data(data_id),
+        group=get_str_arg(request, "group", ""),
+        color=get_str_arg(request, "color", ""),
+        columnar=get_bool_arg(request, "columnar"),
+    )
+    return jsonify(dict(success=True, **return_data))
 
 
 @dtale.route("/network-analysis/<data_id>")
 @exception_decorator
 def network_analysis(data_id):
-    df = global_state.get_data(data_id)
-    to_col = get_str_arg(request, "to")
-    from_col = get_str_arg(request, "from")
-    weight = get_str_arg(request, "weight")
-
-    G = nx.Graph()
-    max_edge, min_edge, avg_weight = (None, None, None)
-    if weight:
-        G.add_weighted_edges_from(
-            [tuple(x) for x in df[[to_col, from_col, weight]].values]
-        )
-        sorted_edges = sorted(
-            G.edges(data=True), key=lambda x: x[2]["weight"], reverse=True
-        )
-        max_edge = sorted_edges[0]
-        min_edge = sorted_edges[-1]
-        avg_weight = df[weight].mean()
-    else:
-        G.add_edges_from([tuple(x) for x in df[[to_col, from_col]].values])
-
-    most_connected_node = max(dict(G.degree()).items(), key=lambda x: x[1])
-    return_data = {
-        "node_ct": len(G),
-        "triangle_ct": int(sum(nx.triangles(G).values()) / 3),
-        "most_connected_node": "{} (Connections: {})".format(*most_connected_node),
-        "leaf_ct": sum((1 for edge, degree in dict(G.degree()).items() if degree == 1)),
-        "edge_ct": sum(dict(G.degree()).values()),
-        "max_edge": (
-            None
-            if max_edge is None
-            else "{} (source: {}, target: {})".format(
-                max_edge[-1]["weight"], max_edge[0], max_edge[1]
-            )
-        ),
-        "min_edge": (
-            None
-            if min_edge is None
-            else "{} (source: {}, target: {})".format(
-                min_edge[-1]["weight"], min_edge[0], min_edge[1]
-            )
-        ),
-        "avg_weight": json_float(avg_weight),
-    }
-    return jsonify(dict(data=return_data, success=True))
+    network = load_network(
+        data_id,
+        get_str_arg(request, "to"),
+        get_str_arg(request, "from"),
+        get_str_arg(request, "weight"),
+    )
+    return jsonify(dict(data=network.analysis(), success=True))
 
 
 @dtale.route("/shortest-path/<data_id>")
 @exception_decorator
 def shortest_path(data_id):
-    df = global_state.get_data(data_id)
-    to_col = get_str_arg(request, "to")
-    from_col = get_str_arg(request, "from")
-    start_val = get_str_arg(request, "start")
-    end_val = get_str_arg(request, "end")
-
-    G = nx.Graph()
-    G.add_edges_from([tuple(x) for x in df[[to_col, from_col]].values])
-    shortest_path = nx.shortest_path(G, source=start_val, target=end_val)
+    network = load_network(
+        data_id, get_str_arg(request, "to"), get_str_arg(request, "from")
+    )
+    shortest_path = network.shortest_path(
+        get_str_arg(request, "start"), get_str_arg(request, "end")
+    )
     return jsonify(dict(data=shortest_path, success=True))
 
 
@@ -4258,32 +4520,22 @@ def build_merge():
 
 
 @dtale.route("/missingno/<chart_type>/<data_id>")
+@async_decorator
 @matplotlib_decorator
 @exception_decorator
 def build_missingno_chart(chart_type, data_id):
-    from matplotlib.backends.backend_agg import FigureCanvasAgg as FigureCanvas
-
-    df = global_state.get_data(data_id)
-    if chart_type == "matrix":
-        date_index = get_str_arg(request, "date_index")
-        freq = get_str_arg(request, "freq")
-        if date_index:
-            figure = msno.matrix(df.set_index(date_index), freq=freq)
-        else:
-            figure = msno.matrix(df)
-    elif chart_type == "bar":
-        figure = msno.bar(df)
-    elif chart_type == "heatmap":
-        figure = msno.heatmap(df)
-    elif chart_type == "dendrogram":
-        figure = msno.dendrogram(df)
-
-    output = BytesIO()
-    FigureCanvas(figure.get_figure()).print_png(output)
+    png = render_missingno(
+        data_id,
+        chart_type,
+        date_index=get_str_arg(request, "date_index"),
+        freq=get_str_arg(request, "freq"),
+        rows=get_int_arg(request, "rows", MATRIX_ROWS),
+        sampling=get_str_arg(request, "sampling"),
+    )
     if get_bool_arg(request, "file"):
         fname = "missingno_{}.png".format(chart_type)
-        return send_file(output.getvalue(), fname, "image/png")
-    return Response(output.getvalue(), mimetype="image/png")
+        return send_file(png, fname, "image/png")
+    return Response(png, mimetype="image/png")
 
 
 @dtale.route("/drop-filtered-rows/<data_id>")
@@ -4304,7 +4556,7 @@ def drop_filtered_rows(data_id):
         ignore_empty=True,
     )
     global_state.set_data(data_id, data)
-    global_state.set_dtypes(data_id, build_dtypes_state(data, []))
+    global_state.set_dtypes(data_id, build_dtypes_state(data, [], data_id=data_id))
     curr_predefined = curr_settings.get("predefinedFilters", {})
     global_state.update_settings(
         data_id,
@@ -4350,6 +4602,7 @@ def move_filters_to_custom(data_id):
 
 
 @dtale.route("/gage-rnr/<data_id>")
+@async_decorator
 @exception_decorator
 def build_gage_rnr(data_id):
     data = load_filterable_data(data_id, request)
@@ -4384,6 +4637,7 @@ def build_gage_rnr(data_id):
 
 
 @dtale.route("/timeseries-analysis/<data_id>")
+@async_decorator
 @exception_decorator
 def get_timeseries_analysis(data_id):
     report_type = get_str_arg(request, "type")
@@ -4393,6 +4647,75 @@ def get_timeseries_analysis(data_id):
     return jsonify(dict_merge(dict(success=True), data))
 
 
+@dtale.route("/job-status/<job_id>")
+@exception_decorator
+def get_job_status(job_id):
+    """
+    :class:`flask:flask.Flask` route which returns the status of a job submitted by passing "async=true" to a route
+
+    :param job_id: identifier of the job
+    :type job_id: str
+    :return: JSON {success: True, job: {id, name, status, progress, message, error, traceback}}
+    """
+    job = jobs.get_job(job_id)
+    if job is None:
+        return jsonify(dict(success=False, error="Job {} not found".format(job_id)))
+    return jsonify(success=True, job=job.to_dict())
+
+
+@dtale.route("/job-result/<job_id>")
+@exception_decorator
+def get_job_result(job_id):
+    """
+    :class:`flask:flask.Flask` route which returns the output of a job submitted by passing "async=true" to a route.
+    Once the job has completed this will be the same response the route would have returned synchronously.
+
+    :param job_id: identifier of the job
+    :type job_id: str
+    """
+    job = jobs.get_job(job_id)
+    if job is None:
+        return jsonify(dict(success=False, error="Job {} not found".format(job_id)))
+    if job.status == jobs.ERROR:
+        return jsonify(dict(success=False, error=job.error, traceback=job.traceback))
+    if job.status != jobs.COMPLETE:
+        return jsonify(
+            dict(
+                success=False,
+                error="Job {} is {}".format(job_id, job.status),
+                job=job.to_dict(),
+            )
+        )
+    # the response is rebuilt from its serialized form on each request so it can be loaded more than once
+    return Response(
+        job.result["body"],
+        status=job.result["status"],
+        mimetype=job.result["mimetype"],
+        headers=job.result["headers"],
+    )
+
+
+@dtale.route("/cancel-job/<job_id>")
+@exception_decorator
+def cancel_job(job_id):
+    """
+    :class:`flask:flask.Flask` route which cancels a job submitted by passing "async=true" to a route
+
+    :param job_id: identifier of the job
+    :type job_id: str
+    :return: JSON {success: True/False}
+    """
+    job = jobs.get_job(job_id)
+    if job is not None and not job.cancellable:
+        return jsonify(
+            dict(
+                success=False,
+                error="Job {} does not support cancellation".format(job_id),
+            )
+        )
+    return jsonify(success=jobs.cancel_job(job_id))
+
+
 @dtale.route("/arcticdb/libraries")
 @exception_decorator
 def get_arcticdb_libraries():
@@ -135,6 +135,21 @@ describe('MissingNoCharts', () => {
     expect(openSpy.mock.calls[1][0].startsWith(urlExpected)).toBeTruthy();
   });
 
+  it('includes rows & sampling in matrix chart', async () => {
+    await buildMock();
+    await act(async () => {
+      await fireEvent.load(img()[0]);
+    });
+    expect(img()[0].getAttribute('src')).not.toContain('sampling=');
+    await updateChartType('Matrix');
+    expect(img()[0].getAttribute('src')).toContain('rows=1000&sampling=sample');
+    await updateChartType('Aggregate');
+    await act(async () => {
+      await fireEvent.change(wrapper.container.querySelector('input[type="number"]')!, { target: { value: '500' } });
+    });
+    expect(img()[0].getAttribute('src')).toContain('rows=500&sampling=aggregate');
+  });
+
   it('image loading updates state', async () => {
     await buildMock();
     await act(async () => {
@@ -6,6 +6,7 @@ import { BouncerWrapper } from '../../BouncerWrapper';
 import ButtonToggle from '../../ButtonToggle';
 import FilterSelect from '../../popups/analysis/filters/FilterSelect';
 import ColumnSelect from '../../popups/create/ColumnSelect';
+import { LabeledInput } from '../../popups/create/LabeledInput';
 import { AppActions } from '../../redux/actions/AppActions';
 import { buildURLString } from '../../redux/actions/url-utils';
 import { useAppDispatch, useAppSelector } from '../../redux/hooks';
@@ -28,21 +29,38 @@ export enum MissingNoChart {
   MATRIX = 'matrix',
 }
 
+/** How the rows of a MissingNo matrix are reduced */
+export enum MissingNoSampling {
+  SAMPLE = 'sample',
+  AGGREGATE = 'aggregate',
+}
+
 const buildUrls = (
   dataId: string,
   dateCol: BaseOption<string> | undefined,
   freq: BaseOption<string>,
   chartType: MissingNoChart,
+  rows: string,
+  sampling: MissingNoSampling,
 ): string[] => {
+  const matrixParams: Record<string, string> = {};
+  if (chartType === MissingNoChart.MATRIX) {
+    if (parseInt(rows, 10) > 0) {
+      matrixParams.rows = `${parseInt(rows, 10)}`;
+    }
+    matrixParams.sampling = sampling;
+  }
   const imageUrl = buildURLString(menuFuncs.fullPath(`/dtale/missingno/${chartType}`, dataId), {
     date_index: dateCol?.value ?? '',
     freq: freq.value,
+    ...matrixParams,
     id: `${new Date().getTime()}`,
   });
   const fileUrl = buildURLString(menuFuncs.fullPath(`/dtale/missingno/${chartType}`, dataId), {
     date_index: dateCol?.value ?? '',
     freq: freq.value,
     file: 'true',
+    ...matrixParams,
     id: `${new Date().getTime()}`,
   });
   return [imageUrl, fileUrl];
@@ -58,10 +76,11 @@ const MissingNoCharts: React.FC<WithTranslation> = ({ t }) => {
   const dispatch = useAppDispatch();
   const hideSidePanel = (): PayloadAction<void> => dispatch(AppActions.HideSidePanelAction());
 
-  const [chartOptions, freqOptions] = React.useMemo(
+  const [chartOptions, freqOptions, samplingOptions] = React.useMemo(
     () => [
       Object.values(MissingNoChart).map((value) => ({ value, label: t(`missing:${capitalize(value)}`) })),
       FREQS.map((f) => ({ label: `${f} - ${t(f, { ns: 'missing' })}`, value: f })) as Array<BaseOption<string>>,
+      Object.values(MissingNoSampling).map((value) => ({ value, label: t(`missing:${capitalize(value)}`) })),
     ],
     [t],
   );
@@ -71,6 +90,8 @@ const MissingNoCharts: React.FC<WithTranslation> = ({ t }) => {
   const [freq, setFreq] = React.useState(freqOptions.find((f) => f.value === 'BQ')!);
   const [dateCol, setDateCol] = React.useState<BaseOption<string>>();
   const [dateCols, setDateCols] = React.useState<ColumnDef[]>([]);
+  const [rows, setRows] = React.useState('1000');
+  const [sampling, setSampling] = React.useState(MissingNoSampling.SAMPLE);
   const [imageLoading, setImageLoading] = React.useState(true);
   const [imageUrl, setImageUrl] = React.useState<string>();
   const [fileUrl, setFileUrl] = React.useState<string>();
@@ -90,11 +111,11 @@ const MissingNoCharts: React.FC<WithTranslation> = ({ t }) => {
   }, []);
 
   React.useEffect(() => {
-    const urls = buildUrls(dataId, dateCol, freq, chartType);
+    const urls = buildUrls(dataId, dateCol, freq, chartType, rows, sampling);
     setImageLoading(true);
     setImageUrl(urls[0]);
     setFileUrl(urls[1]);
-  }, [dateCol, freq, chartType]);
+  }, [dateCol, freq, chartType, rows, sampling]);
 
   return (
     <>
@@ -156,6 +177,30 @@ const MissingNoCharts: React.FC<WithTranslation> = ({ t }) => {
             </div>
           </>
         )}
+        {chartType === MissingNoChart.MATRIX && (
+          <>
+            <div className="col-auto">
+              <LabeledInput
+                type="number"
+                label={t('missing:Rows')}
+                value={rows}
+                setter={setRows}
+                inputOptions={{ min: 1 }}
+              />
+            </div>
+            <div className="col-auto">
+              <div className="form-group row">
+                <label className="col-auto col-form-label text-right">{t('missing:Sampling')}</label>
+                <ButtonToggle
+                  options={samplingOptions}
+                  update={(value) => setSampling(value)}
+                  defaultValue={sampling}
+                  disabled={imageLoading}
+                />
+              </div>
+            </div>
+          </>
+        )}
         <div className="col" />
       </div>
       <div className="row h-100">
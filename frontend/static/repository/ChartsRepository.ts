@@ -16,11 +16,13 @@ export type ChartsResponse = DataSpec & GenericRepository.BaseResponse;
  * Load information related to charts.
  *
  * @param url the url to load chart data from.
- * @param chartType the type of chart to load (if scatter then allow for duplicate data)
+ * @param chartType the type of chart to load (if scatter then allow for duplicate data, line & scatter charts are
+ * downsampled to the width of the chart)
  * @return chart data.
  */
 export async function load(url: string, chartType?: BaseOption<string>): Promise<ChartsResponse | undefined> {
+  const chartTypeParam = chartType?.value ? `&chartType=${chartType.value}` : '';
   return await GenericRepository.getDataFromService<ChartsResponse>(
-    `${url}${chartType?.value === 'scatter' ? '&allowDupes=true' : ''}`,
+    `${url}${chartType?.value === 'scatter' ? '&allowDupes=true' : ''}${chartTypeParam}`,
   );
 }
@@ -1,3 +1,4 @@
+import mock
 import numpy as np
 import pandas as pd
 import pytest
@@ -9,7 +10,8 @@ import dtale.pandas_util as pandas_util
 
 from dtale.column_builders import ColumnBuilder, ZERO_STD_ERROR
 from dtale.utils import parse_version
-from tests.dtale import build_data_inst
+from tests import ExitStack
+from tests.dtale import build_data_inst, build_settings
 
 
 def verify_builder(builder, checker):
@@ -141,6 +143,24 @@ def test_cumsum():
     verify_builder(builder, lambda col: col["i_cumsum"].max() == 4950)
 
 
+@pytest.mark.unit
+def test_sequential_builders_follow_sort():
+    df = pd.DataFrame(dict(a=[3, 1, 2]), index=[10, 11, 12])
+    data_id = "1"
+    build_data_inst({data_id: df})
+    build_settings({data_id: {"sortInfo": [["a", "ASC"]]}})
+
+    # the cumulative sum runs in the sorted order but is returned in the stored order
+    output = ColumnBuilder(data_id, "cumsum", "_cumsum", {"cols": ["a"]}).build_column()
+    assert list(output.index) == [10, 11, 12]
+    assert list(output["a_cumsum"]) == [6, 1, 3]
+
+    output = ColumnBuilder(data_id, "diff", "Col1", {"col": "a", "periods": 1})
+    output = output.build_column()
+    assert list(output.index) == [10, 11, 12]
+    assert list(output.fillna(0)) == [1, 0, 1]
+
+
 @pytest.mark.unit
 @pytest.mark.parametrize("custom_data", [dict(rows=1000, cols=3)], indirect=True)
 def test_cumsum_groupby(custom_data):
@@ -258,6 +278,71 @@ def test_similarity():
         verify_builder(builder, lambda col: col.values[-1] == 1)
 
 
+@pytest.mark.unit
+def test_parallel_builders():
+    import dtale.global_state as global_state
+
+    df = pd.DataFrame(
+        dict(a=["a  b", "b", "c!", "a  b"] * 25, b=["d", "b", "d", "d"] * 25),
+        index=range(100, 0, -1),
+    )
+    data_id = "1"
+    build_data_inst({data_id: df})
+
+    with ExitStack() as stack:
+        stack.enter_context(mock.patch("multiprocessing.cpu_count", return_value=2))
+        stack.enter_context(mock.patch("dtale.column_builders.PARALLEL_MIN_ROWS", 2))
+        stack.enter_context(mock.patch("dtale.global_state.APP_SETTINGS", {}))
+        progress = stack.enter_context(mock.patch("dtale.jobs.update_progress"))
+
+        cfg = {"left": "a", "right": "b", "algo": "levenshtein"}
+        # parallel builds are off unless they've been configured
+        assert ColumnBuilder(data_id, "similarity", "Col1", cfg).workers is None
+        expected = ColumnBuilder(data_id, "similarity", "Col1", cfg).build_column()
+        assert not progress.called
+
+        global_state.set_app_settings(dict(column_builder_workers=64))
+        builder = ColumnBuilder(data_id, "similarity", "Col1", cfg)
+        assert builder.workers == 2  # capped at the number of CPUs
+        pd.testing.assert_series_equal(builder.build_column(), expected)
+        assert progress.call_args[0][0] == 1
+
+        cfg = {"type": "string", "length": 20}
+        builder = ColumnBuilder(data_id, "random", "Col1", cfg)
+        output = builder.build_column()
+        assert output.index.equals(df.index)
+        # each worker generates its own random values
+        assert output.nunique() == len(df)
+
+    with ExitStack() as stack:
+        stack.enter_context(mock.patch("multiprocessing.cpu_count", return_value=2))
+        stack.enter_context(mock.patch("dtale.column_builders.PARALLEL_MIN_ROWS", 2))
+        build_in_processes = stack.enter_context(
+            mock.patch(
+                "dtale.column_builders.build_in_processes",
+                side_effect=lambda builder, data, workers: pd.Series(
+                    "x", index=data.index
+                ),
+            )
+        )
+        load_nltk_resources = stack.enter_context(
+            mock.patch("dtale.column_builders.load_nltk_resources")
+        )
+
+        # vectorized cleaners are never worth spreading over processes
+        cfg = {"col": "a", "cleaners": ["drop_multispace", "drop_punctuation"]}
+        output = ColumnBuilder(data_id, "cleaning", "Col1", cfg, workers=2)
+        output = output.build_column()
+        assert output.values[0] == "a b"
+        assert not build_in_processes.called
+
+        cfg = {"col": "a", "cleaners": ["nltk_stopwords"]}
+        ColumnBuilder(data_id, "cleaning", "Col1", cfg, workers=2).build_column()
+        assert build_in_processes.call_count == 1
+        # the nltk resources are downloaded once by the parent rather than by each worker
+        assert load_nltk_resources.call_count == 1
+
+
 @pytest.mark.unit
 def test_standardize():
     df = pd.DataFrame(dict(a=randn(1000)))
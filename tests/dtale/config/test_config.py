@@ -30,6 +30,9 @@ def test_load_app_settings():
         "hide_row_expanders": True,
         "enable_custom_filters": True,
         "enable_web_uploads": True,
+        "sketch_stats": True,
+        "pps_workers": None,
+        "column_builder_workers": None,
     }
     with ExitStack() as stack:
         stack.enter_context(mock.patch("dtale.global_state.APP_SETTINGS", settings))
@@ -49,6 +52,7 @@ def test_load_app_settings():
         assert settings["hide_row_expanders"]
         assert settings["enable_custom_filters"]
         assert settings["enable_web_uploads"]
+        assert settings["sketch_stats"]
 
         load_app_settings(
             load_config_state(os.path.join(os.path.dirname(__file__), "dtale.ini"))
@@ -69,6 +73,9 @@ def test_load_app_settings():
         assert not settings["hide_row_expanders"]
         assert not settings["enable_custom_filters"]
         assert not settings["enable_web_uploads"]
+        assert not settings["sketch_stats"]
+        assert settings["pps_workers"] == 4
+        assert settings["column_builder_workers"] == 2
 
 
 @pytest.mark.unit
@@ -171,6 +178,7 @@ def test_build_show_options(unittest):
     )
     assert not final_options["auto_hide_empty_columns"]
     assert not final_options["highlight_filter"]
+    assert final_options["profile_workers"] == 4
 
     final_options = build_show_options(options)
     assert not final_options["allow_cell_edits"]
@@ -0,0 +1,73 @@
+import mock
+import numpy as np
+import pandas as pd
+import pytest
+
+import dtale.correlations as correlations
+
+
+def build_nan_data(rows=500, cols=12):
+    np.random.seed(0)
+    df = pd.DataFrame(
+        np.random.randn(rows, cols), columns=["c{}".format(i) for i in range(cols)]
+    )
+    df["c1"] = df["c0"] * 2 + df["c1"] * 0.1
+    df["c2"] = 5.0
+    df = df.mask(np.random.rand(rows, cols) < 0.2)
+    df.loc[:, "c3"] = np.nan
+    df.loc[df.index[:3], "c3"] = [1.0, 2.0, 3.0]
+    return df
+
+
+@pytest.mark.unit
+def test_nan_corr():
+    df = build_nan_data()
+    expected = df.corr(method="pearson").values
+    np.testing.assert_allclose(correlations.nan_corr(df.values), expected, atol=1e-10)
+    np.testing.assert_allclose(
+        correlations.nan_corr(df.values, block_size=5), expected, atol=1e-10
+    )
+    assert np.isnan(correlations.nan_corr(df.values)[2]).all()
+
+    complete = df.drop(columns=["c2", "c3"]).dropna()
+    np.testing.assert_allclose(
+        correlations.nan_corr(complete.values, method="spearman"),
+        complete.corr(method="spearman").values,
+        atol=1e-10,
+    )
+
+    # constant over the rows shared with another column but not overall
+    df = pd.DataFrame([[0.1, 1], [0.1, 2], [0.1, 3], [0.7, np.nan]])
+    np.testing.assert_array_equal(correlations.nan_corr(df.values), df.corr().values)
+
+    # columns whose shared rows sit far from the column's overall mean
+    np.random.seed(0)
+    df = pd.DataFrame(
+        dict(
+            a=np.random.randn(200) + 1e7,
+            b=np.random.randn(200),
+            c=np.random.randn(200) * 1e-3,
+        )
+    )
+    df.loc[df.index[:100], "a"] -= 1e7
+    df.loc[df.index[:100], ["b", "c"]] = np.nan
+    np.testing.assert_allclose(
+        correlations.nan_corr(df.values), df.corr().values, atol=1e-10
+    )
+
+    assert correlations.nan_corr(np.empty((0, 2))).shape == (2, 2)
+    with pytest.raises(ValueError):
+        correlations.nan_corr(df.values, method="kendall")
+
+
+@pytest.mark.unit
+def test_build_matrix_with_nans(unittest):
+    df = build_nan_data()
+    cols = list(df.columns)
+    with mock.patch("dtale.correlations.build_code_export", return_value=[]):
+        matrix, code = correlations.build_matrix("1", df, cols)
+    unittest.assertEqual(list(matrix.columns), cols)
+    np.testing.assert_allclose(
+        matrix.values, df.corr(method="pearson").values, atol=1e-10
+    )
+    assert "corr_data.corr(method='pearson')" in code
@@ -1,13 +1,13 @@
 import numpy as np
 import pandas as pd
 import json
+import mock
 import platform
 import pytest
 
 import dtale.global_state as global_state
 import dtale.pandas_util as pandas_util
 
-from dtale.charts.utils import CHART_POINTS_LIMIT
 from dtale.utils import parse_version
 
 from tests.dtale.test_views import app, build_ts_data
@@ -149,6 +149,53 @@ def test_get_correlations(unittest, test_data, rolling_data):
             assert response.content_type == "image/png"
 
 
+@pytest.mark.unit
+def test_get_correlations_cache(unittest, test_data):
+    import dtale.views as views
+    import dtale.correlations as correlations
+
+    with app.test_client() as c:
+        test_data, _ = views.format_data(test_data)
+        build_data_inst({c.port: test_data})
+        build_dtypes({c.port: views.build_dtypes_state(test_data)})
+        build_settings({c.port: {}})
+
+        with mock.patch(
+            "dtale.views.correlations.build_matrix", wraps=correlations.build_matrix
+        ) as build_matrix:
+            first = c.get("/dtale/correlations/{}".format(c.port)).get_json()
+            second = c.get("/dtale/correlations/{}".format(c.port)).get_json()
+            unittest.assertEqual(first, second)
+            assert build_matrix.call_count == 1
+
+            c.get("/dtale/corr-analysis/{}".format(c.port))
+            c.get("/dtale/corr-analysis/{}".format(c.port))
+            assert build_matrix.call_count == 2
+
+            c.get(
+                "/dtale/correlations/{}".format(c.port),
+                query_string={"encodeStrings": True},
+            )
+            assert build_matrix.call_count == 3
+
+            build_settings({c.port: {"query": "security_id > 10"}})
+            c.get("/dtale/correlations/{}".format(c.port))
+            assert build_matrix.call_count == 4
+
+            matrix = global_state.get_correlations_cache(
+                c.port,
+                ("matrix",) + correlations.build_cache_key(c.port, "security_id > 10"),
+            )[-1]
+            df = views.DtaleData(c.port, None).get_corr_matrix(as_df=True)
+            df.loc[:, "foo"] = 100
+            assert not (matrix["foo"] == 100).any()
+
+            build_data_inst({c.port: test_data})
+            c.get("/dtale/correlations/{}".format(c.port))
+            c.get("/dtale/corr-analysis/{}".format(c.port))
+            assert build_matrix.call_count == 6
+
+
 @pytest.mark.skipif(
     parse_version(platform.python_version()) < parse_version("3.6.0")
     or not pandas_util.check_pandas_version("1.0.0"),
@@ -496,14 +543,21 @@ def test_get_scatter(unittest, rolling_data):
                 ),
                 "spearman": 1.0,
             },
-            error="Dataset exceeds 15,000 records, cannot render scatter. Please apply filter...",
-            traceback=CHART_POINTS_LIMIT,
         )
         unittest.assertEqual(
-            {k: v for k, v in response_data.items() if k != "code"},
-            expected,
-            "should return scatter",
+            response_data["stats"], expected["stats"], "should return scatter"
         )
+        # scatters exceeding the points limit are decimated rather than refused
+        assert "error" not in response_data
+        assert 0 < len(response_data["data"]["all"]["x"]) <= 2000
+
+        params["density"] = True
+        params["bins"] = 50
+        response = c.get("/dtale/scatter/{}".format(c.port), query_string=params)
+        response_data = response.get_json()
+        assert response_data["stats"]["correlated"] == 15001
+        assert response_data["density"]["points"] == 15001
+        assert len(response_data["density"]["z"]) == 50
 
     with app.test_client() as c:
         build_data_inst({c.port: test_data})
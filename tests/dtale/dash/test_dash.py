@@ -20,6 +20,7 @@ from dtale.dash_application.charts import (
 )
 from dtale.dash_application.components import Wordcloud
 from dtale.dash_application.layout.layout import REDS, update_label_for_freq_and_agg
+from dtale.query import run_query
 from dtale.utils import dict_merge, make_list, parse_version
 from tests import ExitStack
 from tests.dtale import build_data_inst
@@ -100,7 +101,7 @@ def test_display_page(unittest):
         response = c.post("/dtale/charts/_dash-update-component", json=params)
         resp_data = response.get_json()["response"]
         component_defs = resp_data["popup-content"]["children"]["props"]["children"]
-        x_dd = component_defs[23]["props"]["children"][0]
+        x_dd = component_defs[24]["props"]["children"][0]
         x_dd = x_dd["props"]["children"][0]
         x_dd = x_dd["props"]["children"][0]
         x_dd = x_dd["props"]["children"][0]
@@ -703,7 +704,7 @@ def test_chart_type_changes():
             "..y-multi-input.style...y-single-input.style...z-input.style...group-input.style..."
             "rolling-inputs.style...cpg-input.style...cpy-input.style...barmode-input.style...barsort-input.style..."
             "top-bars-input.style...yaxis-input.style...animate-input.style...animate-by-input.style..."
-            "animate-by-dropdown.options...trendline-input.style...dropna-input.style.."
+            "animate-by-dropdown.options...trendline-input.style...density-input.style...dropna-input.style.."
         )
         inputs = {
             "id": "input-data",
@@ -967,6 +968,16 @@ def test_chart_input_updates(unittest):
                     {"id": "animate-by-dropdown", "property": "value"},
                     {"id": "trendline-dropdown", "property": "value"},
                     {"id": "yaxis-scale", "property": "value"},
+                    {"id": "density-toggle", "property": "on", "value": True},
+                    {"id": "density-bins", "property": "value", "value": 50},
+                    {
+                        "id": "density-range-data",
+                        "property": "data",
+                        "value": {
+                            "density_range": [[0, 1], None],
+                            "density_cols": ["a", "b"],
+                        },
+                    },
                 ],
             }
         )
@@ -986,6 +997,10 @@ def test_chart_input_updates(unittest):
                 "animate_by": None,
                 "trendline": None,
                 "scale": None,
+                "density": True,
+                "density_bins": 50,
+                "density_range": [[0, 1], None],
+                "density_cols": ["a", "b"],
             },
         )
 
@@ -3092,6 +3107,42 @@ def test_build_figure_data():
         )
 
 
+@pytest.mark.unit
+def test_build_figure_data_cache():
+    import dtale.views as views
+
+    df, _ = views.format_data(pd.DataFrame(dict(a=[1, 2, 3], b=[4, 5, 6])))
+    with app.test_client() as c:
+        build_data_inst({c.port: df})
+        inputs = dict(chart_type="line", x="a", y=["b"], agg="sum")
+        expected, code = build_figure_data(c.port, **inputs)
+
+        with mock.patch(
+            "dtale.dash_application.charts.run_query",
+            mock.Mock(side_effect=AssertionError("should use cache")),
+        ):
+            # presentation-only inputs re-use the cached data
+            data, cached_code = build_figure_data(
+                c.port, colorscale="Reds", yaxis={"type": "multi"}, **inputs
+            )
+            assert data == expected
+            assert cached_code == code
+            data["data"]["all"]["x"].append(4)
+            assert build_figure_data(c.port, **inputs)[0] == expected
+
+        with mock.patch(
+            "dtale.dash_application.charts.run_query", wraps=run_query
+        ) as mock_query:
+            build_figure_data(c.port, **dict(inputs, agg="mean"))
+            build_figure_data(c.port, load=50, **inputs)
+            assert mock_query.call_count == 2
+
+            global_state.set_data(c.port, df.head(2))
+            data, _ = build_figure_data(c.port, **inputs)
+            assert mock_query.call_count == 3
+            assert data["data"]["all"]["x"] == [1, 2]
+
+
 @pytest.mark.unit
 def test_chart_wrapper(unittest):
     assert chart_wrapper("1", None)("foo") == "foo"
@@ -3186,6 +3237,153 @@ def test_build_chart_type():
         assert output[0].children[1].children == "chart type: unknown"
 
 
+@pytest.mark.unit
+def test_build_chart_density():
+    from dtale.dash_application.charts import build_chart
+
+    import dtale.views as views
+
+    with app.test_client() as c:
+        df, _ = views.format_data(
+            pd.DataFrame(dict(a=range(1000), b=range(1000), c=range(1000)))
+        )
+        build_data_inst({c.port: df})
+        inputs = dict(x="a", y=["b"], density=True, density_bins=20, query=None)
+        output = build_chart(c.port, chart_type="scatter", **inputs)
+        heatmap = output[0].children[1].figure["data"][0]
+        assert heatmap["type"] == "heatmap"
+        assert len(heatmap["z"]) == 20
+        assert sum(v for row in heatmap["z"] for v in row if v is not None) == 1000
+        assert "np.histogram2d" in output[2][-1]
+
+        inputs["density_range"] = [[0, 99], [0, 99]]
+        output = build_chart(c.port, chart_type="3d_scatter", z="c", **inputs)
+        heatmap = output[0].children[1].figure["data"][0]
+        assert heatmap["z"][0][0] == 2.0
+
+
+@pytest.mark.unit
+def test_build_chart_density_3d_points():
+    from dtale.charts.utils import DENSITY_BINS
+    from dtale.dash_application.charts import build_chart
+
+    import dtale.views as views
+
+    with app.test_client() as c:
+        df, _ = views.format_data(
+            pd.DataFrame(dict(a=range(1000), b=range(1000), c=range(1000)))
+        )
+        build_data_inst({c.port: df})
+        inputs = dict(
+            x="a", y=["b"], z="c", query=None, agg="raw", cpg=False, cpy=False
+        )
+        with mock.patch.object(
+            global_state, "get_chart_settings", return_value={"3d_points": 2000}
+        ):
+            output = build_chart(c.port, chart_type="3d_scatter", **inputs)
+            assert output[0][0].children[1].figure["data"][0]["type"] == "scatter3d"
+
+        # 3D scatters exceeding the "3d_points" chart setting are rasterized
+        with mock.patch.object(
+            global_state, "get_chart_settings", return_value={"3d_points": 500}
+        ):
+            output = build_chart(c.port, chart_type="3d_scatter", **inputs)
+            heatmap = output[0].children[1].figure["data"][0]
+            assert heatmap["type"] == "heatmap"
+            assert len(heatmap["z"]) == DENSITY_BINS
+
+            # ranges zoomed on other columns are ignored
+            output = build_chart(
+                c.port,
+                chart_type="3d_scatter",
+                density_range=[[0, 99], [0, 99]],
+                density_cols=["a", "c"],
+                **inputs
+            )
+            heatmap = output[0].children[1].figure["data"][0]
+            assert heatmap["x"][-1] > 99
+
+
+@pytest.mark.unit
+def test_update_density_range(unittest):
+    from dtale.dash_application.charts import update_density_range
+
+    assert update_density_range({"autosize": True}) is None
+    unittest.assertEqual(
+        update_density_range({"xaxis.range[0]": 1, "xaxis.range[1]": 2}),
+        [[1, 2], None],
+    )
+    unittest.assertEqual(
+        update_density_range({"yaxis.range": [3, 4]}, [[1, 2], None]),
+        [[1, 2], [3, 4]],
+    )
+    unittest.assertEqual(
+        update_density_range({"xaxis.autorange": True}, [[1, 2], [3, 4]]),
+        [None, [3, 4]],
+    )
+
+
+@pytest.mark.unit
+def test_density_zoom(unittest):
+    with app.test_client() as c:
+        inputs = {"chart_type": "scatter", "x": "a", "y": ["b"]}
+        figure = {"data": [{"type": "heatmap"}], "layout": {}}
+
+        def build_params(relayout_data, density_range_data=None):
+            return build_dash_request(
+                "density-range-data.data",
+                "chart-1.relayoutData",
+                {"id": "chart-1", "property": "relayoutData", "value": relayout_data},
+                [
+                    {"id": "chart-1", "property": "figure", "value": figure},
+                    {"id": "input-data", "property": "data", "value": inputs},
+                    {
+                        "id": "density-range-data",
+                        "property": "data",
+                        "value": density_range_data,
+                    },
+                ],
+            )
+
+        zoom = {
+            "xaxis.range[0]": 1,
+            "xaxis.range[1]": 2,
+            "yaxis.range[0]": 3,
+            "yaxis.range[1]": 4,
+        }
+        response = c.post(
+            "/dtale/charts/_dash-update-component", json=build_params(zoom)
+        )
+        unittest.assertEqual(
+            response.get_json()["response"]["density-range-data"]["data"],
+            {"density_range": [[1, 2], [3, 4]], "density_cols": ["a", "b"]},
+        )
+
+        response = c.post(
+            "/dtale/charts/_dash-update-component",
+            json=build_params(
+                {"xaxis.autorange": True},
+                {"density_range": [[1, 2], [3, 4]], "density_cols": ["a", "b"]},
+            ),
+        )
+        unittest.assertEqual(
+            response.get_json()["response"]["density-range-data"]["data"],
+            {"density_range": [None, [3, 4]], "density_cols": ["a", "b"]},
+        )
+
+        # the initial relayout of a newly rendered chart and zooming a regular scatter are ignored
+        response = c.post(
+            "/dtale/charts/_dash-update-component",
+            json=build_params({"autosize": True}),
+        )
+        assert response.status_code == 204
+        figure["data"][0]["type"] = "scatter"
+        response = c.post(
+            "/dtale/charts/_dash-update-component", json=build_params(zoom)
+        )
+        assert response.status_code == 204
+
+
 @pytest.mark.unit
 def test_update_label_for_freq(unittest):
     unittest.assertEqual(
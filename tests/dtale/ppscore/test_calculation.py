@@ -349,6 +349,31 @@ def test_matrix():
     assert invalid_score["ppscore"] == 0
 
 
+@pytest.mark.skipif(sys.version_info < (3, 6), reason="requires python 3.6 or higher")
+def test_iter_matrix():
+    df = pd.read_csv(
+        os.path.join(os.path.dirname(__file__), "..", "..", "data/titanic.csv")
+    )
+    df = df[["Age", "Survived", "Sex", "Pclass", "Name"]]
+
+    def _cases(scores):
+        return [(score["x"], score["y"], score["case"]) for score in scores]
+
+    expected = [pps.score(df, x, y) for x in df for y in df]
+    sequential = list(pps.iter_matrix(df))
+    assert _cases(sequential) == _cases(expected)
+    # deterministic cases which never fit a model
+    for score, expected_score in zip(sequential, expected):
+        if score["case"] not in ["classification", "regression"]:
+            assert score["ppscore"] == expected_score["ppscore"]
+
+    parallel = pps.matrix(df, output="list", workers=2)
+    assert _cases(parallel) == _cases(expected)
+
+    with pytest.raises(AttributeError):
+        list(pps.iter_matrix(df, task="regression"))
+
+
 @pytest.mark.skipif(sys.version_info < (3, 6), reason="requires python 3.6 or higher")
 def test_score_random_seed_none():
     """Test score with random_seed=None generates random seed (covers calculation.py lines 448-450)."""
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -113,3 +114,92 @@ def test_build_spaced_ticks(unittest):
         ],
     }
     unittest.assertEqual(expected, output)
+
+
+@pytest.mark.unit
+def test_lttb_positions():
+    x = np.arange(1000, dtype="float64")
+    y = np.zeros(1000)
+    y[500] = 10.0
+    y[750] = -10.0
+    positions = chart_utils.lttb_positions(x, y, 50)
+    assert len(positions) == 50
+    assert positions[0] == 0 and positions[-1] == 999
+    assert (np.diff(positions) > 0).all()
+    # spikes are retained
+    assert 500 in positions and 750 in positions
+    assert list(chart_utils.lttb_positions(x[:10], y[:10], 50)) == list(range(10))
+
+
+@pytest.mark.unit
+def test_minmax_positions():
+    x = np.repeat(np.arange(10, dtype="float64"), 100)
+    y = np.tile(np.arange(100, dtype="float64"), 10)
+    positions = chart_utils.minmax_positions(x, y, 10)
+    assert len(positions) == 20
+    assert sorted(set(y[positions])) == [0, 99]
+
+    positions = chart_utils.minmax_positions(np.ones(5), np.arange(5.0), 10)
+    assert list(positions) == [0, 4]
+
+
+@pytest.mark.unit
+def test_downsample():
+    df = pd.DataFrame(
+        dict(
+            x=pd.date_range("20200101", periods=5000, freq="min"),
+            a=np.sin(np.arange(5000) / 100.0),
+            b=np.cos(np.arange(5000) / 100.0),
+            c="foo",
+        )
+    )
+    downsampled = chart_utils.downsample(df, "x", ["a", "b", "c"], 100)
+    assert 100 <= len(downsampled) <= 200
+    assert downsampled["x"].is_monotonic_increasing
+    assert chart_utils.downsample(df, "x", ["a"], 10000) is df
+    assert chart_utils.downsample(df, "c", ["a"], 100) is df
+    # scatters are only decimated once they exceed the points limit
+    assert chart_utils.downsample(df, "a", ["b"], 100, method="minmax") is df
+
+
+@pytest.mark.unit
+def test_build_density_data():
+    np.random.seed(0)
+    df = pd.DataFrame(dict(a=np.random.randn(1000), b=np.random.randn(1000)))
+    density = chart_utils.build_density_data(df, "a", "b", bins=10)
+    counts, _, _ = np.histogram2d(df["a"], df["b"], bins=10)
+    grid = np.array(density["z"], dtype="float64")
+    np.testing.assert_array_equal(np.nan_to_num(grid), counts.T)
+    assert density["points"] == 1000
+    assert len(density["x"]) == len(density["y"]) == 10
+
+    # re-binning the visible range of a zoomed chart
+    density = chart_utils.build_density_data(
+        df, "a", "b", bins=10, x_range=[0, 1], y_range=[-1, 0]
+    )
+    counts, _, _ = np.histogram2d(df["a"], df["b"], bins=10, range=[[0, 1], [-1, 0]])
+    grid = np.array(density["z"], dtype="float64")
+    np.testing.assert_array_equal(np.nan_to_num(grid), counts.T)
+    assert density["points"] == counts.sum()
+
+    df = pd.DataFrame(
+        dict(
+            a=pd.date_range("20200101", periods=4),
+            b=[1, 1, 2, 2],
+            c=[1.0, 3.0, 5.0, np.nan],
+        )
+    )
+    density = chart_utils.build_density_data(df, "a", "b", z="c", bins=2)
+    assert density["x"][0].startswith("2020-01-01")
+    assert density["z"] == [[1.0, 3.0], [None, 5.0]]
+
+    with pytest.raises(chart_utils.ChartBuildingError):
+        chart_utils.build_density_data(df.assign(d="foo"), "d", "b")
+
+    # requested grids are bounded so a single request can't allocate an arbitrarily large grid
+    density = chart_utils.build_density_data(df, "a", "b", bins=10**6)
+    assert density["bins"] == chart_utils.MAX_DENSITY_BINS
+    assert len(density["z"]) == chart_utils.MAX_DENSITY_BINS
+    density = chart_utils.build_density_data(df, "a", "b", bins=-5)
+    assert density["bins"] == 1
+    assert density["z"] == [[4.0]]
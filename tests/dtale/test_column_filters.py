@@ -536,3 +536,53 @@ def test_security_valid_filters_still_work():
     fltr = DateFilter("date_col", "D", cfg).build_filter()
     assert fltr is not None
     assert "query" in fltr
+
+
+@pytest.mark.unit
+def test_build_filter_mask():
+    from dtale.column_filters import build_filter_mask
+
+    df = pd.DataFrame(
+        dict(
+            s=["AAA", "aaa", "ABB", None, "abcd"],
+            i=[1, 2, 3, 4, 5],
+            f=[1.5, None, 3.0, 4.5, 2.0],
+            d=pd.to_datetime(
+                ["2020-01-01", "2020-01-02", None, "2020-01-04", "2020-01-05"]
+            ),
+        )
+    )
+    filters = [
+        StringFilter("s", "S", dict(type="string", value=["AAA"])),
+        StringFilter("s", "S", dict(type="string", value=["AAA", "ABB"])),
+        StringFilter("s", "S", dict(type="string", value=["AAA"], operand="ne")),
+        StringFilter("s", "S", dict(type="string", action="startswith", raw="A")),
+        StringFilter(
+            "s",
+            "S",
+            dict(type="string", action="endswith", raw="B", caseSensitive=True),
+        ),
+        StringFilter(
+            "s", "S", dict(type="string", action="contains", raw="b", operand="ne")
+        ),
+        StringFilter("s", "S", dict(type="string", action="regex", raw="^a.c")),
+        StringFilter("s", "S", dict(type="string", action="length", raw="3")),
+        StringFilter("s", "S", dict(type="string", action="length", raw="3,4")),
+        StringFilter("s", "S", dict(type="string", missing=True)),
+        NumericFilter("i", "I", dict(type="int", operand="=", value=[2])),
+        NumericFilter("i", "I", dict(type="int", operand="ne", value=[2, 3])),
+        NumericFilter("f", "F", dict(type="float", operand=">", value=2)),
+        NumericFilter("f", "F", dict(type="float", operand="<=", value="3")),
+        NumericFilter("i", "I", dict(type="int", operand="[]", min=2, max=4)),
+        NumericFilter("f", "F", dict(type="float", operand="()", min=1.5)),
+        NumericFilter("i", "I", dict(type="int", operand="[]", min=3, max=3)),
+        NumericFilter("f", "F", dict(type="float", populated=True)),
+        DateFilter("d", "D", dict(type="date", start="2020-01-02")),
+        DateFilter("d", "D", dict(type="date", start="2020-01-02", end="2020-01-04")),
+        DateFilter("d", "D", dict(type="date", start="2020-01-04", end="2020-01-04")),
+        OutlierFilter("i", "I", dict(query="`i` > 4")),
+    ]
+    for fltr in filters:
+        fltr = fltr.build_filter()
+        expected = df.eval(fltr["query"], engine="python").fillna(False).tolist()
+        assert build_filter_mask(df, fltr).tolist() == expected, fltr["query"]
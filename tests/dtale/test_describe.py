@@ -0,0 +1,117 @@
+import mock
+import numpy as np
+import pandas as pd
+import pytest
+
+from dtale.describe import (
+    STRING_CHAR_CLASSES,
+    build_numeric_stats,
+    build_string_stats,
+    load_describe,
+)
+from tests.dtale import build_data_inst, build_dtypes, build_settings
+
+
+@pytest.mark.unit
+def test_build_numeric_stats():
+    s = pd.Series([4, 1, 3, 3, 10, 2], name="a")
+    stats = build_numeric_stats(s)
+    expected = s.describe()
+    for key in expected.index:
+        np.testing.assert_almost_equal(stats[key], expected[key])
+    for agg in ["sum", "median", "var", "sem"]:
+        np.testing.assert_almost_equal(stats[agg], getattr(s, agg)())
+    assert stats["sum"] == 23 and isinstance(stats["sum"], np.integer)
+
+    s = pd.Series([1.5, np.nan, 2.5], name="b")
+    stats = build_numeric_stats(s)
+    assert stats["count"] == 2
+    np.testing.assert_almost_equal(stats["std"], s.std())
+
+    stats = build_numeric_stats(pd.Series([np.nan], name="c"))
+    assert stats["count"] == 0 and stats["sum"] == 0
+    assert np.isnan(stats["mean"]) and np.isnan(stats["min"])
+
+
+@pytest.mark.unit
+def test_load_describe_value_counts():
+    s = pd.Series(["a", "b", "a", None], name="a")
+    desc, _ = load_describe(s, additional_aggs=["mode"], value_counts=s.value_counts())
+    expected, _ = load_describe(s, additional_aggs=["mode"])
+    assert desc == expected
+
+    s = pd.Series(pd.Categorical(["a", "b", "a"], categories=["a", "b", "c"]))
+    desc, _ = load_describe(s, value_counts=s.value_counts())
+    assert desc["unique"] == "2"
+
+
+@pytest.mark.unit
+def test_build_string_stats():
+    s = pd.Series(
+        [
+            "Hello World",
+            " leading",
+            "trailing ",
+            "trailing newline \n",
+            "double  space",
+            "num123",
+            "café",
+            "punc!@#",
+            "zero​width",
+            "emoji \U0001f600",
+            "",
+            "a b\tc",
+        ]
+    )
+
+    def txt_count(r):
+        return int(s.str.count(r).astype(bool).sum())
+
+    metrics = build_string_stats(s.values)
+    for key, pattern in STRING_CHAR_CLASSES + [
+        ("space_at_the_first", r"^ "),
+        ("space_at_the_end", r" $"),
+        ("multi_space_after_each_other", r"\s{2,}"),
+    ]:
+        assert metrics[key] == txt_count(pattern), key
+    assert metrics["with_hidden"] == 4
+    char_len = s.str.len()
+    assert metrics["char_min"] == char_len.min()
+    assert metrics["char_max"] == char_len.max()
+    assert metrics["char_std"] == round(char_len.std(), 2)
+    word_len = s.str.replace(r"\s+", " ", regex=True).str.split(" ").str.len()
+    assert metrics["word_max"] == word_len.max()
+    assert metrics["word_mean"] == round(word_len.mean(), 2)
+
+    value_counts = pd.concat([s, s.iloc[:3]]).value_counts()
+    weighted = build_string_stats(value_counts.index.values, value_counts.values)
+    assert weighted == build_string_stats(pd.concat([s, s.iloc[:3]]).values)
+
+
+@pytest.mark.unit
+def test_describe_cache(unittest):
+    from dtale.views import build_dtypes_state, format_data
+    from tests.dtale.test_views import app
+    import dtale.global_state as global_state
+
+    df, _ = format_data(pd.DataFrame(dict(a=[1, 2, 2, 3], b=["x", "y", "x", "z"])))
+    with app.test_client() as c:
+        build_data_inst({c.port: df})
+        build_settings({c.port: {}})
+        build_dtypes({c.port: build_dtypes_state(df)})
+
+        resp = c.get("/dtale/describe/{}".format(c.port), query_string=dict(col="a"))
+        expected = resp.get_json()
+        assert expected["success"]
+        with mock.patch(
+            "dtale.views.load_column_description",
+            side_effect=Exception("should be cached"),
+        ):
+            resp = c.get(
+                "/dtale/describe/{}".format(c.port), query_string=dict(col="a")
+            )
+            unittest.assertEqual(resp.get_json(), expected)
+
+        global_state.set_data(c.port, df.assign(a=[5, 5, 5, 6]))
+        resp = c.get("/dtale/describe/{}".format(c.port), query_string=dict(col="a"))
+        assert resp.get_json()["describe"]["mode"] == "5"
@@ -1,4 +1,7 @@
 import json
+
+import mock
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -8,7 +11,7 @@ from dtale.duplicate_checks import (
     NoDuplicatesToShowException,
     RemoveAllDataException,
 )
-from tests.dtale import build_data, build_data_inst
+from tests.dtale import build_data, build_data_inst, build_settings
 
 
 def duplicates_data():
@@ -80,6 +83,69 @@ def test_columns(unittest):
         builder.checker.remove(data[data_id])
 
 
+@pytest.mark.unit
+def test_columns_fingerprints(unittest):
+    from dtale.duplicate_checks import DuplicateColumns
+
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, 3],
+            "b": [1, 2, 3],
+            "c": [1.0, 2.0, 3.0],  # equal values but a different dtype
+            "d": [0.0, np.nan, 1.0],
+            "e": [-0.0, np.nan, 1.0],
+            "f": [[1], [2], [3]],
+            "g": [[1], [2], [3]],
+            "h": [1, 2, 3],
+            # object columns whose values compare equal despite having different types or string representations
+            "i": pd.Series([1, 2, None], dtype=object),
+            "j": pd.Series([1.0, 2.0, np.nan], dtype=object),
+            "k": pd.Series([True, 2, None], dtype=object),
+            "l": pd.Series(["1", "2", None], dtype=object),
+        }
+    )
+
+    def pairwise(df, keep):
+        # the original quadratic check which compares every column with every later column
+        col_indexes = list(range(df.shape[1]))
+        if keep == "last":
+            col_indexes = col_indexes[::-1]
+        duplicates = {}
+        for x_idx, x in enumerate(col_indexes):
+            dupes = [
+                df.columns[y]
+                for y in col_indexes[x_idx + 1 :]
+                if df.iloc[:, x].equals(df.iloc[:, y])
+            ]
+            if dupes:
+                duplicates[df.columns[x]] = dupes
+        return duplicates
+
+    for keep in ["first", "last", "none"]:
+        checker = DuplicateColumns("1", {"keep": keep})
+        unittest.assertEqual(checker.check(df), pairwise(df, keep))
+    unittest.assertEqual(
+        DuplicateColumns("1", {"keep": "first"}).check(df),
+        {
+            "a": ["b", "h"],
+            "b": ["h"],
+            "d": ["e"],
+            "f": ["g"],
+            "i": ["j", "k"],
+            "j": ["k"],
+        },
+    )
+
+    # fingerprint collisions are resolved by comparing the columns exactly
+    with mock.patch.object(
+        DuplicateColumns, "fingerprint", staticmethod(lambda s: str(s.dtype))
+    ):
+        unittest.assertEqual(
+            DuplicateColumns("1", {"keep": "first"}).check(df),
+            pairwise(df, "first"),
+        )
+
+
 @pytest.mark.unit
 def test_column_names(unittest):
     import dtale.global_state as global_state
@@ -129,6 +195,21 @@ def test_column_names(unittest):
         builder.execute()
 
 
+@pytest.mark.unit
+def test_rows_follow_sort():
+    import dtale.global_state as global_state
+
+    global_state.clear_store()
+    data_id = "1"
+    build_data_inst({data_id: pd.DataFrame(dict(a=[1, 1, 2], b=[3, 1, 2]))})
+    build_settings({data_id: {"sortInfo": [["b", "ASC"]]}})
+
+    # the "first" duplicate is the first one within the sort applied from the grid
+    builder = DuplicateCheck(data_id, "rows", {"keep": "first", "subset": ["a"]})
+    new_data_id = builder.execute()
+    assert list(global_state.get_data(new_data_id)["b"]) == [1, 2]
+
+
 @pytest.mark.unit
 def test_rows(unittest):
     import dtale.global_state as global_state
@@ -1,4 +1,6 @@
+import os
 import pickle
+import uuid
 
 import mock
 import pandas as pd
@@ -7,6 +9,7 @@ import pytest
 import dtale.global_state as global_state
 from dtale.global_state import safe_loads, DtaleInstance
 from dtale.views import build_dtypes_state
+from tests import ExitStack
 
 
 def initialize_store(test_data):
@@ -213,6 +216,156 @@ def test_use_shelve_store(unittest, tmpdir, test_data):
     unittest.assertNotEqual(contents_after, get_store_contents())
 
 
+@pytest.mark.unit
+def test_shelve_store_frame_versions(unittest, tmpdir, test_data):
+    initialize_store(test_data)
+    directory = tmpdir.mkdir("test_shelve_store_frame_versions").dirname
+    global_state.use_shelve_store(directory)
+    store = global_state.store
+
+    with ExitStack() as stack:
+        serialize_frame = stack.enter_context(
+            mock.patch(
+                "dtale.global_state.serialize_frame",
+                wraps=global_state.serialize_frame,
+            )
+        )
+        raw_keys = stack.enter_context(
+            mock.patch.object(store, "_raw_keys", wraps=store._raw_keys)
+        )
+        global_state.set_settings("1", dict(locked=["security_id"]))
+        global_state.set_history("1", ["foo"])
+        serialize_frame.assert_not_called()
+
+        global_state.set_data("1", test_data.head(10))
+        assert serialize_frame.call_count == 1
+        # writes only look up the frame they replace instead of scanning the store
+        raw_keys.assert_not_called()
+
+    assert len([k for k in store._raw_keys() if global_state.is_frame_key(k)]) == 2
+    unittest.assertEqual(sorted(store.keys()), ["1", "2"])
+    unittest.assertEqual(global_state.get_settings("1"), dict(locked=["security_id"]))
+
+    store._frame_cache().clear()
+    unittest.assertEqual(
+        serialized_dataframe(global_state.get_data("1")),
+        serialized_dataframe(test_data.head(10)),
+    )
+
+    global_state.cleanup(data_id="1")
+    assert len([k for k in store._raw_keys() if global_state.is_frame_key(k)]) == 1
+
+    # two processes sharing the store which both save a new version of the data starting from the same version
+    other_store = global_state.SafeShelfStore(store.path)
+    data_insts = [other_store.get("2"), store.get("2")]
+    for df, process_store, data_inst in zip(
+        [test_data.head(3), test_data.head(5)], [other_store, store], data_insts
+    ):
+        data_inst.data = df
+        data_inst.data_version += 1
+        data_inst.data_token = str(uuid.uuid4())
+        process_store["2"] = data_inst
+    reader = global_state.SafeShelfStore(store.path)
+    unittest.assertEqual(len(reader.get("2").data), 5)
+    unittest.assertEqual(len(other_store.get("2").data), 5)
+
+
+@pytest.mark.unit
+def test_use_arrow_store(unittest, tmpdir, test_data):
+    initialize_store(test_data)
+    contents_before = get_store_contents()
+    type_before = get_store_type()
+
+    directory = tmpdir.mkdir("test_use_arrow_store").strpath
+    global_state.use_arrow_store(directory)
+    contents_after = get_store_contents()
+    type_after = get_store_type()
+
+    unittest.assertEqual(contents_before, contents_after)
+    unittest.assertNotEqual(type_before, type_after)
+
+    store = global_state.store
+
+    def frame_files():
+        return sorted(os.listdir(store.frames_dir))
+
+    def frame_file(data_id, ext):
+        return "{}_{}{}".format(
+            data_id, global_state.get_data_inst(data_id).data_token, ext
+        )
+
+    unittest.assertEqual(
+        frame_files(), [frame_file("1", ".arrow"), frame_file("2", ".arrow")]
+    )
+
+    global_state.set_data("1", test_data.head(10))
+    unittest.assertEqual(
+        frame_files(), [frame_file("1", ".arrow"), frame_file("2", ".arrow")]
+    )
+
+    store._frame_cache().clear()
+    data = global_state.get_data("1")
+    unittest.assertEqual(
+        serialized_dataframe(data), serialized_dataframe(test_data.head(10))
+    )
+    # numeric columns are read-only views over the memory-mapped file
+    assert not data["foo"].values.flags.writeable
+    data = global_state.get_data("1", writeable=True)
+    data.loc[data.index[0], "foo"] = 5
+    assert data["foo"].values[0] == 5
+
+    global_state.set_data("2", pd.DataFrame({"a": [1, "b", 2.5]}))
+    unittest.assertEqual(
+        frame_files(), [frame_file("1", ".arrow"), frame_file("2", ".pkl")]
+    )
+    store._frame_cache().clear()
+    unittest.assertEqual(global_state.get_data("2")["a"].tolist(), [1, "b", 2.5])
+
+    global_state.cleanup(data_id="1")
+    unittest.assertEqual(frame_files(), [frame_file("2", ".pkl")])
+
+    with mock.patch.dict("sys.modules", {"pyarrow": None}):
+        with pytest.raises(Exception) as error:
+            global_state.use_arrow_store(directory)
+        assert "pyarrow must be installed" in str(error.value)
+
+
+@pytest.mark.unit
+def test_serialize_frame(unittest, test_data):
+    output = global_state.serialize_frame(test_data)
+    unittest.assertEqual(
+        serialized_dataframe(global_state.deserialize_frame(output)),
+        serialized_dataframe(test_data),
+    )
+
+    mixed = pd.DataFrame({"a": [1, "b", 2.5]})
+    output = global_state.serialize_frame(mixed)
+    assert output.startswith(global_state.PICKLE_HEADER)
+    unittest.assertEqual(
+        global_state.deserialize_frame(output)["a"].tolist(), [1, "b", 2.5]
+    )
+
+
+@pytest.mark.unit
+def test_build_arrow_table():
+    df = pd.DataFrame(
+        {
+            "a": [1, 2],
+            "b": ["x", None],
+            "c": pd.Categorical(["u", "v"], ordered=True),
+            "d": pd.array([1, None], dtype="Int64"),
+        },
+        index=pd.Index(["r1", "r2"], name="idx"),
+    )
+    assert global_state.build_arrow_table(df) is not None
+    # object columns Arrow would convert to numbers or nested types
+    for values in [[1, 2], [1, 2.5], [[1], [2]], [{"a": 1}, {"a": 2}]]:
+        df = pd.DataFrame({"a": pd.Series(values, dtype="object")})
+        assert global_state.build_arrow_table(df) is None
+    df = pd.DataFrame({"a": [1, 2]}, index=pd.Index([1, 2], dtype="object"))
+    assert global_state.build_arrow_table(df) is None
+
+
 @pytest.mark.unit
 def test_redis_requirement(builtin_pkg, tmpdir):
     orig_import = __import__
@@ -323,6 +476,10 @@ def test_dtale_instance():
     inst.settings = {"locked": []}
     assert inst.settings == {"locked": []}
 
+    assert inst.data_version == 0
+    inst.data_version += 1
+    assert inst.data_version == 1
+
 
 @pytest.mark.unit
 def test_dtale_instance_none_data():
@@ -380,6 +537,71 @@ def test_set_data_creates_instance():
     assert global_state.size() > 0
 
 
+@pytest.mark.unit
+def test_data_version():
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    global_state.set_data("1", df)
+    assert global_state.get_data_version("1") == 1
+
+    global_state.set_filter_cache("1", "cached")
+    assert global_state.get_filter_cache("1") == "cached"
+    global_state.set_data("1", df)
+    assert global_state.get_data_version("1") == 2
+    assert global_state.get_filter_cache("1") is None
+
+    global_state.set_context_variables("1", {"a": 1})
+    assert global_state.get_data_version("1") == 3
+
+
+@pytest.mark.unit
+def test_column_stats():
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+    global_state.set_data("1", df)
+    global_state.set_column_stats("1", "a", {"unique_ct": 3})
+    global_state.set_column_stats("1", "b", {"unique_ct": 3})
+    assert global_state.get_column_stats("1", "a") == {"unique_ct": 3}
+
+    global_state.set_data("1", df, changed_columns=["a"])
+    assert global_state.get_column_stats("1", "a") is None
+    assert global_state.get_column_stats("1", "b") == {"unique_ct": 3}
+
+    assert global_state.get_column_stats("1") == {"b": {"unique_ct": 3}}
+
+    global_state.set_data("1", df)
+    assert global_state.get_column_stats("1", "b") is None
+
+    # another process saving the data (which only changes the token stored with the instance)
+    global_state.set_column_stats("1", "b", {"unique_ct": 3})
+    data_inst = global_state.get_data_inst("1")
+    data_inst.data_token = str(uuid.uuid4())
+    global_state.store["1"] = data_inst
+    assert global_state.get_column_stats("1", "b") is None
+    assert global_state.get_column_stats("1") == {}
+
+
+@pytest.mark.unit
+def test_cache_keys_follow_data_token():
+    from dtale.correlations import build_cache_key
+    from dtale.query import build_filter_cache_key, load_sort_positions
+
+    global_state.cleanup()
+    global_state.set_data("1", pd.DataFrame({"a": [3, 1, 2]}))
+    sort = [["a", "ASC"]]
+    filter_key = build_filter_cache_key("1", None, sort=sort)
+    corr_key = build_cache_key("1")
+    assert load_sort_positions("1", sort).tolist() == [1, 2, 0]
+
+    # another process saving different data under the same version
+    data_inst = global_state.get_data_inst("1")
+    data_inst.data = pd.DataFrame({"a": [1, 3, 2]})
+    data_inst.data_token = str(uuid.uuid4())
+    global_state.store["1"] = data_inst
+    assert global_state.get_data_version("1") == 1
+    assert build_filter_cache_key("1", None, sort=sort) != filter_key
+    assert build_cache_key("1") != corr_key
+    assert load_sort_positions("1", sort).tolist() == [0, 2, 1]
+
+
 @pytest.mark.unit
 def test_set_name_operations(test_data):
     initialize_store(test_data)
@@ -628,3 +850,33 @@ def test_safe_loads_allows_dtale_instance():
     assert isinstance(result, DtaleInstance)
     assert result.name == "test"
     assert len(result.data) == 2
+
+
+@pytest.mark.unit
+def test_chart_cache():
+    global_state.cleanup()
+    global_state.new_data_inst("1")
+    global_state.new_data_inst("2")
+    with ExitStack() as stack:
+        stack.enter_context(mock.patch("dtale.global_state.CHART_CACHE_SIZE", 3))
+        stack.enter_context(mock.patch("dtale.global_state.CHART_CACHE_BYTES", 100))
+        global_state.set_chart_cache("1", "a", "a", size=10)
+        global_state.set_chart_cache("1", "b", "b", size=10)
+        global_state.set_chart_cache("2", "c", "c", size=10)
+        assert global_state.get_chart_cache("1", "a") == "a"
+        # least recently used entry is evicted once the number of entries is exceeded
+        global_state.set_chart_cache("2", "d", "d", size=10)
+        assert global_state.get_chart_cache("1", "b") is None
+        assert global_state.get_chart_cache("1", "a") == "a"
+
+        # as well as when the number of bytes is exceeded
+        global_state.set_chart_cache("2", "e", "e", size=90)
+        assert global_state.get_chart_cache("2", "c") is None
+        assert global_state.get_chart_cache("2", "d") is None
+        assert global_state.get_chart_cache("1", "a") == "a"
+        assert global_state.get_chart_cache("2", "e") == "e"
+
+        global_state.set_data("2", pd.DataFrame({"a": [1]}))
+        assert global_state.get_chart_cache("2", "e") is None
+        assert global_state.get_chart_cache("1", "a") == "a"
+    global_state.cleanup()
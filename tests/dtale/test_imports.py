@@ -0,0 +1,57 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# analytical dependencies which should only be loaded once the feature using them is
+HEAVY_MODULES = [
+    "dash",
+    "matplotlib",
+    "missingno",
+    "networkx",
+    "plotly.express",
+    "scipy.stats",
+    "seaborn",
+    "sklearn",
+    "squarify",
+    "statsmodels",
+    "xarray",
+]
+# number of seconds a cold "import dtale" is allowed to take, override with DTALE_IMPORT_BUDGET on slow machines
+IMPORT_BUDGET = float(os.environ.get("DTALE_IMPORT_BUDGET", 3.0))
+
+IMPORT_SCRIPT = """
+import json
+import sys
+import time
+
+start = time.time()
+import dtale  # noqa: F401
+
+elapsed = time.time() - start
+print(json.dumps(dict(elapsed=elapsed, loaded=[m for m in {modules} if m in sys.modules])))
+"""
+
+
+def cold_import():
+    root = os.path.join(os.path.dirname(__file__), "..", "..")
+    with open(os.devnull, "w") as devnull:
+        output = subprocess.check_output(
+            [sys.executable, "-c", IMPORT_SCRIPT.format(modules=repr(HEAVY_MODULES))],
+            cwd=root,
+            stderr=devnull,
+        )
+    return json.loads(output.decode("utf-8").strip().splitlines()[-1])
+
+
+@pytest.mark.unit
+def test_import_dtale():
+    output = cold_import()
+    assert output["loaded"] == [], "heavy modules loaded by import dtale: {}".format(
+        ", ".join(output["loaded"])
+    )
+    assert output["elapsed"] < IMPORT_BUDGET, (
+        "import dtale took {:.2f}s which exceeds the budget of {:.2f}s"
+    ).format(output["elapsed"], IMPORT_BUDGET)
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+from six import BytesIO, StringIO
+
+import dtale.ingestion as ingestion
+
+
+@pytest.mark.unit
+def test_sniff_delimiter(tmpdir):
+    path = tmpdir.join("test.csv")
+    path.write("a|b|c\n1|2|3\n4|5|6\n")
+    assert ingestion.sniff_delimiter(str(path)) == "|"
+
+    buffer = BytesIO(b"a\tb\n1\t2\n")
+    buffer.read(1)
+    assert ingestion.sniff_delimiter(buffer) == "\t"
+    assert buffer.tell() == 1
+    assert ingestion.sniff_delimiter(StringIO("a\n1\n"), default=";") == ";"
+
+
+@pytest.mark.unit
+def test_downcast_numerics():
+    df = pd.DataFrame(
+        dict(
+            a=[1, 2, 300],
+            b=[0.5, np.nan, 1.25],
+            c=[0.1, 0.2, 0.3],
+            d=["x", "y", "z"],
+            e=[True, False, True],
+        )
+    )
+    output = ingestion.downcast_numerics(df)
+    assert output["a"].dtype == np.int16
+    assert output["b"].dtype == np.float32
+    # 0.1 cannot be represented exactly as a float32
+    assert output["c"].dtype == np.float64
+    assert output["d"].dtype == object
+    assert output["e"].dtype == bool
+    pd.testing.assert_frame_equal(output.astype(df.dtypes), df)
+
+    df = pd.DataFrame(dict(a=["x"]))
+    assert ingestion.downcast_numerics(df) is df
+
+
+@pytest.mark.unit
+def test_read_csv():
+    data = "a;b;c\n" + "".join("{};{};x{}\n".format(i, i * 0.5, i) for i in range(25))
+    output = ingestion.read_csv(StringIO(data), sep=None, chunksize=10, downcast=True)
+    assert list(output.columns) == ["a", "b", "c"]
+    assert list(output.index) == list(range(25))
+    assert output["a"].dtype == np.int8
+    assert output["b"].dtype == np.float32
+    assert output["c"].iloc[-1] == "x24"
+
+    output = ingestion.read_csv(StringIO(data), sep=";", index_col="c", chunksize=10)
+    assert output.index[-1] == "x24"
+    assert output["a"].dtype == np.int64
+
+
+@pytest.mark.unit
+def test_read_parquet(tmpdir):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    df = pd.DataFrame(dict(a=range(10), b=list("abcdefghij")))
+    path = str(tmpdir.join("test.parquet"))
+    pq.write_table(pa.Table.from_pandas(df), path, row_group_size=4)
+
+    pd.testing.assert_frame_equal(ingestion.read_parquet(path), df)
+    output = ingestion.read_parquet(path, downcast=True)
+    assert output["a"].dtype == np.int8
+    pd.testing.assert_frame_equal(output.astype(df.dtypes), df)
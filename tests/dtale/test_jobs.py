@@ -0,0 +1,249 @@
+import threading
+import time
+
+import mock
+import pandas as pd
+import pytest
+
+import dtale.jobs as jobs
+from tests.dtale import build_data_inst, build_dtypes, build_settings
+from tests.dtale.test_views import app
+
+
+def wait_for(job, timeout=10):
+    start = time.time()
+    while not job.done:
+        if time.time() - start > timeout:
+            raise AssertionError("job {} never finished".format(job.id))
+        time.sleep(0.01)
+    return job
+
+
+@pytest.mark.unit
+def test_job_manager():
+    manager = jobs.JobManager(workers=1)
+
+    def _work(a, b=1):
+        manager.current_job().update_progress(0.5, "halfway")
+        return a + b
+
+    job = wait_for(manager.get(manager.submit(_work, args=(1,), kwargs=dict(b=2))))
+    assert job.status == jobs.COMPLETE
+    assert job.result == 3
+    assert job.progress == 1.0
+    assert job.message == "halfway"
+
+    def _fail():
+        raise ValueError("bad input")
+
+    job = wait_for(manager.get(manager.submit(_fail)))
+    assert job.status == jobs.ERROR
+    assert job.error == "bad input"
+    assert "ValueError" in job.traceback
+
+    assert manager.get("missing") is None
+    assert not manager.cancel("missing")
+    assert not manager.cancel(job.id)
+    manager.close()
+
+
+@pytest.mark.unit
+def test_job_cancellation():
+    manager = jobs.JobManager(workers=1)
+    started, release = threading.Event(), threading.Event()
+
+    def _block():
+        started.set()
+        release.wait(10)
+        manager.current_job().update_progress(0.5)
+        return "finished"
+
+    running_id = manager.submit(_block)
+    queued_id = manager.submit(lambda: "never run")
+    started.wait(10)
+    assert manager.get(running_id).status == jobs.RUNNING
+    assert manager.get(queued_id).status == jobs.PENDING
+
+    assert manager.cancel(queued_id)
+    assert manager.cancel(running_id)
+    release.set()
+    running, queued = (wait_for(manager.get(id)) for id in [running_id, queued_id])
+    assert running.status == jobs.CANCELLED
+    assert running.result is None
+    assert queued.status == jobs.CANCELLED
+    manager.close()
+
+
+@pytest.mark.unit
+def test_job_ttl():
+    manager = jobs.JobManager(workers=1, ttl=60)
+    job_id = manager.submit(lambda: 1)
+    job = wait_for(manager.get(job_id))
+    assert manager.get(job_id) is not None
+
+    job.finished -= 61
+    assert manager.get(job_id) is None
+    manager.close()
+
+    # update_progress is a no-op when not running within a job
+    jobs.update_progress(0.5)
+
+
+@pytest.mark.unit
+def test_job_result_limits():
+    manager = jobs.JobManager(workers=1, max_results=2)
+    job_ids = [manager.submit(lambda: 1) for _ in range(3)]
+    for job_id in job_ids:
+        wait_for(manager._jobs[job_id])
+    # only the output of the most recently finished jobs is kept
+    assert manager.get(job_ids[0]) is None
+    assert manager.get(job_ids[1]) is not None
+    assert manager.get(job_ids[2]) is not None
+    manager.close()
+
+    manager = jobs.JobManager(workers=1, max_result_bytes=1024 * 1024)
+    big_id = manager.submit(lambda: dict(body=b"x" * 800 * 1024))
+    job = wait_for(manager.get(big_id))
+    assert job.size > 800 * 1024
+    small_id = wait_for(manager.get(manager.submit(lambda: dict(body=b"x")))).id
+    assert manager.get(big_id) is not None
+    new_big_id = manager.submit(lambda: dict(body=b"x" * 800 * 1024))
+    wait_for(manager._jobs[new_big_id])
+    assert manager.get(big_id) is None
+    assert manager.get(small_id) is not None
+    assert manager.get(new_big_id) is not None
+    manager.close()
+
+
+@pytest.mark.unit
+def test_job_pool_created_once():
+    manager = jobs.JobManager(workers=1)
+    barrier = threading.Barrier(8)
+
+    def _slow_pool(workers):
+        time.sleep(
+            0.05
+        )  # widen the window in which another submission could also create a pool
+        return mock.Mock()
+
+    with mock.patch("dtale.jobs.ThreadPool", side_effect=_slow_pool) as thread_pool:
+
+        def _submit():
+            barrier.wait(10)
+            manager.submit(lambda: 1)
+
+        threads = [threading.Thread(target=_submit) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        assert thread_pool.call_count == 1
+    manager.close()
+
+
+@pytest.mark.unit
+def test_async_routes(unittest, test_data):
+    import dtale.views as views
+
+    with app.test_client() as c:
+        test_data, _ = views.format_data(test_data)
+        build_data_inst({c.port: test_data})
+        build_dtypes({c.port: views.build_dtypes_state(test_data)})
+        build_settings({c.port: {}})
+        expected = c.get("/dtale/correlations/{}".format(c.port)).get_json()
+
+        response = c.get(
+            "/dtale/correlations/{}".format(c.port), query_string={"async": True}
+        ).get_json()
+        assert response["success"]
+        job_id = response["job_id"]
+        wait_for(jobs.get_job(job_id))
+
+        status = c.get("/dtale/job-status/{}".format(job_id)).get_json()
+        assert status["job"]["status"] == jobs.COMPLETE
+        assert status["job"]["name"] == "/dtale/correlations/{}".format(c.port)
+        result = c.get("/dtale/job-result/{}".format(job_id)).get_json()
+        unittest.assertEqual(result, expected)
+        assert not c.get("/dtale/cancel-job/{}".format(job_id)).get_json()["success"]
+
+        response = c.get("/dtale/job-status/missing").get_json()
+        assert not response["success"]
+        response = c.get("/dtale/job-result/missing").get_json()
+        assert not response["success"]
+
+        with mock.patch(
+            "dtale.views.build_correlations_matrix",
+            mock.Mock(side_effect=ValueError("bad corr")),
+        ):
+            response = c.get(
+                "/dtale/correlations/{}".format(c.port),
+                query_string={"async": True},
+            ).get_json()
+            job = wait_for(jobs.get_job(response["job_id"]))
+        # the route handles the error itself but the job is still marked as failed
+        assert job.status == jobs.ERROR
+        result = c.get("/dtale/job-result/{}".format(job.id)).get_json()
+        assert not result["success"]
+        assert result["error"] == "bad corr"
+        assert "ValueError" in result["traceback"]
+
+
+@pytest.mark.unit
+def test_async_file_routes(rolling_data):
+    import dtale.views as views
+
+    with app.test_client() as c:
+        df, _ = views.format_data(rolling_data)
+        build_data_inst({c.port: df})
+
+        url = "/dtale/missingno/matrix/{}".format(c.port)
+        params = dict(date_index="date", freq="MS", rows=100, file=True)
+        expected = c.get(url, query_string=params)
+        response = c.get(url, query_string=dict(params, **{"async": True}))
+        job = wait_for(jobs.get_job(response.get_json()["job_id"]))
+        assert job.status == jobs.COMPLETE
+        assert not job.cancellable
+
+        # the output can be loaded more than once
+        for _ in range(2):
+            result = c.get("/dtale/job-result/{}".format(job.id))
+            assert result.status_code == 200
+            assert result.content_type == "image/png"
+            assert result.headers["Content-Disposition"] == (
+                expected.headers["Content-Disposition"]
+            )
+            assert result.data == expected.data
+
+
+@pytest.mark.unit
+def test_async_route_cancellation():
+    import dtale.views as views
+
+    with app.test_client() as c:
+        df, _ = views.format_data(pd.DataFrame(dict(a=[1, 2])))
+        build_data_inst({c.port: df})
+        build_dtypes({c.port: views.build_dtypes_state(df)})
+        build_settings({c.port: {}})
+        started, release = threading.Event(), threading.Event()
+
+        def _describe(*args, **kwargs):
+            started.set()
+            release.wait(10)
+            return dict(success=True, code=[])
+
+        with mock.patch("dtale.views.load_column_description", side_effect=_describe):
+            response = c.get(
+                "/dtale/describe/{}".format(c.port),
+                query_string={"async": True, "col": "a"},
+            ).get_json()
+            started.wait(10)
+            # routes which never report their progress can't be cancelled
+            result = c.get("/dtale/cancel-job/{}".format(response["job_id"]))
+            result = result.get_json()
+            assert not result["success"]
+            assert result["error"] == "Job {} does not support cancellation".format(
+                response["job_id"]
+            )
+            release.set()
+            job = wait_for(jobs.get_job(response["job_id"]))
+        assert job.status == jobs.COMPLETE
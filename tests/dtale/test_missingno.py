@@ -1,3 +1,5 @@
+import mock
+import numpy as np
 import pandas as pd
 import pytest
 import sys
@@ -53,3 +55,68 @@ def test_dendrogram(rolling_data):
 
         resp = c.get("/dtale/missingno/dendrogram/{}".format(c.port))
         assert resp.content_type == "image/png"
+
+
+@pytest.mark.unit
+def test_build_nullity():
+    import dtale.global_state as global_state
+    import dtale.nullity as nullity
+
+    df = pd.DataFrame(
+        dict(a=[1, np.nan, 3] * 5, b=["x", None, None] * 5, c=list(range(15)))
+    )
+    output = nullity.build_nullity(df)
+    assert output["rows"] == 15
+    assert output["columns"] == ["a", "b", "c"]
+    assert output["bits"].shape == (2, 3)
+    np.testing.assert_array_equal(nullity.unpack_nullity(output), df.isnull().values)
+
+    mask = df.isnull().values
+    reduced, positions = nullity.reduce_rows(mask, 5, sampling=nullity.AGGREGATE)
+    np.testing.assert_array_equal(positions, [0, 3, 6, 9, 12])
+    np.testing.assert_array_equal(reduced, [[True, True, False]] * 5)
+    # rows are sampled by default so sparse missing values don't render as solid
+    reduced, positions = nullity.reduce_rows(mask, 5)
+    np.testing.assert_array_equal(positions, [0, 3, 7, 10, 14])
+    np.testing.assert_array_equal(reduced[:, 0], [False, False, True, True, False])
+    assert nullity.reduce_rows(mask, 20)[1] is None
+
+    build_data_inst({"1": df})
+    frame = nullity.build_nullity_frame("1")
+    np.testing.assert_array_equal(frame.isnull().values, mask)
+    assert list(frame.columns) == ["a", "b", "c"]
+    frame = nullity.build_nullity_frame("1", rows=5, date_index="c")
+    assert list(frame.columns) == ["a", "b"]
+    assert list(frame.index) == [0, 3, 7, 10, 14]
+
+    # the bitmap is cached per data_id outside of the chart cache
+    assert global_state.get_nullity_cache("1")[1] is nullity.load_nullity("1")
+    assert global_state.get_chart_cache("1", ("nullity", 1)) is None
+    with mock.patch("dtale.nullity.build_nullity") as build_nullity:
+        nullity.load_nullity("1")
+        build_nullity.assert_not_called()
+    global_state.set_data("1", df)
+    assert global_state.get_nullity_cache("1") is None
+
+
+@pytest.mark.unit
+def test_missingno_cache(rolling_data):
+    import dtale.views as views
+
+    df, _ = views.format_data(rolling_data)
+    with build_app(url=URL).test_client() as c:
+        build_data_inst({c.port: df})
+
+        url = "/dtale/missingno/matrix/{}".format(c.port)
+        params = dict(date_index="date", freq="MS", rows=100)
+        resp = c.get(url, query_string=params)
+        assert resp.content_type == "image/png"
+        with mock.patch("missingno.matrix") as mock_matrix:
+            cached = c.get(url, query_string=params)
+            mock_matrix.assert_not_called()
+            assert cached.data == resp.data
+            c.get(url, query_string=dict(params, sampling="aggregate"))
+            mock_matrix.assert_called_once()
+
+        resp = c.get("/dtale/missingno/pie/{}".format(c.port)).get_json()
+        assert resp["error"] == "pie is not a valid missingno chart!"
@@ -1,5 +1,11 @@
+import threading
+import time
+
+import pandas as pd
 import pytest
 
+import dtale.global_state as global_state
+
 from dtale.app import build_app
 from tests.dtale import build_data_inst
 from tests.dtale.test_views import URL
@@ -72,3 +78,85 @@ def test_network_analysis(network_data, unittest):
                 "triangle_ct": 2,
             },
         )
+
+
+@pytest.mark.unit
+def test_network_columnar(network_data, unittest):
+    import dtale.views as views
+
+    df, _ = views.format_data(network_data)
+    with build_app(url=URL).test_client() as c:
+        build_data_inst({c.port: df})
+        params = {"to": "to", "from": "from", "weight": "weight"}
+        rows = c.get("/dtale/network-data/{}".format(c.port), query_string=params)
+        params["columnar"] = True
+        cols = c.get("/dtale/network-data/{}".format(c.port), query_string=params)
+        rows, cols = rows.json, cols.json
+        unittest.assertEqual(
+            cols["edges"]["to"][:3], [edge["to"] for edge in rows["edges"][:3]]
+        )
+        unittest.assertEqual(
+            cols["edges"]["value"], [edge["value"] for edge in rows["edges"]]
+        )
+        unittest.assertEqual(
+            cols["nodes"]["label"], [node["label"] for node in rows["nodes"]]
+        )
+
+
+@pytest.mark.unit
+def test_load_network(unittest):
+    import dtale.network as network
+
+    df = pd.DataFrame(
+        {"from": [1, 2, 3, 1, None], "to": [2, 3, 4, 4, 5], "w": [1, 2, 3, 4, 5]}
+    )
+    build_data_inst({"1": df})
+    net = network.load_network("1", "to", "from", "w")
+    assert network.load_network("1", "to", "from", "w") is net
+    assert network.load_network("1", "to", "from") is not net
+
+    # the cached size of the network grows to cover its graph once it has been built
+    def cached_size():
+        cache = global_state._default_store._chart_cache
+        return next(size for val, size in cache.values() if val is net)
+
+    size = cached_size()
+    assert net.graph is net.graph
+    assert cached_size() == net.nbytes
+    assert cached_size() == size + 4 * network.GRAPH_NODE_BYTES + 4 * (
+        network.GRAPH_EDGE_BYTES + network.GRAPH_WEIGHT_BYTES
+    )
+
+    # parallel requests only ever build the graph once
+    net = network.Network(df, "to", "from")
+    build_graph = net._build_graph
+    calls = []
+
+    def slow_build():
+        calls.append(1)
+        time.sleep(0.1)
+        return build_graph()
+
+    net._build_graph = slow_build
+    threads = [threading.Thread(target=lambda: net.graph) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+
+    # the edge missing its "from" node is dropped
+    assert len(net.to) == 4
+    degrees, order = net.degrees()
+    unittest.assertEqual(degrees.tolist(), [2, 2, 2, 2, 0])
+    unittest.assertEqual(net.labels[order].tolist(), [2.0, 1.0, 3.0, 4.0])
+    assert net.analysis()["node_ct"] == 4
+    assert net.analysis() is net.analysis()
+    unittest.assertEqual(net.shortest_path("1.0", "3.0"), [1.0, 2.0, 3.0])
+    with pytest.raises(Exception) as error:
+        net.shortest_path("1.0", "9.0")
+    assert "Target 9.0 is not in G" in str(error.value)
+
+    data = net.build_data(df, group="w", columnar=True)
+    unittest.assertEqual(data["nodes"]["id"], [1, 2, 3, 4])
+    unittest.assertEqual(data["nodes"]["group"], ["4", "2", "3", "N/A"])
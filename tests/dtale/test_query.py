@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
+import mock
 import pandas as pd
 import pytest
 from six import PY3
 
+import dtale.column_filters as column_filters
 import dtale.global_state as global_state
 import dtale.query as query
 from dtale.pandas_util import check_pandas_version
@@ -245,3 +247,143 @@ def test_load_filterable_data():
 
         result = query.load_filterable_data(data_id, request)
         assert len(result) == 3
+
+    # every path follows the sort applied from the grid
+    global_state.set_settings(data_id, {"sortInfo": [["b", "DESC"]]})
+    with app.test_request_context("/?filtered=false"):
+        from flask import request
+
+        result = query.load_filterable_data(data_id, request)
+        assert list(result["b"]) == [6, 5, 4]
+
+    with app.test_request_context("/?filtered=true"):
+        from flask import request
+
+        result = query.load_filterable_data(data_id, request)
+        assert list(result["b"]) == [6, 5, 4]
+        result = query.load_filterable_data(data_id, request, query="`a` < 3")
+        assert list(result["b"]) == [5, 4]
+    assert list(global_state.get_data(data_id)["b"]) == [4, 5, 6]
+
+
+@pytest.mark.unit
+def test_load_filtered_positions():
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [4, 5, 6, 7]})
+    data_id = global_state.new_data_inst()
+    global_state.set_data(data_id, df)
+    global_state.set_settings(data_id, {})
+
+    positions, filtered = query.load_filtered_positions(data_id, "`a` > 2")
+    assert list(positions) == [2, 3]
+    assert filtered == []
+
+    # a cached view should be served without re-running the query
+    with mock.patch("dtale.query.run_query") as mock_run_query:
+        positions, _ = query.load_filtered_positions(data_id, "`a` > 2")
+        assert list(positions) == [2, 3]
+        mock_run_query.assert_not_called()
+
+    positions, _ = query.load_filtered_positions(data_id, "`a` > 3")
+    assert list(positions) == [3]
+
+    positions, filtered = query.load_filtered_positions(
+        data_id, "`a` > 3", highlight_filter=True
+    )
+    assert list(positions) == [0, 1, 2, 3]
+    assert filtered == {3}
+
+    # updating the data should invalidate any cached views
+    global_state.set_data(data_id, df[df["a"] < 4])
+    positions, _ = query.load_filtered_positions(data_id, "`a` > 2")
+    assert list(positions) == [2]
+
+    # rows sharing an index label with a row which passes the filter must not be kept
+    df = pd.DataFrame({"a": [1, 2, 1, 2]}, index=[0, 0, 1, 1])
+    global_state.set_data(data_id, df)
+    positions, _ = query.load_filtered_positions(data_id, "`a` == 1")
+    assert list(positions) == [0, 2]
+    positions, _ = query.load_filtered_positions(data_id, "index == 1")
+    assert list(positions) == [2, 3]
+    assert "_dtale_position" not in global_state.get_data(data_id).columns
+
+
+@pytest.mark.unit
+def test_filter_data():
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": ["x", "y", "x", "y"]})
+    data_id = global_state.new_data_inst()
+    global_state.set_data(data_id, df)
+    a_filter = {
+        "query": "`a` > 1",
+        "value": 1,
+        "operand": ">",
+        "meta": {"column": "a", "classification": "I", "type": "int"},
+    }
+    global_state.set_settings(data_id, {"columnFilters": {"a": a_filter}})
+    assert query.filter_data(data_id)["a"].tolist() == [2, 3, 4]
+    assert query.filter_data(data_id, "`a` < 4")["a"].tolist() == [2, 3]
+    _, filtered = query.filter_data(data_id, "`a` < 4", highlight_filter=True)
+    assert filtered == {1, 2}
+    with pytest.raises(Exception) as error:
+        query.filter_data(data_id, "`a` > 4", highlight_filter=True)
+    assert "found no data" in str(error.value)
+
+    b_filter = {
+        "query": "`b` == 'x'",
+        "value": ["x"],
+        "operand": "=",
+        "action": "equals",
+        "meta": {"column": "b", "classification": "S", "type": "string"},
+    }
+    global_state.set_settings(
+        data_id, {"columnFilters": {"a": a_filter, "b": b_filter}}
+    )
+    # only the mask for the new filter should be built
+    with mock.patch(
+        "dtale.column_filters.build_filter_mask",
+        wraps=column_filters.build_filter_mask,
+    ) as build_filter_mask:
+        assert query.filter_data(data_id)["a"].tolist() == [3]
+        assert build_filter_mask.call_count == 1
+
+    with pytest.raises(Exception) as error:
+        query.filter_data(data_id, "`a` > 3")
+    assert "found no data" in str(error.value)
+
+    global_state.set_settings(
+        data_id, {"columnFilters": {"a": a_filter}, "invertFilter": True}
+    )
+    assert query.filter_data(data_id)["a"].tolist() == [1]
+
+
+@pytest.mark.unit
+def test_load_sort_positions():
+    df = pd.DataFrame(
+        {"a": [3, 1, None, 2, 1], "b": ["x", "z", "y", None, "w"]},
+        index=[10, 11, 12, 13, 14],
+    )
+    data_id = global_state.new_data_inst()
+    global_state.set_data(data_id, df)
+    global_state.set_settings(data_id, {})
+
+    sort = [["a", "ASC"], ["b", "DESC"]]
+    positions = query.load_sort_positions(data_id, sort)
+    assert list(positions) == [1, 4, 3, 0, 2]
+    assert list(query.load_sort_positions(data_id, [["a", "DESC"]])) == [0, 3, 1, 4, 2]
+    assert query.load_sort_positions(data_id, None) is None
+
+    # permutations are reused until the data changes
+    with mock.patch("dtale.query.build_sort_positions") as build_sort_positions:
+        assert query.load_sort_positions(data_id, sort) is positions
+        build_sort_positions.assert_not_called()
+
+    positions, _ = query.load_filtered_positions(data_id, "`a` < 3", sort=sort)
+    assert list(positions) == [1, 4, 3]
+    unchanged = global_state.get_data(data_id)
+    assert list(unchanged.index) == [10, 11, 12, 13, 14]
+
+    global_state.set_data(data_id, df.iloc[::-1])
+    assert list(query.load_sort_positions(data_id, sort)) == [3, 0, 1, 4, 2]
+
+    # columns of mixed types still get sorted
+    global_state.set_data(data_id, pd.DataFrame({"a": [1, "b", 0.5]}))
+    assert len(query.load_sort_positions(data_id, [["a", "ASC"]])) == 3
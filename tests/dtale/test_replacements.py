@@ -1,5 +1,6 @@
 import json
 
+import mock
 import numpy as np
 import pandas as pd
 import pytest
@@ -252,3 +253,32 @@ def test_view(unittest):
         unittest.assertEqual(list(data[c.port]["e"].values), ["a", "for test", "b"])
         e_dtype = next((d for d in dtypes if d["name"] == "e"))
         assert not e_dtype["hasMissing"]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("pandas2", [True, False])
+def test_view_arrow_store(unittest, tmpdir, pandas2):
+    pytest.importorskip("pyarrow")
+    from dtale.views import build_dtypes_state
+    import dtale.global_state as global_state
+
+    global_state.use_arrow_store(tmpdir.mkdir("test_view_arrow_store").strpath)
+    df = pd.DataFrame(dict(a=[1, 2, 3]))
+    with app.test_client() as c:
+        global_state.set_data(c.port, df)
+        global_state.set_dtypes(c.port, build_dtypes_state(df))
+        global_state.store._frame_cache().clear()
+        # columns of memory-mapped frames are read-only
+        assert not global_state.get_data(c.port)["a"].values.flags.writeable
+
+        params = dict(
+            type="value",
+            col="a",
+            cfg=json.dumps([dict(value=2, type="raw", replace=5)]),
+        )
+        with mock.patch("dtale.pandas_util.is_pandas2", return_value=pandas2):
+            resp = c.get(
+                "/dtale/build-replacement/{}".format(c.port), query_string=params
+            )
+        assert resp.json["success"]
+        unittest.assertEqual(list(global_state.get_data(c.port)["a"].values), [1, 5, 3])
@@ -0,0 +1,156 @@
+import mock
+import numpy as np
+import pandas as pd
+import pytest
+
+import dtale.global_state as global_state
+from dtale.sketches import (
+    FrequentItems,
+    HyperLogLog,
+    KLLSketch,
+    approx_describe,
+    approx_unique_count,
+    approx_value_counts,
+    use_sketches,
+)
+from tests import ExitStack
+from tests.dtale import build_data_inst, build_dtypes, build_settings
+
+
+@pytest.mark.unit
+def test_hyperloglog():
+    hll = HyperLogLog()
+    assert hll.count() == 0
+    values = pd.Series(np.arange(200000)).astype("str")
+    for start in range(0, len(values), 50000):
+        hll.update(values.iloc[start : start + 50000])
+    hll.update(values.iloc[:1000])  # duplicates don't change the estimate
+    assert abs(hll.count() - 200000) / 200000.0 < 3 * hll.relative_error
+
+    other = HyperLogLog().update(pd.Series(np.arange(200000, 250000)).astype("str"))
+    assert abs(hll.merge(other).count() - 250000) / 250000.0 < 3 * hll.relative_error
+
+    small = HyperLogLog().update(pd.Series(["a", "b", "c", "a"]))
+    assert small.count() == 3
+
+    with pytest.raises(ValueError):
+        HyperLogLog(precision=20)
+
+
+@pytest.mark.unit
+def test_kll_sketch():
+    kll = KLLSketch()
+    assert np.isnan(kll.quantiles([0.5])[0])
+
+    kll.update([1.0, 2.0, 3.0, 4.0, np.nan])
+    np.testing.assert_almost_equal(
+        kll.quantiles([0, 0.25, 0.5, 0.75, 1]), [1.0, 1.75, 2.5, 3.25, 4.0]
+    )
+
+    values = np.random.RandomState(0).standard_normal(500000)
+    kll = KLLSketch()
+    for start in range(0, len(values), 100000):
+        kll.update(values[start : start + 100000])
+    assert sum(len(level) for level in kll.levels) < 5 * kll.k
+    sorted_values = np.sort(values)
+    for q, estimate in zip([0.25, 0.5, 0.75], kll.quantiles([0.25, 0.5, 0.75])):
+        rank = np.searchsorted(sorted_values, estimate) / float(len(values))
+        assert abs(rank - q) < 3 * kll.rank_error
+
+
+@pytest.mark.unit
+def test_frequent_items():
+    values = pd.Series(list("aaaaabbbbcccdde") * 3 + list("xyz"))
+    frequent = FrequentItems(capacity=3)
+    for start in range(0, len(values), 7):
+        frequent.update(values.iloc[start : start + 7])
+    assert len(frequent.counts) <= 3
+    assert frequent.max_error <= len(values) / 4.0
+    exact = values.value_counts()
+    for value, count in frequent.top().items():
+        assert exact[value] - frequent.max_error <= count <= exact[value]
+    assert frequent.top(1).index[0] == "a"
+
+    counts, max_error = approx_value_counts(pd.Series(pd.Categorical(list("aabbbc"))))
+    assert counts.to_dict() == {"b": 3, "a": 2, "c": 1}
+    assert max_error == 0
+
+
+@pytest.mark.unit
+def test_approx_describe():
+    s = pd.Series([1.0, 2.0, 3.0, 4.0, np.nan], name="a")
+    desc = approx_describe(s)
+    pd.testing.assert_series_equal(desc, s.describe())
+
+    s = pd.Series(["a", "a", "b", None], name="b")
+    desc = approx_describe(s)
+    assert desc.to_dict() == dict(count=3, unique=2, top="a", freq=2)
+    assert approx_unique_count(s)[0] == 2
+
+
+@pytest.mark.unit
+def test_use_sketches():
+    s = pd.Series(np.arange(10))
+    with ExitStack() as stack:
+        stack.enter_context(mock.patch("dtale.sketches.SKETCH_MIN_ROWS", 10))
+        stack.enter_context(
+            mock.patch("dtale.global_state.APP_SETTINGS", dict(sketch_stats=False))
+        )
+        assert not use_sketches(s)
+        global_state.set_app_settings(dict(sketch_stats=True))
+        assert use_sketches(s)
+        assert not use_sketches(s.iloc[:5])
+
+
+@pytest.mark.unit
+def test_sketched_stats(unittest):
+    from dtale.views import build_dtypes_state, format_data
+    from tests.dtale.test_views import app
+
+    rng = np.random.RandomState(0)
+    df = pd.DataFrame(
+        dict(a=rng.standard_normal(1000), b=rng.randint(0, 50, 1000).astype("str"))
+    )
+    df, _ = format_data(df)
+    with ExitStack() as stack:
+        stack.enter_context(mock.patch("dtale.sketches.SKETCH_MIN_ROWS", 100))
+        stack.enter_context(mock.patch("dtale.sketches.SKETCH_CHUNK_SIZE", 300))
+        stack.enter_context(
+            mock.patch("dtale.global_state.APP_SETTINGS", dict(sketch_stats=True))
+        )
+        with app.test_client() as c:
+            build_data_inst({c.port: df})
+            build_settings({c.port: {}})
+            dtypes = build_dtypes_state(df, data_id=c.port)
+            build_dtypes({c.port: dtypes})
+            a_info = next(d for d in dtypes if d["name"] == "a")
+            assert (
+                abs(a_info["unique_ct"] - 1000)
+                <= 3 * a_info["approx"]["unique_ct"] * 1000
+            )
+            assert sorted(a_info["approx"]) == ["outlierRange", "unique_ct"]
+            o_s, o_e = (a_info["outlierRange"][k] for k in ["lower", "upper"])
+            q1, q3 = df["a"].quantile(0.25), df["a"].quantile(0.75)
+            np.testing.assert_almost_equal(
+                [o_s, o_e], [q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)], 1
+            )
+            b_info = next(d for d in dtypes if d["name"] == "b")
+            unittest.assertEqual(b_info["unique_ct"], 50)
+
+            response = c.get(
+                "/dtale/describe/{}".format(c.port), query_string=dict(col="b")
+            )
+            response_data = response.get_json()
+            assert response_data["success"]
+            unittest.assertEqual(response_data["describe"]["unique"], "50")
+            assert sorted(response_data["approx"]) == [
+                "counts",
+                "quantiles",
+                "unique_ct",
+            ]
+            expected_top = df["b"].value_counts().values[0]
+            assert (
+                expected_top - response_data["approx"]["counts"]
+                <= response_data["describe"]["freq"]
+                <= expected_top
+            )
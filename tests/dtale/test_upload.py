@@ -288,6 +288,58 @@ def test_upload_separator_types(unittest, dtale_app):
         assert "error" in resp.get_json()
 
 
+@pytest.mark.unit
+def test_upload_sniffed_separator(dtale_app):
+    import dtale.views as views
+    import dtale.global_state as global_state
+
+    df, _ = views.format_data(pd.DataFrame([1, 2, 3]))
+    with dtale_app.test_client() as c:
+        global_state.clear_store()
+        build_data_inst({c.port: df})
+        global_state.set_dtypes(c.port, views.build_dtypes_state(df))
+        pipe_data = BytesIO(str.encode("a|b|c\n1|2.5|x\n4|5.5|y\n"))
+        c.post(
+            "/dtale/upload",
+            data={"tests_df.csv": (pipe_data, "test_df.csv"), "downcast": "true"},
+        )
+        assert global_state.size() == 2
+        new_key = next((k for k in global_state.keys() if k != str(c.port)), None)
+        new_data = global_state.get_data(new_key)
+        assert list(new_data.columns) == ["a", "b", "c"]
+        assert new_data["a"].dtype == "int8"
+        assert new_data["b"].dtype == "float32"
+        assert "sep='|'" in global_state.get_settings(new_key)["startup_code"]
+
+
+@pytest.mark.unit
+def test_upload_custom_separator(dtale_app):
+    import dtale.views as views
+    import dtale.global_state as global_state
+
+    df, _ = views.format_data(pd.DataFrame([1, 2, 3]))
+    with dtale_app.test_client() as c:
+        global_state.clear_store()
+        build_data_inst({c.port: df})
+        global_state.set_dtypes(c.port, views.build_dtypes_state(df))
+        custom_data = BytesIO(str.encode("a::b::c\n1::2.5::x\n4::5.5::y\n"))
+        resp = c.post(
+            "/dtale/upload",
+            data={
+                "tests_df.csv": (custom_data, "test_df.csv"),
+                "separatorType": "custom",
+                "separator": "::",
+            },
+        )
+        assert "error" not in resp.get_json()
+        assert global_state.size() == 2
+        new_key = next((k for k in global_state.keys() if k != str(c.port)), None)
+        new_data = global_state.get_data(new_key)
+        assert list(new_data.columns) == ["a", "b", "c"]
+        assert new_data["b"].tolist() == [2.5, 5.5]
+        assert "sep='::'" in global_state.get_settings(new_key)["startup_code"]
+
+
 @pytest.mark.unit
 def test_covid_dataset(dtale_app):
     import dtale.global_state as global_state
@@ -4,7 +4,7 @@ import mock
 import numpy as np
 import pandas as pd
 import pytest
-from six import PY3
+from six import BytesIO, PY3
 
 from dtale.pandas_util import is_pandas3
 import dtale.utils as utils
@@ -137,6 +137,80 @@ def test_formatters(unittest):
     )
 
 
+@pytest.mark.unit
+def test_format_dicts_dataframe(unittest):
+    df = pd.DataFrame(
+        {
+            "int": [1, 2, 3, 2**62],
+            "float": [1.123456789, np.nan, np.inf, -2500.5],
+            "date": [
+                pd.Timestamp("20200101"),
+                pd.Timestamp("20200101 10:00:00"),
+                pd.Timestamp("20200102 10:00:00.5"),
+                pd.NaT,
+            ],
+            "tz_date": pd.date_range("20200101", periods=4, tz="US/Eastern"),
+            "bool": [True, False, True, False],
+            "str": ["a", "", None, 3],
+            "nullable_int": pd.array([1, None, 3, 4], dtype="Int64"),
+        }
+    )
+    col_types = utils.grid_columns(df)
+    for nan_display, as_string in [("nan", False), ("", True)]:
+        f = utils.grid_formatter(
+            col_types, nan_display=nan_display, as_string=as_string
+        )
+        f.add_int(2, "float_as_int")
+        f.add_float(1, "int_as_float")
+        unittest.assertEqual(f.format_dicts(df), f.format_dicts(df.itertuples()))
+
+    f = utils.grid_formatter(col_types, nan_display="nan")
+    unittest.assertEqual(
+        f.format_dicts(df.head(2))[0],
+        {
+            "int": 1,
+            "float": 1.123457,
+            "date": "2020-01-01",
+            "tz_date": "2020-01-01",
+            "bool": "True",
+            "str": "a",
+            "nullable_int": 1,
+        },
+    )
+    unittest.assertEqual(
+        f.format_dicts(df.iloc[1:3]),
+        f.format_dicts(df.iloc[1:3].itertuples()),
+    )
+    assert [r["float"] for r in f.format_dicts(df.iloc[1:3])] == ["nan", "inf"]
+    assert utils.JSONFormatter().format_dicts(df) == [{}, {}, {}, {}]
+
+
+@pytest.mark.unit
+def test_format_float_values():
+    # values whose scaled representation lands on the other side of halfway under numpy's rounding
+    s = pd.Series([-591.755, -237.695, 1.005, np.nan])
+    for precision in [2, 6]:
+        assert utils.format_float_values(s, precision=precision)[:3] == [
+            utils.json_float(v, precision=precision) for v in s.tolist()[:3]
+        ]
+    assert utils.format_float_values(s)[:2] == [-591.75, -237.69]
+    s = pd.Series([-206.4650515, -921.8904335])
+    assert utils.format_float_values(s, precision=6) == [-206.465051, -921.890433]
+
+
+@pytest.mark.unit
+def test_format_string_values():
+    s = pd.Series(["a", None, "", np.nan, "b"], dtype=object)
+    assert utils.format_string_values(s, nan_display="nan") == [
+        utils.json_string(v, nan_display="nan") for v in s.tolist()
+    ]
+    assert utils.format_string_values(
+        pd.Series([None, np.nan], dtype=object), nan_display="nan"
+    ) == ["nan", "nan"]
+    # mixed types are left to json_string
+    assert utils.format_string_values(pd.Series(["a", 1, []], dtype=object)) is None
+
+
 @pytest.mark.unit
 def test_format_grid(unittest):
     output = utils.format_grid(
@@ -329,3 +403,90 @@ def test_format_data_inplace():
     df = df.reset_index()
     result, index = utils.format_data(df, inplace=True)
     assert "index" not in result.columns
+
+
+@pytest.mark.unit
+def test_export_streams():
+    df = pd.DataFrame(dict(a=range(25), b=[None] * 10 + list("abcdefghijklmno")))
+    positions = np.arange(25)[::-1]
+
+    chunks = list(utils.export_to_csv_stream(df, chunk_size=10))
+    assert len(chunks) == 3
+    assert "".join(chunks) == df.to_csv(index=False)
+    output = "".join(
+        utils.export_to_csv_stream(
+            df, tsv=True, positions=positions, columns=["b"], chunk_size=10
+        )
+    )
+    assert output == df.iloc[positions][["b"]].to_csv(index=False, sep="\t")
+    assert list(utils.export_to_csv_stream(df.iloc[:0])) == ["a,b\n"]
+
+    pq = pytest.importorskip("pyarrow.parquet")
+    output = b"".join(
+        utils.export_to_parquet_stream(df, positions=positions, chunk_size=10)
+    )
+    assert pq.ParquetFile(BytesIO(output)).num_row_groups == 3
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(BytesIO(output)), df.iloc[positions].reset_index(drop=True)
+    )
+    # the first chunk of "b" is entirely null so its type comes from the rest of the column
+    output = b"".join(utils.export_to_parquet_stream(df, chunk_size=10))
+    pd.testing.assert_frame_equal(pd.read_parquet(BytesIO(output)), df)
+
+    # object columns are validated in full before anything is streamed
+    mixed = pd.DataFrame(dict(a=pd.Series(list(range(20)) + ["x"], dtype="object")))
+    with pytest.raises(ValueError) as error:
+        utils.export_to_parquet_stream(mixed, chunk_size=10)
+    assert "Column 'a' cannot be exported to parquet" in str(error.value)
+
+
+@pytest.mark.unit
+def test_factorize_rows():
+    codes, first = utils.factorize_rows(pd.Series(["a", None, "b", "a", np.nan]))
+    assert list(codes) == [0, 2, 1, 0, 2]
+    assert list(first) == [0, 2, 1]
+
+    df = pd.DataFrame(dict(a=[1, 1, 2, 1], b=["x", "y", "x", "x"]))
+    codes, first = utils.factorize_rows(df)
+    assert list(codes) == [0, 1, 2, 0]
+    assert list(first) == [0, 1, 2]
+
+
+@pytest.mark.unit
+def test_apply_unique():
+    calls = []
+
+    def func(v):
+        calls.append(v)
+        return v * 2
+
+    s = pd.Series(["a", "b", "a", "a"], index=[3, 2, 1, 0], name="s")
+    output = utils.apply_unique(s, func)
+    assert calls == ["a", "b"]
+    pd.testing.assert_series_equal(output, utils.apply(s, func))
+
+    df = pd.DataFrame(dict(a=["x", "x", "y"], b=["z", "z", "z"]))
+    output = utils.apply_unique(df, lambda a, b: a + b)
+    assert output.tolist() == ["xz", "xz", "yz"]
+    assert list(output.index) == list(df.index)
+
+    assert utils.apply_unique(pd.Series([], dtype="object"), func).empty
+
+
+@pytest.mark.unit
+def test_transform_unique():
+    transform = mock.Mock(side_effect=lambda s: s.str.upper())
+    s = pd.Series(["a", "b", None, "a"], name="s")
+    output = utils.transform_unique(s, transform)
+    assert len(transform.call_args[0][0]) == 3
+    pd.testing.assert_series_equal(output, s.str.upper())
+
+    s = pd.Series(pd.Categorical(["a", "b", "a"]))
+    pd.testing.assert_series_equal(
+        utils.transform_unique(s, lambda v: v.astype("str")), s.astype("str")
+    )
+
+    # unhashable values are transformed as is
+    s = pd.Series([[1], [2], [1]])
+    output = utils.transform_unique(s, lambda v: v.str.len())
+    assert output.tolist() == [1, 1, 1]
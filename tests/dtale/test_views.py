@@ -10,7 +10,7 @@ import pandas as pd
 import platform
 import pytest
 from pandas.tseries.offsets import Day
-from six import PY3
+from six import BytesIO, PY3
 
 import dtale.pandas_util as pandas_util
 
@@ -1361,6 +1361,42 @@ def test_dtypes(test_data):
             assert response_data["describe"]["max"] == "2"
 
 
+@pytest.mark.unit
+def test_build_dtypes_state_cache(unittest):
+    from dtale.views import build_dtypes_state
+
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    build_data_inst({"1": df})
+    dtypes = build_dtypes_state(df, data_id="1")
+    assert global_state.get_column_stats("1", "a")["unique_ct"] == 3
+
+    with mock.patch("dtale.views.unique_count") as mock_unique_count:
+        unittest.assertEqual(build_dtypes_state(df, data_id="1"), dtypes)
+        mock_unique_count.assert_not_called()
+
+    df.loc[:, "a"] = [1, 1, 1]
+    global_state.set_data("1", df, changed_columns=["a"])
+    with mock.patch(
+        "dtale.views.unique_count", side_effect=lambda s: 1
+    ) as mock_unique_count:
+        updated_dtypes = build_dtypes_state(df, data_id="1")
+        assert mock_unique_count.call_count == 1
+        assert updated_dtypes[0]["unique_ct"] == 1
+        unittest.assertEqual(updated_dtypes[1], dtypes[1])
+
+
+@pytest.mark.unit
+def test_build_dtypes_state_workers(unittest):
+    from dtale.views import build_dtypes_state
+
+    df = pd.DataFrame(
+        {"a": [1, 2, 3], "b": ["x", "y", "z"], "c": [1.5, np.nan, 2.5], "d": [1, 1, 2]}
+    )
+    unittest.assertEqual(
+        build_dtypes_state(df, workers=3), build_dtypes_state(df, workers=None)
+    )
+
+
 @pytest.mark.unit
 def test_describe_string_metrics():
     from dtale.views import build_dtypes_state, format_data
@@ -2011,10 +2047,15 @@ def test_export_parquet(test_data):
         build_data_inst({c.port: test_data})
         build_dtypes({c.port: views.build_dtypes_state(test_data)})
 
-        response = c.get(
-            "/dtale/data-export/{}".format(c.port), query_string=dict(type="parquet")
-        )
+        with mock.patch("dtale.utils.EXPORT_CHUNK_SIZE", 10):
+            response = c.get(
+                "/dtale/data-export/{}".format(c.port),
+                query_string=dict(type="parquet"),
+            )
         assert response.content_type == "application/octet-stream"
+        output = pd.read_parquet(BytesIO(response.data))
+        assert len(output) == len(test_data)
+        assert list(output.columns) == list(test_data.columns)
 
 
 def build_ts_data(size=5, days=5):
@@ -2170,6 +2211,30 @@ def test_get_chart_data(unittest, rolling_data):
             "Dataset exceeds 15000 records, cannot render. Please apply filter...",
         )
 
+        params = dict(params, chartType="scatter")
+        response = c.get("/dtale/chart-data/{}".format(c.port), query_string=params)
+        response_data = response.get_json()
+        # dense scatters are decimated to the min & max of each pixel
+        assert response_data["success"]
+        assert len(response_data["data"]["all"]["b"]) == 2000
+        assert response_data["min"]["b"] == 0
+        assert response_data["max"]["b"] == 15499
+
+        params = dict(x="a", y=json.dumps(["b"]), width=100, chartType="line")
+        response = c.get("/dtale/chart-data/{}".format(c.port), query_string=params)
+        response_data = response.get_json()
+        assert len(response_data["data"]["all"]["b"]) == 100
+        assert response_data["data"]["all"]["x"][-1] == 15499
+
+        # bar charts are never downsampled so they're still subject to the record limit
+        params = dict(params, chartType="bar")
+        response = c.get("/dtale/chart-data/{}".format(c.port), query_string=params)
+        response_data = response.get_json()
+        unittest.assertEqual(
+            response_data["error"],
+            "Dataset exceeds 15000 records, cannot render. Please apply filter...",
+        )
+
 
 @pytest.mark.unit
 def test_code_export():
@@ -2330,8 +2395,6 @@ def test_matplotlib_decorator_exception():
 @pytest.mark.unit
 def test_export_parquet_mocked():
     """Test parquet export endpoint (covers lines 3164-3172)."""
-    from io import BytesIO
-
     from dtale.views import build_dtypes_state, format_data
 
     df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
@@ -2340,14 +2403,38 @@ def test_export_parquet_mocked():
         build_data_inst({c.port: df})
         build_dtypes({c.port: build_dtypes_state(df)})
         build_settings({c.port: {}})
-        fake_buf = BytesIO(b"fake_parquet_data")
-        with mock.patch("dtale.utils.export_to_parquet_buffer", return_value=fake_buf):
+        fake_stream = iter([b"fake_", b"parquet_data"])
+        with mock.patch(
+            "dtale.utils.export_to_parquet_stream", return_value=fake_stream
+        ):
             response = c.get(
                 "/dtale/data-export/{}".format(c.port),
                 query_string=dict(type="parquet"),
             )
             assert response.status_code == 200
             assert response.content_type == "application/octet-stream"
+            assert response.data == b"fake_parquet_data"
+
+
+@pytest.mark.unit
+def test_export_parquet_invalid_schema():
+    pytest.importorskip("pyarrow")
+    from dtale.views import build_dtypes_state, format_data
+
+    df = pd.DataFrame({"a": pd.Series(list(range(20)) + ["x"], dtype="object")})
+    df, _ = format_data(df)
+    with app.test_client() as c:
+        build_data_inst({c.port: df})
+        build_dtypes({c.port: build_dtypes_state(df)})
+        build_settings({c.port: {}})
+        with mock.patch("dtale.utils.EXPORT_CHUNK_SIZE", 10):
+            response = c.get(
+                "/dtale/data-export/{}".format(c.port),
+                query_string=dict(type="parquet"),
+            )
+        # the error is returned before anything is streamed
+        assert response.content_type == "application/json"
+        assert "cannot be exported to parquet" in response.get_json()["error"]
 
 
 @pytest.mark.unit
@@ -2519,6 +2606,30 @@ def test_correlations_pps():
         assert "data" in result
 
 
+@pytest.mark.skipif(not PY3, reason="ppscore requires python 3")
+@pytest.mark.unit
+def test_ppscore_matrix_workers():
+    from dtale.views import get_ppscore_matrix
+
+    df = pd.DataFrame({str(i): [1, 2, 3, 4, 5] for i in range(10)})
+    with ExitStack() as stack:
+        iter_matrix = stack.enter_context(
+            mock.patch("dtale.ppscore.iter_matrix", return_value=iter([]))
+        )
+        stack.enter_context(mock.patch("multiprocessing.cpu_count", return_value=2))
+        stack.enter_context(mock.patch("dtale.global_state.APP_SETTINGS", {}))
+        # process pools are opt-in
+        get_ppscore_matrix(df)
+        assert iter_matrix.call_args[1]["workers"] is None
+
+        global_state.set_app_settings(dict(pps_workers=64))
+        get_ppscore_matrix(df)
+        assert iter_matrix.call_args[1]["workers"] == 2
+
+        get_ppscore_matrix(df[["0", "1"]])
+        assert iter_matrix.call_args[1]["workers"] is None
+
+
 @pytest.mark.unit
 def test_version_info():
     with app.test_client() as c:
@@ -3876,6 +3987,7 @@ def test_aggregations(unittest):
 def test_instance_data(unittest):
     import dtale.views as views
     import dtale
+    import dtale.global_state as global_state
 
     df, _ = views.format_data(pd.DataFrame(dict(a=[1, 2, 3], b=[4, 5, 6])))
     with build_app(url=URL).test_client() as c:
@@ -3887,7 +3999,11 @@ def test_instance_data(unittest):
         c.get("/dtale/data/{}".format(c.port), query_string=params)
 
         i = dtale.get_instance(c.port)
+        token = global_state.get_data_token(c.port)
         assert i.data["b"].values[0] == 6
+        # reading the sorted data never writes it back to the store
+        assert global_state.get_data_token(c.port) == token
+        assert global_state.get_data(c.port)["b"].values[0] == 4
 
         c.get(
             "/dtale/save-column-filter/{}".format(c.port),
@@ -4198,6 +4314,19 @@ def test_edit_cell():
         result = resp.get_json()
         assert result["success"]
 
+        # Edit a read-only column (EX: memory-mapped by the arrow store)
+        data = global_state.get_data(c.port)
+        data["a"] = pd.Series(np.array([1, 2, 3]), index=data.index)
+        data["a"].values.flags.writeable = False
+        build_data_inst({c.port: data})
+        resp = c.get(
+            "/dtale/edit-cell/{}".format(c.port),
+            query_string=dict(col="a", rowIndex=2, updated="30"),
+        )
+        result = resp.get_json()
+        assert result["success"]
+        assert global_state.get_data(c.port)["a"].values[2] == 30
+
 
 @pytest.mark.unit
 def test_column_filter_data_integer():